@@ -4,11 +4,15 @@ Tailoring-MS API module. Uses FastAPI.
 
 import os
 import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, Request, Response, Path as FPath
+from fastapi import FastAPI, HTTPException, Request, Response, Path as FPath, status
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tailoring_ms.settings")
 import django
@@ -16,17 +20,37 @@ import django
 django.setup()
 
 from api.v1 import router as v1_router
+from api.db import configure_threadpool
+from api.hashing import password_hasher
+from api.timing import log_slow_request
+from api.metrics import (
+    router as metrics_router,
+    http_requests_in_flight,
+    observe_request,
+)
 from tailoring_ms.settings import (
     STATIC_URL,
     MEDIA_URL,
     STATIC_ROOT,
     MEDIA_ROOT,
     FRONTEND_DIR,
+    UPLOAD_MAX_SIZE,
+    SERVER_TIMING,
+    SLOW_REQUEST_THRESHOLD,
 )
+from tailoring_ms.timing import RequestTimings, current_timings
 
 api_module_path = Path(__file__).parent
 api_prefix = "/api"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    configure_threadpool()
+    yield
+    password_hasher.shutdown()
+
+
 app = FastAPI(
     title="Tailoring-Management-System API",
     version=api_module_path.joinpath("VERSION").read_text().strip(),
@@ -38,15 +62,76 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
 
 
+# Room for the non-file form fields of an upload
+max_api_request_size = UPLOAD_MAX_SIZE + 64 * 1024
+
+
+class LimitRequestSize:
+    """Refuses API bodies over `max_size` bytes.
+
+    Declared lengths are checked before anything is read; chunked bodies,
+    which carry no Content-Length, are counted as they arrive and cut off
+    once the limit is crossed.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith(api_prefix):
+            return await self.app(scope, receive, send)
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_size:
+            response = JSONResponse(
+                content={"detail": "Request body is too large."},
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+            return await response(scope, receive, send)
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    # Re-raised by FastAPI while parsing the body
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Request body is too large.",
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+# Added before the function middlewares so it runs innermost; their task
+# groups would wrap the HTTPException raised from `receive`
+app.add_middleware(LimitRequestSize, max_size=max_api_request_size)
+
+
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response: Response = await call_next(request)
-    process_time = time.time() - start_time
+    start_time = time.perf_counter()
+    timings = RequestTimings()
+    current_timings.set(timings)
+    http_requests_in_flight.inc()
+    try:
+        response: Response = await call_next(request)
+    finally:
+        http_requests_in_flight.dec()
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
+    if SERVER_TIMING:
+        response.headers["Server-Timing"] = timings.header(process_time)
+    if SLOW_REQUEST_THRESHOLD and process_time >= SLOW_REQUEST_THRESHOLD:
+        log_slow_request(request, response, process_time, timings)
+    observe_request(request, response, process_time)
     return response
 
 
@@ -56,6 +141,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "DELETE"],
     allow_headers=["*"],
+    # Read by clients for conditional requests
+    expose_headers=["ETag", "Last-Modified"],
 )
 
 # Mount static & media files
@@ -68,16 +155,20 @@ from fastapi.middleware.wsgi import WSGIMiddleware
 
 # Include API router
 app.include_router(v1_router, prefix=api_prefix)
+app.include_router(metrics_router, prefix=api_prefix)
 
 app.mount("/d", app=WSGIMiddleware(WSGIHandler()), name="django")
 
 if FRONTEND_DIR:
+    from api.frontend import SPAShell, FrontendStaticFiles
+
+    spa_shell = SPAShell(FRONTEND_DIR / "index.html")
 
+    @app.get("/", include_in_schema=False)
     @app.get("/{path}", name="React request hits here", include_in_schema=False)
-    def serve_react_app(path: str):
-        file_path = FRONTEND_DIR / "index.html"
-        if file_path.exists():
-            return Response(content=file_path.read_text(), media_type="text/html")
-        return Response(content="index.html not found", status_code=404)
+    async def serve_react_app(request: Request):
+        return spa_shell.respond(request)
 
-    app.mount("/", StaticFiles(directory=FRONTEND_DIR, html=True), name="frontend")
+    app.mount(
+        "/", FrontendStaticFiles(directory=FRONTEND_DIR, html=True), name="frontend"
+    )
@@ -0,0 +1,78 @@
+"""Conditional requests on per-user API resources.
+
+Validators are derived from the resources' update timestamps where they have
+one, so that a client's copy can be confirmed current from the timestamp
+alone. Unchanged resources are answered with 304 Not Modified and writes based
+on stale copies are refused with 412 Precondition Failed.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import NamedTuple
+
+from fastapi import HTTPException, Request, Response, status
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode())
+    return quote_etag(digest.hexdigest())
+
+
+def strip_weak(etag: str) -> str:
+    return etag.removeprefix("W/")
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: datetime | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        # Per-user resources, revalidated on every use
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = http_date(self.last_modified.timestamp())
+        return headers
+
+
+def is_conditional(request: Request) -> bool:
+    return any(
+        name in request.headers for name in ("if-none-match", "if-modified-since")
+    )
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """Whether the client's copy is current. If-None-Match takes precedence over
+    If-Modified-Since, as in RFC 9110."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = parse_etags(if_none_match)
+        return "*" in etags or strip_weak(validators.etag) in map(strip_weak, etags)
+    if validators.last_modified is not None:
+        since = parse_http_date_safe(request.headers.get("if-modified-since", ""))
+        # HTTP dates have a resolution of one second
+        return since is not None and int(validators.last_modified.timestamp()) <= since
+    return False
+
+
+def not_modified(validators: Validators) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers
+    )
+
+
+def check_if_match(request: Request, validators: Validators):
+    """Refuses the request when If-Match names none of the resource's current
+    ETags. Requests without If-Match are let through."""
+    if_match = request.headers.get("if-match")
+    if if_match is None:
+        return
+    etags = parse_etags(if_match)
+    # Strong comparison, weak tags never match
+    if "*" not in etags and validators.etag not in etags:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource was modified since it was fetched. Fetch it again.",
+            headers=validators.headers,
+        )
@@ -0,0 +1,69 @@
+"""Database connection handling for the API process.
+
+Django only recycles connections when its own request cycle finishes, which
+never happens for FastAPI routes. Endpoints and ORM helpers here mimic that
+cycle on the worker thread that owns the connection, so persistent
+connections are reused, health checked and dropped once obsolete.
+"""
+
+import functools
+import inspect
+from typing import Callable
+
+import anyio.to_thread
+from django.conf import settings
+from django.db import close_old_connections
+from fastapi.routing import APIRoute
+
+
+def release_connections(func: Callable) -> Callable:
+    """Recycles the calling thread's DB connections around `func`"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    wrapper.releases_connections = True
+    return wrapper
+
+
+async def run_in_db_thread(func: Callable, *args):
+    """Runs ORM code in the shared worker threadpool.
+
+    Preferred over Django's async queryset API, whose calls all funnel into
+    one thread-sensitive executor thread when served outside Django's own
+    ASGI handler.
+    """
+    return await anyio.to_thread.run_sync(release_connections(func), *args)
+
+
+class DBRoute(APIRoute):
+    """Recycles DB connections around sync endpoints.
+
+    Endpoints of routers included in another are routed again with the
+    endpoint already wrapped, which is then used as is.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        if not (
+            inspect.iscoroutinefunction(endpoint)
+            or getattr(endpoint, "releases_connections", False)
+        ):
+            endpoint = release_connections(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def configure_threadpool():
+    """Sizes the worker threadpool shared by sync endpoints and ORM calls.
+
+    With `DATABASE_POOL_SIZE` set, threads are capped to it as each one holds
+    at most one DB connection. Has to be called from within the event loop.
+    """
+    size = settings.API_THREADPOOL_SIZE
+    if settings.DATABASE_POOL_SIZE:
+        size = min(size, settings.DATABASE_POOL_SIZE)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = size
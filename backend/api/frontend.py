@@ -0,0 +1,121 @@
+"""Serving of the built React frontend
+"""
+
+import gzip
+import hashlib
+import stat
+import time
+from mimetypes import guess_type
+from pathlib import Path
+from threading import Lock
+
+import anyio.to_thread
+from fastapi import Request, Response, status
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.types import Scope
+
+precompressed_encodings = (
+    # (content-encoding, file suffix)
+    ("br", ".br"),
+    ("gzip", ".gz"),
+)
+
+hashed_assets_dir = "assets/"
+
+immutable_cache_control = "public, max-age=31536000, immutable"
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    for value in accept_encoding.split(","):
+        name, _, params = value.strip().partition(";")
+        if name.strip() == encoding and params.replace(" ", "") != "q=0":
+            return True
+    return False
+
+
+class SPAShell:
+    """Keeps `index.html` in memory, re-reading it only after it changes on disk"""
+
+    def __init__(self, path: Path, check_interval: float = 1):
+        self.path = path
+        self.check_interval = check_interval
+        self._mtime = None
+        self._checked_at = 0
+        self._content: bytes = None
+        self._gzipped: bytes = None
+        self._etag: str = None
+        self._lock = Lock()
+
+    def load(self) -> bool:
+        """Refreshes the cached shell if the file changed. Returns availability."""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self._content is not None
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = self.path.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._content = self._mtime = None
+                return False
+            if mtime != self._mtime:
+                self._content = self.path.read_bytes()
+                self._gzipped = gzip.compress(self._content)
+                self._etag = f'"{hashlib.sha1(self._content).hexdigest()}"'
+                self._mtime = mtime
+            return True
+
+    def respond(self, request: Request) -> Response:
+        if not self.load():
+            return Response(
+                content="index.html not found", status_code=status.HTTP_404_NOT_FOUND
+            )
+        headers = {
+            "ETag": self._etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if self._etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if accepts_encoding(request.headers.get("accept-encoding", ""), "gzip"):
+            headers["Content-Encoding"] = "gzip"
+            return Response(self._gzipped, media_type="text/html", headers=headers)
+        return Response(self._content, media_type="text/html", headers=headers)
+
+
+class FrontendStaticFiles(StaticFiles):
+    """Serves build-time `.br`/`.gz` variants when the client accepts them and
+    marks content-hashed assets as immutable"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self.get_precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        if path.startswith(hashed_assets_dir):
+            response.headers["Cache-Control"] = immutable_cache_control
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    async def get_precompressed_response(
+        self, path: str, scope: Scope
+    ) -> Response | None:
+        if scope["method"] not in ("GET", "HEAD") or not Path(path).suffix:
+            return None
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        for encoding, suffix in precompressed_encodings:
+            if not accepts_encoding(accept_encoding, encoding):
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + suffix
+            )
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                response = self.file_response(full_path, stat_result, scope)
+                response.headers["Content-Encoding"] = encoding
+                media_type = guess_type(path)[0] or "application/octet-stream"
+                if media_type.startswith("text/"):
+                    media_type += "; charset=utf-8"
+                response.headers["Content-Type"] = media_type
+                return response
@@ -0,0 +1,94 @@
+"""Password hashing away from the event loop and the shared threadpool.
+
+A PBKDF2 run holds the GIL until it completes, so hashes are computed in a
+small pool of processes. Calls beyond its size wait their turn on the event
+loop without tying up a worker thread.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+import anyio
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+from tailoring_ms import hashing
+from tailoring_ms.timing import record_timing
+
+
+class PasswordHasherPool:
+    def __init__(self, workers: int = 2):
+        self.workers = workers
+        self.hashes = 0
+        self.queue_seconds = 0.0
+        self.hash_seconds = 0.0
+        self._executor: ProcessPoolExecutor = None
+        self._limiter: anyio.CapacityLimiter = None
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        # Has to be created within the event loop
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.workers)
+        return self._limiter
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                # Forking would copy the threads & DB connections of the API
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=hashing.setup_worker,
+            )
+        return self._executor
+
+    async def run(self, func: Callable, *args):
+        queued_at = time.perf_counter()
+        async with self.limiter:
+            started_at = time.perf_counter()
+            result = await asyncio.wrap_future(self.get_executor().submit(func, *args))
+        finished_at = time.perf_counter()
+        self.hashes += 1
+        self.queue_seconds += started_at - queued_at
+        self.hash_seconds += finished_at - started_at
+        record_timing("password", finished_at - queued_at)
+        return result
+
+    def stats(self) -> dict:
+        busy = waiting = 0
+        if self._limiter is not None:
+            statistics = self._limiter.statistics()
+            busy, waiting = statistics.borrowed_tokens, statistics.tasks_waiting
+        return dict(
+            workers=self.workers,
+            busy=busy,
+            waiting=waiting,
+            hashes=self.hashes,
+            queue_seconds=self.queue_seconds,
+            hash_seconds=self.hash_seconds,
+        )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasherPool(workers=settings.PASSWORD_HASHING_WORKERS)
+
+
+async def check_password(password: str, encoded: str) -> bool:
+    return await password_hasher.run(hashing.verify_password, password, encoded)
+
+
+async def make_password(password: str) -> str:
+    return await password_hasher.run(hashing.hash_password, password)
+
+
+def password_needs_update(encoded: str) -> bool:
+    """Whether a verified hash was made with outdated hasher settings"""
+    preferred = get_hasher("default")
+    hasher = identify_hasher(encoded)
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
@@ -0,0 +1,358 @@
+"""Prometheus metrics of the API process.
+
+Request and DB timings are recorded as they happen. Threadpool, email queue
+and cache figures are read when `/api/metrics` is scraped.
+"""
+
+import bisect
+import time
+from threading import Lock
+from typing import Annotated, Iterable
+
+import anyio.to_thread
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import PlainTextResponse
+from starlette.types import Scope
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from users.models import CustomUser
+from external.models import OutgoingEmail
+from api.db import run_in_db_thread
+from tailoring_ms.timing import record_timing
+from api.v1.cache import token_user_cache, landing_page_cache
+from api.hashing import password_hasher
+from api.v1.routes import get_staff_user
+
+exposition_content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+request_duration_buckets = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+query_duration_buckets = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+)
+
+statement_kinds = frozenset(("SELECT", "INSERT", "UPDATE", "DELETE"))
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\""),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def render_metric(
+    name: str,
+    kind: str,
+    documentation: str,
+    samples: Iterable[tuple[str, dict, float]],
+) -> str:
+    """Text exposition of a metric family.
+
+    Args:
+        samples: [(name suffix, labels, value)]
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for suffix, labels, value in samples:
+        lines.append(f"{name}{suffix}{format_labels(labels)} {format_value(value)}")
+    return "\n".join(lines)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = Lock()
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> str:
+        with self._lock:
+            values = list(self._values.items())
+        return render_metric(
+            self.name,
+            self.kind,
+            self.documentation,
+            (
+                ("", dict(zip(self.labelnames, labels)), value)
+                for labels, value in values
+            ),
+        )
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram:
+    def __init__(
+        self, name: str, documentation: str, buckets: tuple, labelnames: tuple = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = labelnames
+        # labels : [per bucket counts..., +Inf count, sum]
+        self._values: dict[tuple, list] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def render(self) -> str:
+        with self._lock:
+            values = [(labels, list(counts)) for labels, counts in self._values.items()]
+        samples = []
+        for labels, counts in values:
+            labels = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                samples.append(
+                    ("_bucket", labels | {"le": format_value(bound)}, cumulative)
+                )
+            samples.append(("_sum", labels, counts[-1]))
+            samples.append(("_count", labels, cumulative))
+        return render_metric(self.name, "histogram", self.documentation, samples)
+
+
+http_requests_total = Counter(
+    "tms_http_requests_total",
+    "HTTP requests handled",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = Histogram(
+    "tms_http_request_duration_seconds",
+    "HTTP request processing time",
+    request_duration_buckets,
+    ("method", "route"),
+)
+http_requests_in_flight = Gauge(
+    "tms_http_requests_in_flight", "HTTP requests being processed"
+)
+db_query_duration_seconds = Histogram(
+    "tms_db_query_duration_seconds",
+    "Database query execution time",
+    query_duration_buckets,
+    ("statement",),
+)
+
+recorded_metrics = (
+    http_requests_total,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    db_query_duration_seconds,
+)
+
+
+def get_route_label(scope: Scope) -> str:
+    """Path template of the matched route, keeping label values bounded"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Mounted apps & unmatched paths
+    return scope.get("root_path") or "/"
+
+
+def observe_request(request: Request, response: Response, duration: float):
+    route = get_route_label(request.scope)
+    http_requests_total.inc(request.method, route, str(response.status_code))
+    http_request_duration_seconds.observe(duration, request.method, route)
+
+
+def get_statement_kind(sql: str) -> str:
+    kind = sql.lstrip()[:6].upper()
+    return kind if kind in statement_kinds else "OTHER"
+
+
+def record_query(execute, sql, params, many, context):
+    start_time = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start_time
+        db_query_duration_seconds.observe(duration, get_statement_kind(sql))
+        record_timing("db", duration)
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs):
+    # Wrappers outlive reconnections of the same thread's connection
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def count_pending_emails() -> dict[str, int]:
+    return {
+        email_status: OutgoingEmail.objects.filter(status=email_status).count()
+        for email_status in (
+            OutgoingEmail.EmailStatus.QUEUED.value,
+            OutgoingEmail.EmailStatus.SENDING.value,
+            OutgoingEmail.EmailStatus.FAILED.value,
+        )
+    }
+
+
+def render_threadpool_metrics() -> list[str]:
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    statistics = limiter.statistics()
+    return [
+        render_metric(
+            "tms_threadpool_threads",
+            "gauge",
+            "Worker threads the threadpool may run",
+            [("", {}, limiter.total_tokens)],
+        ),
+        render_metric(
+            "tms_threadpool_threads_busy",
+            "gauge",
+            "Worker threads running sync endpoints or ORM calls",
+            [("", {}, statistics.borrowed_tokens)],
+        ),
+        render_metric(
+            "tms_threadpool_tasks_waiting",
+            "gauge",
+            "Calls waiting for a free worker thread",
+            [("", {}, statistics.tasks_waiting)],
+        ),
+    ]
+
+
+def render_cache_metrics() -> list[str]:
+    caches = {
+        "token_user": token_user_cache.stats(),
+        "landing_page": landing_page_cache.stats(),
+    }
+    return [
+        render_metric(
+            name,
+            kind,
+            documentation,
+            [("", {"cache": cache}, stats[field]) for cache, stats in caches.items()],
+        )
+        for name, field, kind, documentation in (
+            ("tms_cache_hits_total", "hits", "counter", "Lookups served from memory"),
+            ("tms_cache_misses_total", "misses", "counter", "Lookups that missed"),
+            ("tms_cache_hit_ratio", "hit_ratio", "gauge", "Share of lookups hit"),
+        )
+    ]
+
+
+def render_password_hashing_metrics() -> list[str]:
+    stats = password_hasher.stats()
+    return [
+        render_metric(name, kind, documentation, [("", {}, stats[field])])
+        for name, field, kind, documentation in (
+            (
+                "tms_password_hash_workers",
+                "workers",
+                "gauge",
+                "Processes computing password hashes",
+            ),
+            (
+                "tms_password_hash_workers_busy",
+                "busy",
+                "gauge",
+                "Hashing processes in use",
+            ),
+            (
+                "tms_password_hash_waiting",
+                "waiting",
+                "gauge",
+                "Password hashes waiting for a process",
+            ),
+            (
+                "tms_password_hashes_total",
+                "hashes",
+                "counter",
+                "Password hashes computed",
+            ),
+            (
+                "tms_password_hash_queue_seconds_total",
+                "queue_seconds",
+                "counter",
+                "Time password hashes spent waiting for a process",
+            ),
+            (
+                "tms_password_hash_seconds_total",
+                "hash_seconds",
+                "counter",
+                "Time spent computing password hashes",
+            ),
+        )
+    ]
+
+
+async def render_metrics() -> str:
+    # Read before this scrape occupies a worker thread
+    families = render_threadpool_metrics()
+    families.extend(metric.render() for metric in recorded_metrics)
+    families.extend(render_cache_metrics())
+    families.extend(render_password_hashing_metrics())
+    pending_emails = await run_in_db_thread(count_pending_emails)
+    families.append(
+        render_metric(
+            "tms_email_queue_messages",
+            "gauge",
+            "Outgoing emails awaiting delivery or given up on",
+            [("", {"status": key}, value) for key, value in pending_emails.items()],
+        )
+    )
+    return "\n".join(families) + "\n"
+
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", name="Prometheus metrics", response_class=PlainTextResponse)
+async def get_metrics(user: Annotated[CustomUser, Depends(get_staff_user)]):
+    return PlainTextResponse(await render_metrics(), media_type=exposition_content_type)
@@ -0,0 +1,133 @@
+"""Token-bucket rate limiting of API endpoints.
+
+Buckets follow the generic cell rate algorithm: each key holds the time its
+bucket would be full again, so a single number per client is stored.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from threading import Lock
+
+import anyio.to_thread
+from fastapi import HTTPException, Request, status
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+periods = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """Reads rates such as `10/minute`. Returns (0, 0) for blank rates."""
+    if not rate or rate.strip() == "0":
+        return 0, 0
+    count, _, period = rate.partition("/")
+    if period.strip() not in periods:
+        raise ValueError(f"Rate period must be one of {', '.join(periods)}: {rate}")
+    return int(count), periods[period.strip()]
+
+
+def gcra(tat: float, now: float, limit: int, period: float) -> tuple[float, float]:
+    """Admits one request against a bucket of `limit` tokens refilled over `period`.
+
+    Returns:
+        tuple: New theoretical arrival time, seconds to wait (0 when admitted).
+    """
+    tat = max(tat, now)
+    new_tat = tat + period / limit
+    allowed_at = new_tat - period
+    if allowed_at > now:
+        return tat, allowed_at - now
+    return new_tat, 0
+
+
+class RateLimitBackend:
+    """Holds bucket states. Subclasses set `blocking` when `hit` does I/O."""
+
+    blocking = False
+
+    def hit(self, key: str, limit: int, period: float) -> float:
+        """Takes a token from `key` bucket. Returns seconds to wait, 0 if taken."""
+        raise NotImplementedError
+
+
+class LocalBackend(RateLimitBackend):
+    """Buckets in process memory, limits apply per worker"""
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, float] = OrderedDict()
+        self._lock = Lock()
+
+    def hit(self, key: str, limit: int, period: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tat, retry_after = gcra(self._buckets.get(key, now), now, limit, period)
+            self._buckets[key] = tat
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                # Least recently hit buckets are the likeliest to be full again
+                self._buckets.popitem(last=False)
+        return retry_after
+
+
+class CacheBackend(RateLimitBackend):
+    """Buckets in the `RATE_LIMIT_CACHE` Django cache, shared by all workers when
+    that cache is (Redis, Memcached or database cache).
+
+    Reads and writes are not atomic, so simultaneous hits on one key from
+    different workers may let an extra request through.
+    """
+
+    blocking = True
+
+    def __init__(self):
+        self.cache = caches[settings.RATE_LIMIT_CACHE]
+
+    def hit(self, key: str, limit: int, period: float) -> float:
+        now = time.time()
+        key = f"ratelimit:{key}"
+        tat, retry_after = gcra(self.cache.get(key, now), now, limit, period)
+        if not retry_after:
+            self.cache.set(key, tat, timeout=math.ceil(tat - now) + 1)
+        return retry_after
+
+
+backend: RateLimitBackend = import_string(settings.RATE_LIMIT_BACKEND)()
+
+
+def get_client_key(request: Request) -> str:
+    """Client address. Tokens sent are not verified here, so they would let
+    clients pick a fresh bucket per request."""
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+class RateLimit:
+    """Dependency refusing clients that exceed `rate` on the endpoints using it"""
+
+    def __init__(self, scope: str, rate: str):
+        self.scope = scope
+        self.limit, self.period = parse_rate(rate)
+
+    async def __call__(self, request: Request):
+        if not self.limit:
+            return
+        key = f"{self.scope}:{get_client_key(request)}"
+        if backend.blocking:
+            retry_after = await anyio.to_thread.run_sync(
+                backend.hit, key, self.limit, self.period
+            )
+        else:
+            retry_after = backend.hit(key, self.limit, self.period)
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Try again later.",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
@@ -0,0 +1,84 @@
+"""Request phase accounting for the API endpoints
+"""
+
+import functools
+import inspect
+import logging
+import time
+from typing import Callable
+
+from fastapi import Request, Response
+from api.db import DBRoute
+from tailoring_ms.timing import RequestTimings, current_timings
+
+logger = logging.getLogger(__name__)
+
+
+def mark_returned(endpoint: Callable) -> Callable:
+    """Notes when `endpoint` returns, so that the rest counts as serialization"""
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                mark_endpoint_returned()
+
+    else:
+
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                mark_endpoint_returned()
+
+    wrapper.marks_returned = True
+    return wrapper
+
+
+def mark_endpoint_returned():
+    timings = current_timings.get()
+    if timings is not None:
+        timings.mark("endpoint")
+
+
+class TimedRoute(DBRoute):
+    """Reports validation & encoding of endpoint return values as serialization"""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        if not getattr(endpoint, "marks_returned", False):
+            # Not already wrapped by the router this route is included from
+            endpoint = mark_returned(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            response = await handler(request)
+            timings = current_timings.get()
+            if timings is not None and "endpoint" in timings.marks:
+                timings.add(
+                    "serialization",
+                    time.perf_counter() - timings.marks.pop("endpoint"),
+                )
+            return response
+
+        return timed_handler
+
+
+def log_slow_request(
+    request: Request, response: Response, duration: float, timings: RequestTimings
+):
+    logger.warning(
+        "Slow request %s %s %d took %.3fs with %d queries (%s)",
+        request.method,
+        request.url.path,
+        response.status_code,
+        duration,
+        timings.count("db"),
+        timings.header(duration),
+    )
@@ -0,0 +1,252 @@
+"""In-process caches for v1
+"""
+
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Iterable
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from users.models import CustomUser
+from external.models import About, FAQ, ServiceFeedback
+from tailoring.models import Service, Order, orders_status_changed
+from api.conditional import Validators, is_not_modified
+from api.db import run_in_db_thread
+from tailoring_ms.timing import timed
+
+
+class TokenUserCache:
+    """Bounded TTL/LRU cache mapping API tokens to users.
+
+    Entries are dropped when the user is saved or deleted, so a rotated token
+    stops resolving immediately. Changes made outside this process (or through
+    `QuerySet.update`) are only picked up once the entry expires.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[CustomUser, float]] = OrderedDict()
+        self._tokens_by_user: dict[int, str] = {}
+        self._lock = Lock()
+
+    def get(self, token: str) -> CustomUser | None:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                user, expiry = entry
+                if expiry > time.monotonic():
+                    self._entries.move_to_end(token)
+                    self.hits += 1
+                    # Handlers mutate the user they receive
+                    return copy.copy(user)
+                self._pop(token)
+            self.misses += 1
+            return None
+
+    def set(self, token: str, user: CustomUser):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._pop(token)
+            self._pop(self._tokens_by_user.get(user.pk))
+            self._entries[token] = (copy.copy(user), time.monotonic() + self.ttl)
+            self._tokens_by_user[user.pk] = token
+            while len(self._entries) > self.maxsize:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, user: CustomUser):
+        with self._lock:
+            self._pop(self._tokens_by_user.get(user.pk))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                ttl=self.ttl,
+                hits=self.hits,
+                misses=self.misses,
+                hit_ratio=round(self.hits / lookups, 4) if lookups else 0,
+            )
+
+    def _pop(self, token: str | None):
+        if token is None:
+            return
+        entry = self._entries.pop(token, None)
+        if entry is not None:
+            self._tokens_by_user.pop(entry[0].pk, None)
+
+
+token_user_cache = TokenUserCache(
+    maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL
+)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance: CustomUser, **kwargs):
+    token_user_cache.invalidate(instance)
+
+
+class ResponseCache:
+    """Keeps encoded JSON bodies of public endpoints together with their ETags.
+
+    Entries are invalidated by model signals. The TTL only bounds staleness
+    for changes made by other processes.
+    """
+
+    def __init__(self, ttl: float = 300, max_age: int = 60):
+        self.ttl = ttl
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[bytes, str, float]] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = Lock()
+
+    async def get(self, key: str, build: Callable[[], Any]) -> tuple[bytes, str]:
+        """Returns cached body and ETag, building them off the event loop on miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > time.monotonic():
+                self.hits += 1
+                return entry[0], entry[1]
+            self.misses += 1
+            generation = self._generations.get(key, 0)
+        value = await run_in_db_thread(build)
+        with timed("serialization"):
+            body = self.encode(value)
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        with self._lock:
+            # Don't store what was built while being invalidated
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = (body, etag, time.monotonic() + self.ttl)
+        return body, etag
+
+    async def respond(
+        self, request: Request, key: str, build: Callable[[], Any]
+    ) -> Response:
+        body, etag = await self.get(key, build)
+        headers = {"ETag": etag, "Cache-Control": f"public, max-age={self.max_age}"}
+        if is_not_modified(request, Validators(etag)):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def invalidate(self, *keys: str):
+        with self._lock:
+            self._invalidate(keys)
+
+    def clear(self):
+        with self._lock:
+            # Keys invalidated before may be being built again
+            self._invalidate({*self._entries, *self._generations})
+
+    def _invalidate(self, keys: Iterable[str]):
+        for key in keys:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(
+                keys=sorted(self._entries),
+                ttl=self.ttl,
+                hits=self.hits,
+                misses=self.misses,
+                hit_ratio=round(self.hits / lookups, 4) if lookups else 0,
+            )
+
+    @staticmethod
+    def encode(value: Any) -> bytes:
+        # Same rendering as fastapi.responses.JSONResponse
+        return json.dumps(
+            jsonable_encoder(value),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+landing_page_cache = ResponseCache(
+    ttl=settings.LANDING_CACHE_TTL, max_age=settings.LANDING_CACHE_MAX_AGE
+)
+
+
+@receiver(post_save, sender=About)
+@receiver(post_delete, sender=About)
+def invalidate_about(sender, **kwargs):
+    landing_page_cache.invalidate("about")
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def invalidate_services_offered(sender, **kwargs):
+    landing_page_cache.invalidate("services-offered")
+
+
+@receiver(post_save, sender=ServiceFeedback)
+@receiver(post_delete, sender=ServiceFeedback)
+def invalidate_feedbacks(sender, **kwargs):
+    landing_page_cache.invalidate("feedbacks")
+
+
+@receiver(post_save, sender=FAQ)
+@receiver(post_delete, sender=FAQ)
+def invalidate_faqs(sender, **kwargs):
+    landing_page_cache.invalidate("faqs")
+
+
+def is_latest_work(status: str, show_in_index: bool) -> bool:
+    return status == Order.OrderStatus.COMPLETED.value and bool(show_in_index)
+
+
+@receiver(post_save, sender=Order)
+def invalidate_latest_work(sender, instance: Order, created: bool, **kwargs):
+    shown = is_latest_work(instance.status, instance.show_in_index)
+    loaded = getattr(instance, "_loaded_values", None)
+    if loaded is None:
+        # Previous state unknown unless the order is brand new
+        if shown or not created:
+            landing_page_cache.invalidate("latest-work")
+        return
+    was_shown = is_latest_work(loaded.get("status"), loaded.get("show_in_index"))
+    if shown != was_shown or (shown and loaded.get("picture") != instance.picture.name):
+        landing_page_cache.invalidate("latest-work")
+    loaded.update(
+        status=instance.status,
+        show_in_index=instance.show_in_index,
+        picture=instance.picture.name,
+    )
+
+
+@receiver(post_delete, sender=Order)
+def invalidate_deleted_latest_work(sender, instance: Order, **kwargs):
+    if is_latest_work(instance.status, instance.show_in_index):
+        landing_page_cache.invalidate("latest-work")
+
+
+@receiver(orders_status_changed, sender=Order)
+def invalidate_moved_latest_work(
+    sender, status: str, previous_statuses: set[str], **kwargs
+):
+    # Only completed orders are shown
+    if Order.OrderStatus.COMPLETED.value in (status, *previous_statuses):
+        landing_page_cache.invalidate("latest-work")
@@ -6,6 +6,7 @@ from users.models import CustomUser
 from external.models import ServiceFeedback
 from tailoring.models import Service, Order
 from os import path
+from enum import Enum
 import re
 
 
@@ -83,6 +84,7 @@ class Profile(EditablePersonalData):
     date_of_birth: date
     gender: CustomUser.UserGender
     profile: Optional[str] = None
+    profile_srcset: Optional[dict[str, str]] = None
     is_staff: Optional[bool] = False
     date_joined: datetime
 
@@ -104,6 +106,10 @@ class Profile(EditablePersonalData):
                 "date_of_birth": "1990-01-01",
                 "gender": "male",
                 "profile": "/media/custom_user/profile.jpg",
+                "profile_srcset": {
+                    "webp": "/media/variants/custom_user/profile_320w.webp 320w",
+                    "jpeg": "/media/variants/custom_user/profile_320w.jpg 320w",
+                },
                 "is_staff": False,
                 "date_joined": "2023-01-01T00:00:00",
             }
@@ -284,6 +290,8 @@ class BusinessAbout(BaseModel):
     youtube: Optional[str] = None
     logo: Optional[str] = None
     wallpaper: Optional[str] = None
+    logo_srcset: Optional[dict[str, str]] = None
+    wallpaper_srcset: Optional[dict[str, str]] = None
 
     @field_validator("logo", "wallpaper")
     def validate_file(value):
@@ -310,6 +318,14 @@ class BusinessAbout(BaseModel):
                 "youtube": "https://www.youtube.com/",
                 "logo": "/media/default/logo.png",
                 "wallpaper": "/media/default/wallpaper.jpg",
+                "logo_srcset": {
+                    "webp": "/media/variants/default/logo_64w.webp 64w",
+                    "jpeg": "/media/variants/default/logo_64w.jpg 64w",
+                },
+                "wallpaper_srcset": {
+                    "webp": "/media/variants/default/wallpaper_320w.webp 320w, /media/variants/default/wallpaper_640w.webp 640w",
+                    "jpeg": "/media/variants/default/wallpaper_320w.jpg 320w, /media/variants/default/wallpaper_640w.jpg 640w",
+                },
             }
         }
 
@@ -333,6 +349,7 @@ class ServiceOffered(BaseModel):
     name: str
     description: str
     picture: str
+    picture_srcset: Optional[dict[str, str]] = None
     starting_price: float
     ending_price: float
 
@@ -348,6 +365,10 @@ class ServiceOffered(BaseModel):
                 "name": "Custom Suit",
                 "description": "Tailored suits made to fit your style and measurements.",
                 "picture": "/media/services/custom_suit.jpg",
+                "picture_srcset": {
+                    "webp": "/media/variants/services/custom_suit_320w.webp 320w, /media/variants/services/custom_suit_640w.webp 640w",
+                    "jpeg": "/media/variants/services/custom_suit_320w.jpg 320w, /media/variants/services/custom_suit_640w.jpg 640w",
+                },
                 "starting_price": 100.0,
                 "ending_price": 500.0,
             }
@@ -357,6 +378,7 @@ class ServiceOffered(BaseModel):
 class ShallowCompletedOrderDetail(BaseModel):
     id: int
     picture: str
+    picture_srcset: Optional[dict[str, str]] = None
 
     @field_validator("picture")
     def validate_picture(value: str):
@@ -369,6 +391,10 @@ class ShallowCompletedOrderDetail(BaseModel):
             "example": {
                 "id": 1,
                 "picture": "/media/orders/completed_order.jpg",
+                "picture_srcset": {
+                    "webp": "/media/variants/orders/completed_order_320w.webp 320w, /media/variants/orders/completed_order_640w.webp 640w",
+                    "jpeg": "/media/variants/orders/completed_order_320w.jpg 320w, /media/variants/orders/completed_order_640w.jpg 640w",
+                },
             }
         }
 
@@ -461,3 +487,118 @@ class FAQDetails(BaseModel):
                 "answer": "The turnaround time is typically 2-3 weeks.",
             }
         }
+
+
+class LandingSection(str, Enum):
+    ABOUT = "about"
+    SERVICES_OFFERED = "services-offered"
+    LATEST_WORK = "latest-work"
+    FEEDBACKS = "feedbacks"
+    FAQS = "faqs"
+
+
+class LandingPage(BaseModel):
+    """Index page data. Sections left out through `fields` are omitted."""
+
+    about: Optional[BusinessAbout] = None
+    services_offered: Optional[list[ServiceOffered]] = None
+    latest_work: Optional[list[ShallowCompletedOrderDetail]] = None
+    feedbacks: Optional[list[UserFeedback]] = None
+    faqs: Optional[list[FAQDetails]] = None
+
+
+class OrderEvent(BaseModel):
+    """Status & charges of an order as they change, `data` of the `order`
+    events of `/v1/orders/events`"""
+
+    id: int
+    status: Order.OrderStatus
+    charges: float | None = None
+    charges_paid: float | None = None
+    updated_at: datetime
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": 12,
+                "status": "In Progress",
+                "charges": 500.0,
+                "charges_paid": 200.0,
+                "updated_at": "2025-03-12T09:15:00Z",
+            }
+        }
+
+
+class OrderSummaryGroup(str, Enum):
+    DAY = "day"
+    SERVICE = "service"
+    STATUS = "status"
+    URGENCY = "urgency"
+
+
+class OrderSummaryTotals(BaseModel):
+    orders: int
+    charges: float
+    charges_paid: float
+
+
+class OrderSummaryRow(OrderSummaryTotals):
+    day: Optional[date] = None
+    service: Optional[str] = None
+    status: Optional[Order.OrderStatus] = None
+    urgency: Optional[Order.OrderUrgency] = None
+
+
+class OrderSummary(BaseModel):
+    """Order count and charges from `start` to `end` (inclusive), overall and
+    per combination of the `group_by` values"""
+
+    start: date
+    end: date
+    totals: OrderSummaryTotals
+    rows: list[OrderSummaryRow]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "start": "2025-03-01",
+                "end": "2025-03-30",
+                "totals": {"orders": 42, "charges": 126000.0, "charges_paid": 98000.0},
+                "rows": [
+                    {
+                        "status": "Completed",
+                        "orders": 30,
+                        "charges": 90000.0,
+                        "charges_paid": 90000.0,
+                    },
+                    {
+                        "status": "Pending",
+                        "orders": 12,
+                        "charges": 36000.0,
+                        "charges_paid": 8000.0,
+                    },
+                ],
+            }
+        }
+
+
+class SearchTarget(str, Enum):
+    ORDERS = "orders"
+    USERS = "users"
+    MESSAGES = "messages"
+    FEEDBACKS = "feedbacks"
+
+
+class SearchHit(BaseModel):
+    target: SearchTarget
+    id: int
+    title: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "target": "orders",
+                "id": 12,
+                "title": "Suit by john on 12-Mar-2025",
+            }
+        }
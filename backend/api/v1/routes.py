@@ -8,13 +8,27 @@ from fastapi import (
     Form,
     UploadFile,
     File,
+    Request,
+    Response,
+    Header,
 )
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from fastapi.security.oauth2 import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from users.models import CustomUser, UserMeasurements, AuthToken
-from external.models import About, Message, FAQ, ServiceFeedback
-from tailoring.models import Service, Order
+from external.models import About, Message, FAQ, ServiceFeedback, ImageVariants
+from tailoring.models import Service, Order, OrderRollup
 from tailoring_ms.utils import get_expiry_datetime
+from tailoring_ms.timing import timed
+from tailoring_ms.search import search_ranked
+from tailoring_ms.events import order_events
+from tailoring_ms.settings import (
+    RATE_LIMIT_LOGIN,
+    RATE_LIMIT_PASSWORD_RESET,
+    RATE_LIMIT_USER_EXISTS,
+    RATE_LIMIT_MESSAGE,
+    ORDER_EVENTS_KEEPALIVE,
+)
 
 # from django.contrib.auth.hashers import check_password
 from api.v1.utils import (
@@ -23,6 +37,20 @@ from api.v1.utils import (
     get_value,
     generate_password_reset_token,
     send_email,
+    prepare_uploaded_image,
+)
+from api.v1.cache import token_user_cache, landing_page_cache
+from api.db import run_in_db_thread
+from api.hashing import check_password, make_password, password_needs_update
+from api.timing import TimedRoute
+from api.ratelimit import RateLimit
+from api.conditional import (
+    Validators,
+    make_etag,
+    is_conditional,
+    is_not_modified,
+    not_modified,
+    check_if_match,
 )
 from api.v1.models import (
     TokenAuth,
@@ -39,16 +67,27 @@ from api.v1.models import (
     UserFeedback,
     ShallowUserOrderDetails,
     UserOrderDetails,
+    OrderEvent,
     EditableUserMeasurements,
     CompleteUserMeasurements,
+    LandingSection,
+    LandingPage,
+    OrderSummaryGroup,
+    OrderSummary,
+    SearchTarget,
+    SearchHit,
 )
 
 import asyncio
+import hashlib
+from datetime import date, datetime, timedelta
+from django.utils import timezone
+from django.db import transaction
 from typing import Annotated, Union, Optional
 from pydantic import PositiveInt
-from django.db.models import Q
+from django.db.models import Q, F, Subquery
 
-router = APIRouter(prefix="/v1", tags=["v1"])
+router = APIRouter(prefix="/v1", tags=["v1"], route_class=TimedRoute)
 
 
 v1_auth_scheme = OAuth2PasswordBearer(
@@ -62,11 +101,16 @@ async def get_user(token: Annotated[str, Depends(v1_auth_scheme)]) -> CustomUser
     if token:
         try:
             if token.startswith(token_id):
+                user = token_user_cache.get(token)
+                if user is not None:
+                    return user
 
                 def fetch_user(token) -> CustomUser:
                     return CustomUser.objects.get(token=token)
 
-                return await asyncio.to_thread(fetch_user, token)
+                user = await run_in_db_thread(fetch_user, token)
+                token_user_cache.set(token, user)
+                return user
 
         except CustomUser.DoesNotExist:
             pass
@@ -78,8 +122,22 @@ async def get_user(token: Annotated[str, Depends(v1_auth_scheme)]) -> CustomUser
     )
 
 
-@router.post("/token", name="User token")
-def fetch_token(
+async def get_staff_user(user: Annotated[CustomUser, Depends(get_user)]) -> CustomUser:
+    """Ensures token passed belongs to a staff member"""
+    if not user.is_staff:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Staff privileges required",
+        )
+    return user
+
+
+@router.post(
+    "/token",
+    name="User token",
+    dependencies=[Depends(RateLimit("token", RATE_LIMIT_LOGIN))],
+)
+async def fetch_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
 ) -> TokenAuth:
     """
@@ -87,13 +145,18 @@ def fetch_token(
     - `password` : User password.
     """
     try:
-        user = CustomUser.objects.get(
-            username=form_data.username
+        user = await run_in_db_thread(
+            CustomUser.objects.get, Q(username=form_data.username)
         )  # Temporarily restrict to students only
-        if user.check_password(form_data.password):
+        if await check_password(form_data.password, user.password):
+            save_user = user.token is None
+            if password_needs_update(user.password):
+                user.password = await make_password(form_data.password)
+                save_user = True
             if user.token is None:
                 user.token = generate_token()
-                user.save()
+            if save_user:
+                await run_in_db_thread(user.save)
             return TokenAuth(
                 access_token=user.token,
                 token_type="bearer",
@@ -112,11 +175,17 @@ def fetch_token(
 @router.patch("/token", name="Generate new token")
 def generate_new_token(user: Annotated[CustomUser, Depends(get_user)]) -> TokenAuth:
     user.token = generate_token()
-    user.save()
+    # The user may come from the token cache, saving other fields could revert
+    # changes made since it was cached
+    user.save(update_fields=["token"])  # Evicts the old token from cache
     return TokenAuth(access_token=user.token)
 
 
-@router.get("/password/send-reset-token", name="Send password reset password")
+@router.get(
+    "/password/send-reset-token",
+    name="Send password reset password",
+    dependencies=[Depends(RateLimit("send-reset-token", RATE_LIMIT_PASSWORD_RESET))],
+)
 def reset_password(
     identity: Annotated[str, Query(description="Username or email address")]
 ) -> Feedback:
@@ -156,11 +225,17 @@ def reset_password(
         )
 
 
-@router.post("/password/reset", name="Set new password")
-def reset_password(info: ResetPassword) -> Feedback:
+@router.post(
+    "/password/reset",
+    name="Set new password",
+    dependencies=[Depends(RateLimit("password-reset", RATE_LIMIT_PASSWORD_RESET))],
+)
+async def reset_password(info: ResetPassword) -> Feedback:
     """Resets user password"""
     try:
-        auth_token = AuthToken.objects.get(token=info.token)
+        auth_token = await run_in_db_thread(
+            AuthToken.objects.select_related("user").get, Q(token=info.token)
+        )
         if auth_token.is_expired():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -168,9 +243,13 @@ def reset_password(info: ResetPassword) -> Feedback:
             )
         user = auth_token.user
         if user.username == info.username:
-            user.set_password(info.new_password)
-            user.save()
-            auth_token.delete()
+            user.password = await make_password(info.new_password)
+
+            def save_new_password():
+                user.save()
+                auth_token.delete()
+
+            await run_in_db_thread(save_new_password)
             return Feedback(detail="Password reset successfully.")
         else:
             raise HTTPException(
@@ -184,8 +263,8 @@ def reset_password(info: ResetPassword) -> Feedback:
         )
 
 
-@router.get("/profile", name="Profile information")
-def profile_information(user: Annotated[CustomUser, Depends(get_user)]) -> Profile:
+def fetch_profile(user: CustomUser) -> Profile:
+    srcsets = ImageVariants.get_srcsets(user.profile.name)
     return Profile(
         first_name=user.first_name,
         last_name=user.last_name,
@@ -196,22 +275,61 @@ def profile_information(user: Annotated[CustomUser, Depends(get_user)]) -> Profi
         date_of_birth=user.date_of_birth,
         gender=user.gender,
         profile=user.profile.name,
+        profile_srcset=srcsets.get(user.profile.name),
         is_staff=user.is_staff,
         date_joined=user.date_joined,
     )
 
 
+def get_profile_validators(profile: Profile) -> Validators:
+    # Users have no update timestamp, the profile's content stands in for one
+    return Validators(make_etag("profile", profile.model_dump_json()))
+
+
+@router.get("/profile", name="Profile information")
+async def profile_information(
+    request: Request,
+    response: Response,
+    user: Annotated[CustomUser, Depends(get_user)],
+) -> Profile:
+    profile = await run_in_db_thread(fetch_profile, user)
+    validators = get_profile_validators(profile)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    response.headers.update(validators.headers)
+    return profile
+
+
 @router.patch("/profile", name="Update profile")
 def update_personal_info(
+    request: Request,
+    response: Response,
     user: Annotated[CustomUser, Depends(get_user)],
     updated_personal_data: EditablePersonalData,
 ) -> EditablePersonalData:
-    user.first_name = updated_personal_data.first_name or user.first_name
-    user.last_name = updated_personal_data.last_name or user.last_name
-    user.phone_number = updated_personal_data.phone_number or user.phone_number
-    user.email = updated_personal_data.email or user.email
-    user.location = updated_personal_data.location or user.location
-    user.save()
+    """Send the profile's `ETag` as `If-Match` to have the update refused
+    with 412 if the profile changed since it was fetched."""
+    with transaction.atomic():
+        # The user may come from the token cache, so updates are made to the
+        # current row
+        user = CustomUser.objects.select_for_update().get(pk=user.pk)
+        if "if-match" in request.headers:
+            check_if_match(request, get_profile_validators(fetch_profile(user)))
+        user.first_name = updated_personal_data.first_name or user.first_name
+        user.last_name = updated_personal_data.last_name or user.last_name
+        user.phone_number = updated_personal_data.phone_number or user.phone_number
+        user.email = updated_personal_data.email or user.email
+        user.location = updated_personal_data.location or user.location
+        user.save(
+            update_fields=[
+                "first_name",
+                "last_name",
+                "phone_number",
+                "email",
+                "location",
+            ]
+        )
+    response.headers.update(get_profile_validators(fetch_profile(user)).headers)
     return EditablePersonalData(
         first_name=user.first_name,
         last_name=user.last_name,
@@ -221,10 +339,7 @@ def update_personal_info(
     )
 
 
-@router.get("/measurements", name="Get user measurements")
-def get_user_measurements(
-    user: Annotated[CustomUser, Depends(get_user)]
-) -> CompleteUserMeasurements:
+def fetch_user_measurements(user: CustomUser) -> CompleteUserMeasurements:
     try:
         measurements = UserMeasurements.objects.get(user=user)
         return CompleteUserMeasurements(**measurements.model_dump())
@@ -246,26 +361,66 @@ def get_user_measurements(
         return CompleteUserMeasurements(**new_measurements.model_dump())
 
 
+def get_measurements_validators(user: CustomUser, date_updated: datetime) -> Validators:
+    return Validators(
+        make_etag("measurements", user.id, date_updated.timestamp()), date_updated
+    )
+
+
+@router.get("/measurements", name="Get user measurements")
+async def get_user_measurements(
+    request: Request,
+    response: Response,
+    user: Annotated[CustomUser, Depends(get_user)],
+) -> CompleteUserMeasurements:
+    if is_conditional(request):
+        date_updated = await run_in_db_thread(
+            UserMeasurements.objects.filter(user=user)
+            .values_list("date_updated", flat=True)
+            .first
+        )
+        if date_updated is not None:
+            validators = get_measurements_validators(user, date_updated)
+            if is_not_modified(request, validators):
+                return not_modified(validators)
+    measurements = await run_in_db_thread(fetch_user_measurements, user)
+    response.headers.update(
+        get_measurements_validators(user, measurements.date_updated).headers
+    )
+    return measurements
+
+
 @router.patch("/measurements", name="Update user measurements")
 def update_user_measurements(
+    request: Request,
+    response: Response,
     user: Annotated[CustomUser, Depends(get_user)],
     updated_measurement: EditableUserMeasurements,
 ) -> CompleteUserMeasurements:
-    measurement = UserMeasurements.objects.get(user=user)
-    measurement.chest = get_value(updated_measurement.chest, measurement.chest)
-    measurement.waist = get_value(updated_measurement.waist, measurement.waist)
-    measurement.hips = get_value(updated_measurement.hips, measurement.hips)
-    measurement.inseam = get_value(updated_measurement.inseam, measurement.inseam)
-    measurement.neck = get_value(updated_measurement.neck, measurement.neck)
-    measurement.sleeve_length = get_value(
-        updated_measurement.sleeve_length, measurement.sleeve_length
-    )
-    measurement.shoulder_width = get_value(
-        updated_measurement.shoulder_width, measurement.shoulder_width
+    """Send the measurements' `ETag` as `If-Match` to have the update refused
+    with 412 if they changed since they were fetched."""
+    with transaction.atomic():
+        measurement = UserMeasurements.objects.select_for_update().get(user=user)
+        check_if_match(
+            request, get_measurements_validators(user, measurement.date_updated)
+        )
+        measurement.chest = get_value(updated_measurement.chest, measurement.chest)
+        measurement.waist = get_value(updated_measurement.waist, measurement.waist)
+        measurement.hips = get_value(updated_measurement.hips, measurement.hips)
+        measurement.inseam = get_value(updated_measurement.inseam, measurement.inseam)
+        measurement.neck = get_value(updated_measurement.neck, measurement.neck)
+        measurement.sleeve_length = get_value(
+            updated_measurement.sleeve_length, measurement.sleeve_length
+        )
+        measurement.shoulder_width = get_value(
+            updated_measurement.shoulder_width, measurement.shoulder_width
+        )
+        measurement.thigh = get_value(updated_measurement.thigh, measurement.thigh)
+        measurement.calf = get_value(updated_measurement.calf, measurement.calf)
+        measurement.save()
+    response.headers.update(
+        get_measurements_validators(user, measurement.date_updated).headers
     )
-    measurement.thigh = get_value(updated_measurement.thigh, measurement.thigh)
-    measurement.calf = get_value(updated_measurement.calf, measurement.calf)
-    measurement.save()
     return CompleteUserMeasurements(**measurement.model_dump())
 
 
@@ -287,6 +442,8 @@ def place_new_order(
         Optional[Order.OrderUrgency], Form(description="Order urgency")
     ] = Order.OrderUrgency.MEDIUM.value,
 ) -> UserOrderDetails:
+    if reference_image is not None:
+        image_content = prepare_uploaded_image(reference_image)
     target_service = Service.objects.get(name=service_name.value)
     new_order = Order.objects.create(
         client=user,
@@ -299,33 +456,133 @@ def place_new_order(
         urgency=urgency.value,
     )
     if reference_image is not None:
-        new_order.reference_image.save(
-            name=reference_image.filename, content=reference_image.file, save=False
-        )
+        with timed("storage"):
+            new_order.reference_image.save(
+                name=reference_image.filename, content=image_content, save=False
+            )
     new_order.save()
     return UserOrderDetails(**new_order.model_dump())
 
 
 @router.get("/orders", name="Get orders placed")
-def get_orders_placed(
-    user: Annotated[CustomUser, Depends(get_user)]
+async def get_orders_placed(
+    user: Annotated[CustomUser, Depends(get_user)],
+    after: Annotated[
+        Optional[int],
+        Query(description="Id of the last order in the previous page"),
+    ] = None,
+    limit: Annotated[
+        int, Query(description="Maximum orders to return", ge=1, le=500)
+    ] = 100,
 ) -> list[ShallowUserOrderDetails]:
-    order_details_list = []
-    for order in Order.objects.filter(client=user).all().order_by("-created_at"):
-        order.service_name = order.service.name
-        order_details_list.append(ShallowUserOrderDetails(**jsonable_encoder(order)))
-    return order_details_list
+    """Newest orders first. Pass the `id` of the last order received as `after`
+    to fetch the next page."""
+    orders = Order.objects.filter(client=user)
+    if after is not None:
+        cursor = Order.objects.filter(pk=after, client=user).values("created_at")
+        orders = orders.filter(
+            Q(created_at__lt=Subquery(cursor))
+            | Q(created_at=Subquery(cursor), id__lt=after)
+        )
+    # Rows are validated once, straight into the response model
+    return await run_in_db_thread(
+        list,
+        orders.order_by("-created_at", "-id").values(
+            "id", "quantity", "charges", "status", service_name=F("service__name")
+        )[:limit],
+    )
+
+
+@router.get(
+    "/orders/events",
+    name="Stream order changes",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "`order` events carrying an OrderEvent as data",
+        }
+    },
+)
+async def stream_order_events(
+    user: Annotated[CustomUser, Depends(get_user)],
+    last_event_id: Annotated[
+        Optional[int],
+        Header(description="Id of the last event received, to resume after it"),
+    ] = None,
+) -> StreamingResponse:
+    """Server-sent `order` events whenever the status or charges of one of the
+    user's orders change.
+
+    Reconnecting with `Last-Event-ID` replays the events missed meanwhile. A
+    `resync` event is sent instead when those are no longer kept; orders should
+    then be fetched again.
+    """
+
+    def format_event(event) -> str:
+        data = OrderEvent(**event.data).model_dump_json()
+        return f"id: {event.id}\nevent: order\ndata: {data}\n\n"
+
+    async def stream():
+        subscription, missed = order_events.subscribe(user.id, last_event_id)
+        try:
+            yield "retry: 3000\n\n"
+            if missed is None:
+                yield "event: resync\ndata: {}\n\n"
+            for event in missed or ():
+                yield format_event(event)
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), ORDER_EVENTS_KEEPALIVE
+                    )
+                except TimeoutError:
+                    # Keeps proxies from closing idle connections
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    # Events were dropped, the client resumes after reconnecting
+                    return
+                yield format_event(event)
+        finally:
+            order_events.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def get_order_validators(id: int, updated_at: datetime) -> Validators:
+    return Validators(make_etag("order", id, updated_at.timestamp()), updated_at)
 
 
 @router.get("/order/{id}", name="Get specific order details")
-def get_specific_order_details(
+async def get_specific_order_details(
+    request: Request,
+    response: Response,
     user: Annotated[CustomUser, Depends(get_user)],
     id: Annotated[int, Path(description="Order id")],
 ) -> UserOrderDetails:
+    if is_conditional(request):
+        updated_at = await run_in_db_thread(
+            Order.objects.filter(pk=id, client=user)
+            .values_list("updated_at", flat=True)
+            .first
+        )
+        if updated_at is not None:
+            validators = get_order_validators(id, updated_at)
+            if is_not_modified(request, validators):
+                return not_modified(validators)
     try:
-        target_order = Order.objects.get(pk=id, client=user)
-        target_order.service_name = target_order.service.name
-        return UserOrderDetails(**jsonable_encoder(target_order))
+        target_order = await run_in_db_thread(
+            Order.objects.select_related("service").get, Q(pk=id, client=user)
+        )
+        response.headers.update(
+            get_order_validators(id, target_order.updated_at).headers
+        )
+        return UserOrderDetails(**target_order.model_dump())
     except Order.DoesNotExist:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -335,6 +592,8 @@ def get_specific_order_details(
 
 @router.patch("/order/{id}", name="Update a particular order")
 def update_existing_order(
+    request: Request,
+    response: Response,
     user: Annotated[CustomUser, Depends(get_user)],
     id: Annotated[int, Path(description="Order id")],
     service_name: Annotated[
@@ -357,41 +616,64 @@ def update_existing_order(
     colors: Annotated[str, Form(description="Desired material color")] = None,
     urgency: Annotated[Order.OrderUrgency, Form(description="Order urgency")] = None,
 ) -> UserOrderDetails:
+    """Send the order's `ETag` as `If-Match` to have the update refused with 412
+    if the order changed since it was fetched."""
+    image_field = Order._meta.get_field("reference_image")
+    image_name = None
+    if reference_image is not None:
+        # Stored before the order is locked, so that its other writers don't
+        # wait on decoding and storage
+        image_content = prepare_uploaded_image(reference_image)
+        with timed("storage"):
+            image_name = image_field.storage.save(
+                image_field.generate_filename(Order(id=id), reference_image.filename),
+                image_content,
+                max_length=image_field.max_length,
+            )
     try:
-        target_order = Order.objects.get(pk=id, client=user)
-        target_order.details = details or target_order.details
-        target_order.material_type = (
-            material_type.value
-            if material_type is not None
-            else target_order.material_type
-        )
-        target_order.fabric_required = (
-            fabric_required
-            if fabric_required is not None
-            else target_order.fabric_required
-        )
-        target_order.quantity = quantity or target_order.quantity
-        target_order.colors = colors or target_order.colors
-        target_order.urgency = (
-            urgency.value if urgency is not None else target_order.urgency
-        )
-        if service_name:
-            target_order.service = Service.objects.get(name=service_name.value)
-        if reference_image is not None:
-            if target_order.reference_image is not None:
-                target_order.reference_image.delete(save=False)
-            target_order.reference_image.save(
-                name=reference_image.filename, content=reference_image.file, save=False
+        with transaction.atomic():
+            target_order = Order.objects.select_for_update().get(pk=id, client=user)
+            check_if_match(request, get_order_validators(id, target_order.updated_at))
+            target_order.details = details or target_order.details
+            target_order.material_type = (
+                material_type.value
+                if material_type is not None
+                else target_order.material_type
             )
-        target_order.save()
-        target_order.refresh_from_db()
-        return UserOrderDetails(**target_order.model_dump())
-
-    except Order.DoesNotExist:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Order with id {id} does not exist.",
-        )
+            target_order.fabric_required = (
+                fabric_required
+                if fabric_required is not None
+                else target_order.fabric_required
+            )
+            target_order.quantity = quantity or target_order.quantity
+            target_order.colors = colors or target_order.colors
+            target_order.urgency = (
+                urgency.value if urgency is not None else target_order.urgency
+            )
+            if service_name:
+                target_order.service = Service.objects.get(name=service_name.value)
+            if image_name is not None:
+                previous_image = target_order.reference_image.name
+                target_order.reference_image.name = image_name
+                if previous_image:
+                    # Kept should the update roll back
+                    transaction.on_commit(
+                        lambda: image_field.storage.delete(previous_image)
+                    )
+            target_order.save()
+    except Exception as e:
+        if image_name is not None:
+            # Not referenced by the order
+            image_field.storage.delete(image_name)
+        if isinstance(e, Order.DoesNotExist):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Order with id {id} does not exist.",
+            )
+        raise
+    target_order.refresh_from_db()
+    response.headers.update(get_order_validators(id, target_order.updated_at).headers)
+    return UserOrderDetails(**target_order.model_dump())
 
 
 @router.delete("/order/{id}", name="Delete a placed order")
@@ -412,26 +694,44 @@ def delete_placed_order(
         )
 
 
-@router.get("/user/exists", name="Check if username exists")
-def check_if_username_exists(
+@router.get(
+    "/user/exists",
+    name="Check if username exists",
+    dependencies=[Depends(RateLimit("user-exists", RATE_LIMIT_USER_EXISTS))],
+)
+async def check_if_username_exists(
     username: Annotated[str, Query(description="Username to check against")]
 ) -> Feedback:
     """Checks if account with a particular username exists
     - Useful when setting username at account creation
     """
-    try:
-        CustomUser.objects.get(username=username)
-        return Feedback(detail=True)
-    except CustomUser.DoesNotExist:
-        return Feedback(detail=False)
+    return Feedback(
+        detail=await run_in_db_thread(
+            CustomUser.objects.filter(username=username).exists
+        )
+    )
 
 
-@router.get("/about", name="Business information")
-def get_hospital_details() -> BusinessAbout:
-    return BusinessAbout(**jsonable_encoder(About.objects.all().first()))
+def fetch_business_about() -> BusinessAbout:
+    about = jsonable_encoder(About.objects.all().first())
+    srcsets = ImageVariants.get_srcsets(about["logo"], about["wallpaper"])
+    return BusinessAbout(
+        **about,
+        logo_srcset=srcsets.get(about["logo"]),
+        wallpaper_srcset=srcsets.get(about["wallpaper"]),
+    )
+
 
+@router.get("/about", name="Business information", response_model=BusinessAbout)
+async def get_hospital_details(request: Request) -> Response:
+    return await landing_page_cache.respond(request, "about", fetch_business_about)
 
-@router.post("/message", name="New visitor message")
+
+@router.post(
+    "/message",
+    name="New visitor message",
+    dependencies=[Depends(RateLimit("message", RATE_LIMIT_MESSAGE))],
+)
 def new_visitor_message(message: NewVisitorMessage) -> Feedback:
     new_message = Message.objects.create(**message.model_dump())
     new_message.save()
@@ -444,16 +744,30 @@ def new_visitor_message(message: NewVisitorMessage) -> Feedback:
     return Feedback(detail="Message received succesfully.")
 
 
-@router.get("/services-offered", name="Get services offered")
-def get_services_offered() -> list[ServiceOffered]:
-    return [
-        ServiceOffered(**jsonable_encoder(service))
+def fetch_services_offered() -> list[ServiceOffered]:
+    services = [
+        jsonable_encoder(service)
         for service in Service.objects.all().order_by("created_at").all()[:15]
     ]
+    srcsets = ImageVariants.get_srcsets(*[service["picture"] for service in services])
+    return [
+        ServiceOffered(**service, picture_srcset=srcsets.get(service["picture"]))
+        for service in services
+    ]
+
 
+@router.get(
+    "/services-offered",
+    name="Get services offered",
+    response_model=list[ServiceOffered],
+)
+async def get_services_offered(request: Request) -> Response:
+    return await landing_page_cache.respond(
+        request, "services-offered", fetch_services_offered
+    )
 
-@router.get("/latest-work", name="Get latest work")
-def get_latest_work() -> list[ShallowCompletedOrderDetail]:
+
+def fetch_latest_work() -> list[ShallowCompletedOrderDetail]:
     completed_orders = (
         Order.objects.filter(
             status=Order.OrderStatus.COMPLETED.value, show_in_index=True
@@ -461,12 +775,28 @@ def get_latest_work() -> list[ShallowCompletedOrderDetail]:
         .order_by("-created_at")
         .all()[:15]
     )
+    srcsets = ImageVariants.get_srcsets(
+        *[order.picture.name for order in completed_orders]
+    )
     return [
-        ShallowCompletedOrderDetail(id=order.id, picture=order.picture.name)
+        ShallowCompletedOrderDetail(
+            id=order.id,
+            picture=order.picture.name,
+            picture_srcset=srcsets.get(order.picture.name),
+        )
         for order in completed_orders
     ]
 
 
+@router.get(
+    "/latest-work",
+    name="Get latest work",
+    response_model=list[ShallowCompletedOrderDetail],
+)
+async def get_latest_work(request: Request) -> Response:
+    return await landing_page_cache.respond(request, "latest-work", fetch_latest_work)
+
+
 @router.get("/latest-work/{id}", name="Get specific latest work details")
 def get_specific_latest_work(
     id: Annotated[int, Path(description="Order ID")]
@@ -485,10 +815,10 @@ def get_specific_latest_work(
         )
 
 
-@router.get("/feedbacks", name="Get client feedbacks")
-def get_client_feedbacks() -> list[UserFeedback]:
+def fetch_client_feedbacks() -> list[UserFeedback]:
     feedbacks = (
-        ServiceFeedback.objects.filter(show_in_index=True)
+        ServiceFeedback.objects.select_related("sender")
+        .filter(show_in_index=True)
         .order_by("-created_at")
         .all()[:6]
     )
@@ -505,9 +835,144 @@ def get_client_feedbacks() -> list[UserFeedback]:
     return feedback_list
 
 
-@router.get("/faqs", name="Get frequently asked questions")
-def get_faqs() -> list[FAQDetails]:
+@router.get(
+    "/feedbacks", name="Get client feedbacks", response_model=list[UserFeedback]
+)
+async def get_client_feedbacks(request: Request) -> Response:
+    return await landing_page_cache.respond(
+        request, "feedbacks", fetch_client_feedbacks
+    )
+
+
+def fetch_faqs() -> list[FAQDetails]:
     return [
         FAQDetails(**jsonable_encoder(faq))
         for faq in FAQ.objects.filter(is_shown=True).order_by("created_at").all()[:10]
     ]
+
+
+@router.get(
+    "/faqs", name="Get frequently asked questions", response_model=list[FAQDetails]
+)
+async def get_faqs(request: Request) -> Response:
+    return await landing_page_cache.respond(request, "faqs", fetch_faqs)
+
+
+landing_page_sections = {
+    LandingSection.ABOUT: fetch_business_about,
+    LandingSection.SERVICES_OFFERED: fetch_services_offered,
+    LandingSection.LATEST_WORK: fetch_latest_work,
+    LandingSection.FEEDBACKS: fetch_client_feedbacks,
+    LandingSection.FAQS: fetch_faqs,
+}
+
+
+@router.get("/landing", name="Landing page bundle", response_model=LandingPage)
+async def get_landing_page(
+    request: Request,
+    fields: Annotated[
+        Optional[list[LandingSection]],
+        Query(description="Sections to include, defaults to all"),
+    ] = None,
+) -> Response:
+    """Everything the index page needs in a single response"""
+    sections = [
+        section for section in landing_page_sections if not fields or section in fields
+    ]
+    cached = await asyncio.gather(
+        *[
+            landing_page_cache.get(section.value, landing_page_sections[section])
+            for section in sections
+        ]
+    )
+    # Stitch the already encoded sections together
+    body = (
+        b"{"
+        + b",".join(
+            b'"%s":%s' % (section.value.replace("-", "_").encode(), section_body)
+            for section, (section_body, _) in zip(sections, cached)
+        )
+        + b"}"
+    )
+    digest = hashlib.sha1("".join(etag for _, etag in cached).encode())
+    etag = f'"{digest.hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={landing_page_cache.max_age}",
+    }
+    if is_not_modified(request, Validators(etag)):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/stats/token-cache", name="Token cache statistics")
+def get_token_cache_stats(
+    user: Annotated[CustomUser, Depends(get_staff_user)]
+) -> Feedback:
+    """Hit/miss counters of the token to user cache (staff only)"""
+    return Feedback(detail=token_user_cache.stats())
+
+
+@router.get("/stats/landing-cache", name="Landing page cache statistics")
+def get_landing_cache_stats(
+    user: Annotated[CustomUser, Depends(get_staff_user)]
+) -> Feedback:
+    """Hit/miss counters of the cached landing page responses (staff only)"""
+    return Feedback(detail=landing_page_cache.stats())
+
+
+@router.get("/stats/orders", name="Order summary", response_model_exclude_none=True)
+def get_order_summary(
+    user: Annotated[CustomUser, Depends(get_staff_user)],
+    start: Annotated[
+        Optional[date], Query(description="First day, defaults to 30 days ago")
+    ] = None,
+    end: Annotated[
+        Optional[date], Query(description="Last day, defaults to today")
+    ] = None,
+    group_by: Annotated[
+        list[OrderSummaryGroup], Query(description="Values to total the orders by")
+    ] = [OrderSummaryGroup.DAY],
+) -> OrderSummary:
+    """Order count and charges per day, service, status and/or urgency (staff only).
+
+    Read from the daily order rollups rather than the orders.
+    """
+    end = end or timezone.localdate()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end",
+        )
+    totals, rows = OrderRollup.summarize(
+        start, end, list(dict.fromkeys(group.value for group in group_by))
+    )
+    return OrderSummary(start=start, end=end, totals=totals, rows=rows)
+
+
+@router.get("/search", name="Search")
+def search_records(
+    user: Annotated[CustomUser, Depends(get_staff_user)],
+    q: Annotated[str, Query(description="Words to look for", min_length=1)],
+    targets: Annotated[
+        list[SearchTarget], Query(description="Records to search")
+    ] = list(SearchTarget),
+    limit: Annotated[int, Query(description="Hits per target", ge=1, le=100)] = 20,
+) -> list[SearchHit]:
+    """Orders, users, messages and/or feedbacks containing every word of `q`,
+    best matches of each target first (staff only).
+
+    Served by the full-text search index.
+    """
+    querysets = {
+        SearchTarget.ORDERS: Order.objects.select_related("service", "client"),
+        SearchTarget.USERS: CustomUser.objects.all(),
+        SearchTarget.MESSAGES: Message.objects.all(),
+        SearchTarget.FEEDBACKS: ServiceFeedback.objects.select_related("sender"),
+    }
+    return [
+        SearchHit(target=target, id=obj.pk, title=str(obj))
+        for target in dict.fromkeys(targets)
+        for obj in search_ranked(querysets[target], q, limit)
+    ]
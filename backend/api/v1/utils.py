@@ -9,6 +9,15 @@ from tailoring_ms.utils import send_email as django_send_email
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils import timezone
+from django.core.files import File
+from fastapi import UploadFile, HTTPException, status
+from tailoring_ms.images import (
+    sniff_image_format,
+    downscale_image,
+    InvalidImageError,
+    ImageTooLargeError,
+)
+from tailoring_ms.timing import timed
 
 token_id = "tms_"
 
@@ -42,10 +51,52 @@ def send_email(subject: str, recipient: str, template_name: str, context: dict):
             "date": timezone.now().date(),
         }
     )
-    email_body = render_to_string(
-        get_template_path(template_name),
-        context=context,
-    )
+    with timed("template"):
+        email_body = render_to_string(
+            get_template_path(template_name),
+            context=context,
+        )
     return django_send_email(
         subject=subject, message="", recipient=recipient, html_message=email_body
     )
+
+
+def prepare_uploaded_image(upload: UploadFile) -> File:
+    """Validates uploaded image, downscaling it when configured.
+
+    The returned file is written to storage in chunks by `FieldFile.save`.
+
+    Raises:
+        HTTPException: When the file is too large or is not a supported image.
+    """
+    upload.file.seek(0, os.SEEK_END)
+    size = upload.file.tell()
+    upload.file.seek(0)
+    if size > settings.UPLOAD_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Image must not exceed {settings.UPLOAD_MAX_SIZE} bytes.",
+        )
+    format = sniff_image_format(upload.file.read(16))
+    upload.file.seek(0)
+    if format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Only JPEG, PNG, GIF and WEBP images are accepted.",
+        )
+    try:
+        with timed("image"):
+            content = downscale_image(
+                upload.file, format, settings.UPLOAD_IMAGE_MAX_DIMENSION
+            )
+    except ImageTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Image has too many pixels.",
+        )
+    except InvalidImageError:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Image is corrupt or truncated.",
+        )
+    return content or File(upload.file)
@@ -1,7 +1,22 @@
 from django.contrib import admin
-from external.models import About, ServiceFeedback, Message, FAQ
+from external.models import (
+    About,
+    ServiceFeedback,
+    Message,
+    FAQ,
+    OutgoingEmail,
+    DeadLetterEmail,
+    ImageVariants,
+    ExportJob,
+)
+from django.core.exceptions import PermissionDenied
+from django.http import FileResponse, Http404
+from django.urls import path, reverse
+from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
+from django.utils import timezone
 from unfold.admin import ModelAdmin
+from tailoring_ms.search import SearchIndexMixin
 
 # Register your models here.
 
@@ -47,9 +62,10 @@ class AboutAdmin(ModelAdmin):
 
 
 @admin.register(ServiceFeedback)
-class ServiceFeedbackAdmin(ModelAdmin):
+class ServiceFeedbackAdmin(SearchIndexMixin, ModelAdmin):
     list_display = ("sender", "rate", "show_in_index", "sender_role", "created_at")
     search_fields = ("sender__username", "message")
+    search_index_relations = ("sender",)
     list_filter = ("rate", "show_in_index", "updated_at", "created_at")
     list_editable = ("show_in_index",)
     ordering = ("-created_at",)
@@ -62,10 +78,10 @@ class ServiceFeedbackAdmin(ModelAdmin):
 
 
 @admin.register(Message)
-class MessageAdmin(ModelAdmin):
+class MessageAdmin(SearchIndexMixin, ModelAdmin):
     list_display = ("sender", "body", "is_read", "created_at")
     list_filter = ("is_read", "created_at")
-    search_fields = ("sender", "message")
+    search_fields = ("sender", "email", "body")
     list_editable = ("is_read",)
     ordering = ("-created_at",)
     fieldsets = (
@@ -100,3 +116,164 @@ class FAQAdmin(ModelAdmin):
         (_("Status & Date"), {"fields": ("is_shown", "created_at")}),
     )
     readonly_fields = ("created_at",)
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(ModelAdmin):
+    list_display = (
+        "subject",
+        "recipient",
+        "status",
+        "attempts",
+        "send_after",
+        "sent_at",
+        "created_at",
+    )
+    list_filter = ("status", "created_at", "sent_at")
+    search_fields = ("recipient", "subject")
+    ordering = ("-created_at",)
+    actions = ("requeue",)
+    fieldsets = (
+        (None, {"fields": ("subject", "recipient", "message", "html_message")}),
+        (
+            _("Delivery"),
+            {
+                "fields": ("status", "attempts", "last_error", "send_after", "sent_at"),
+                "classes": ["tab"],
+            },
+        ),
+        (_("Timestamps"), {"fields": ("updated_at", "created_at"), "classes": ["tab"]}),
+    )
+    readonly_fields = (
+        "subject",
+        "recipient",
+        "message",
+        "html_message",
+        "attempts",
+        "last_error",
+        "sent_at",
+        "updated_at",
+        "created_at",
+    )
+
+    @admin.action(description=_("Requeue selected emails"))
+    def requeue(self, request, queryset):
+        # Emails being sent are left to their worker
+        updated = queryset.exclude(
+            status__in=(
+                OutgoingEmail.EmailStatus.SENT.value,
+                OutgoingEmail.EmailStatus.SENDING.value,
+            )
+        ).update(
+            status=OutgoingEmail.EmailStatus.QUEUED.value,
+            attempts=0,
+            send_after=timezone.now(),
+        )
+        self.message_user(request, _("%d emails requeued.") % updated)
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(DeadLetterEmail)
+class DeadLetterEmailAdmin(OutgoingEmailAdmin):
+    list_display = ("subject", "recipient", "attempts", "last_error", "updated_at")
+    list_filter = ("updated_at", "created_at")
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .filter(status=OutgoingEmail.EmailStatus.FAILED.value)
+        )
+
+
+@admin.register(ImageVariants)
+class ImageVariantsAdmin(ModelAdmin):
+    list_display = ("source", "status", "updated_at", "created_at")
+    list_filter = ("status", "created_at")
+    search_fields = ("source",)
+    ordering = ("-created_at",)
+    actions = ("regenerate",)
+    fieldsets = (
+        (None, {"fields": ("source", "status", "variants", "last_error")}),
+        (_("Timestamps"), {"fields": ("updated_at", "created_at")}),
+    )
+    readonly_fields = ("source", "variants", "last_error", "updated_at", "created_at")
+
+    @admin.action(description=_("Regenerate selected variants"))
+    def regenerate(self, request, queryset):
+        updated = queryset.update(status=ImageVariants.VariantsStatus.PENDING.value)
+        self.message_user(request, _("%d images queued.") % updated)
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(ModelAdmin):
+    list_display = ("__str__", "status", "requested_by", "download", "created_at")
+    list_filter = ("status", "format", "created_at")
+    ordering = ("-created_at",)
+    fieldsets = (
+        (None, {"fields": ("model", "format", "status", "file", "last_error")}),
+        (_("Request"), {"fields": ("requested_by", "filters", "selected")}),
+        (_("Timestamps"), {"fields": ("updated_at", "created_at")}),
+    )
+    readonly_fields = (
+        "model",
+        "format",
+        "status",
+        "file",
+        "last_error",
+        "requested_by",
+        "filters",
+        "selected",
+        "updated_at",
+        "created_at",
+    )
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).select_related("requested_by")
+        # Exports carry whatever their requester could see
+        if not request.user.is_superuser:
+            queryset = queryset.filter(requested_by=request.user)
+        return queryset
+
+    def get_urls(self):
+        return [
+            path(
+                "<path:object_id>/download/",
+                self.admin_site.admin_view(self.download_view),
+                name="external_exportjob_download",
+            ),
+        ] + super().get_urls()
+
+    def download_view(self, request, object_id):
+        job = self.get_object(request, object_id)
+        if job is None or not job.file:
+            raise Http404
+        if not self.has_view_permission(request, job):
+            raise PermissionDenied
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=job.file.name.rsplit("/", 1)[-1],
+        )
+
+    def download(self, obj: ExportJob) -> str:
+        if obj.status != ExportJob.ExportStatus.READY.value or not obj.file:
+            return "-"
+        return format_html(
+            '<a href="{}">{}</a>',
+            reverse("admin:external_exportjob_download", args=[obj.pk]),
+            _("Download"),
+        )
+
+    download.short_description = _("File")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ExternalConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "external"
+
+    def ready(self):
+        import external.signals
@@ -0,0 +1,357 @@
+"""Load test of the API driving a weighted mix of client scenarios.
+
+Run it against a disposable database. Benchmark users are created in it, and
+the orders and emails they produce are removed afterwards unless asked to keep.
+Rate limits apply to its clients too; set the `RATE_LIMIT_*` settings to 0 when
+measuring raw capacity.
+"""
+
+import asyncio
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+import httpx
+from PIL import Image
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from users.models import CustomUser
+from tailoring.models import Service, Order
+from external.models import About, OutgoingEmail
+
+benchmark_email_domain = "benchmark.localhost"
+
+benchmark_password = "Benchmark_123"
+
+default_mix = "landing=50,list-orders=25,login=15,place-order=10"
+
+
+class Recorder:
+    """Collects response times in seconds per endpoint"""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+        self.active = False
+
+    async def request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs):
+        name = f"{method} {url}"
+        start_time = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        duration = time.perf_counter() - start_time
+        if not self.active:
+            return
+        if failed:
+            self.errors[name] = self.errors.get(name, 0) + 1
+        else:
+            self.samples.setdefault(name, []).append(duration)
+
+
+def summarize(durations: list[float], errors: int, elapsed: float) -> dict:
+    summary = dict(
+        requests=len(durations) + errors,
+        errors=errors,
+        rps=round((len(durations) + errors) / elapsed, 2),
+    )
+    if len(durations) > 1:
+        percentiles = statistics.quantiles(durations, n=100, method="inclusive")
+        summary.update(
+            mean_ms=round(statistics.fmean(durations) * 1000, 2),
+            p50_ms=round(percentiles[49] * 1000, 2),
+            p95_ms=round(percentiles[94] * 1000, 2),
+            p99_ms=round(percentiles[98] * 1000, 2),
+            max_ms=round(max(durations) * 1000, 2),
+        )
+    return summary
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for entry in value.split(","):
+        name, _, weight = entry.partition("=")
+        if name.strip() not in scenarios:
+            raise CommandError(
+                f"Unknown scenario '{name.strip()}'. Choose from {', '.join(scenarios)}"
+            )
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_reference_image(size: int) -> bytes:
+    # Noise compresses about as badly as a photo
+    image = Image.effect_noise((size, size * 3 // 4), 64).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+async def landing(client, recorder, user, context):
+    await recorder.request(client, "GET", "/api/v1/landing")
+
+
+async def list_orders(client, recorder, user, context):
+    await recorder.request(
+        client, "GET", "/api/v1/orders", headers=context["headers"][user.pk]
+    )
+
+
+async def login(client, recorder, user, context):
+    await recorder.request(
+        client,
+        "POST",
+        "/api/v1/token",
+        data={"username": user.username, "password": benchmark_password},
+    )
+
+
+async def place_order(client, recorder, user, context):
+    rng = context["rng"]
+    await recorder.request(
+        client,
+        "POST",
+        "/api/v1/order",
+        headers=context["headers"][user.pk],
+        data={
+            "service_name": rng.choice(context["services"]),
+            "details": "Benchmark order",
+            "material_type": rng.choice(list(Order.MaterialType)).value,
+            "fabric_required": str(rng.random() < 0.5).lower(),
+            "urgency": rng.choice(list(Order.OrderUrgency)).value,
+        },
+        files={"reference_image": ("reference.jpg", context["image"], "image/jpeg")},
+    )
+
+
+scenarios = {
+    "landing": landing,
+    "list-orders": list_orders,
+    "login": login,
+    "place-order": place_order,
+}
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the API with concurrent clients and reports latency percentiles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url",
+            help="Base URL of a running server sharing this database. "
+            "The app is served in-process when omitted",
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=10, help="Simultaneous clients"
+        )
+        parser.add_argument(
+            "--duration", type=float, default=30, help="Seconds to measure for"
+        )
+        parser.add_argument(
+            "--warmup",
+            type=float,
+            default=3,
+            help="Seconds of load before measuring starts",
+        )
+        parser.add_argument(
+            "--mix",
+            default=default_mix,
+            help=f"Scenario weights, defaults to '{default_mix}'",
+        )
+        parser.add_argument(
+            "--users", type=int, default=20, help="Benchmark users to spread load over"
+        )
+        parser.add_argument(
+            "--image-size",
+            type=int,
+            default=1600,
+            help="Width in pixels of the uploaded reference image",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed of the scenario choices"
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Results file, defaults to files/benchmarks/<time>-<commit>.json",
+        )
+        parser.add_argument(
+            "--compare", type=Path, help="Earlier results file to compare against"
+        )
+        parser.add_argument(
+            "--keep-data",
+            action="store_true",
+            help="Keep the orders and emails created by benchmark users",
+        )
+
+    def handle(self, *args, **options):
+        mix = parse_mix(options["mix"])
+        users = self.ensure_users(options["users"])
+        self.ensure_site_content()
+        context = dict(
+            headers={
+                user.pk: {"Authorization": f"Bearer {user.token}"} for user in users
+            },
+            services=list(Service.objects.values_list("name", flat=True)),
+            image=make_reference_image(options["image_size"]),
+        )
+        started_at = timezone.now()
+        try:
+            recorder, elapsed = asyncio.run(self.run_load(options, mix, users, context))
+        finally:
+            if not options["keep_data"]:
+                self.remove_data(started_at)
+
+        endpoints = {
+            name: summarize(
+                recorder.samples.get(name, []), recorder.errors.get(name, 0), elapsed
+            )
+            for name in sorted(set(recorder.samples) | set(recorder.errors))
+        }
+        results = dict(
+            started_at=started_at.isoformat(),
+            commit=get_commit(),
+            target=options["url"] or "in-process",
+            database=connection.vendor,
+            python=platform.python_version(),
+            concurrency=options["concurrency"],
+            duration=round(elapsed, 2),
+            mix=mix,
+            seed=options["seed"],
+            endpoints=endpoints,
+            total=summarize(
+                [d for samples in recorder.samples.values() for d in samples],
+                sum(recorder.errors.values()),
+                elapsed,
+            ),
+        )
+        output = options["output"] or (
+            settings.BASE_DIR
+            / "files"
+            / "benchmarks"
+            / f"{started_at:%Y%m%d-%H%M%S}-{results['commit'] or 'unknown'}.json"
+        )
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        self.report(results)
+        if options["compare"]:
+            self.compare(results, json.loads(options["compare"].read_text()))
+        self.stdout.write(f"Results saved to {output}")
+
+    async def run_load(self, options, mix, users, context):
+        if options["url"]:
+            transport = None
+            base_url = options["url"]
+        else:
+            from api import app
+            from api.db import configure_threadpool
+
+            configure_threadpool()
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            base_url = "http://benchmark"
+
+        recorder = Recorder()
+        loop = asyncio.get_running_loop()
+        measure_from = loop.time() + options["warmup"]
+        deadline = measure_from + options["duration"]
+
+        async def client_loop(index: int):
+            rng = random.Random(options["seed"] + index)
+            client_context = context | {"rng": rng}
+            names, weights = list(mix), list(mix.values())
+            async with httpx.AsyncClient(
+                transport=transport, base_url=base_url, timeout=30
+            ) as client:
+                while loop.time() < deadline:
+                    scenario = scenarios[rng.choices(names, weights)[0]]
+                    await scenario(client, recorder, rng.choice(users), client_context)
+
+        async def start_measuring():
+            await asyncio.sleep(options["warmup"])
+            recorder.active = True
+
+        await asyncio.gather(
+            start_measuring(),
+            *(client_loop(index) for index in range(options["concurrency"])),
+        )
+        return recorder, loop.time() - measure_from
+
+    def ensure_users(self, count: int) -> list[CustomUser]:
+        from api.v1.utils import generate_token
+
+        password = make_password(benchmark_password)
+        users = []
+        for index in range(count):
+            user, created = CustomUser.objects.get_or_create(
+                username=f"benchmark_{index}",
+                defaults=dict(
+                    email=f"benchmark_{index}@{benchmark_email_domain}",
+                    password=password,
+                    token=generate_token(),
+                ),
+            )
+            users.append(user)
+        return users
+
+    def ensure_site_content(self):
+        if not About.objects.exists():
+            About.objects.create()
+        existing = set(Service.objects.values_list("name", flat=True))
+        for name in Service.ServiceName:
+            if name.value not in existing:
+                Service.objects.create(name=name.value, description=name.value)
+
+    def remove_data(self, since):
+        # One by one so that reference images leave storage too
+        for order in Order.objects.filter(
+            client__email__endswith=f"@{benchmark_email_domain}",
+            created_at__gte=since,
+        ).iterator():
+            order.delete()
+        OutgoingEmail.objects.filter(
+            recipient__endswith=f"@{benchmark_email_domain}"
+        ).delete()
+
+    def report(self, results: dict):
+        columns = ("requests", "errors", "rps", "p50_ms", "p95_ms", "p99_ms")
+        self.stdout.write(f"{'endpoint':<28}" + "".join(f"{c:>10}" for c in columns))
+        rows = list(results["endpoints"].items()) + [("total", results["total"])]
+        for name, summary in rows:
+            self.stdout.write(
+                f"{name:<28}"
+                + "".join(f"{summary.get(column, '-'):>10}" for column in columns)
+            )
+
+    def compare(self, results: dict, baseline: dict):
+        self.stdout.write(f"Compared with {baseline.get('commit')}:")
+        for name, summary in results["endpoints"].items():
+            previous = baseline["endpoints"].get(name)
+            if not previous or "p95_ms" not in summary or "p95_ms" not in previous:
+                continue
+            self.stdout.write(
+                f"{name:<28} p95 {previous['p95_ms']} -> {summary['p95_ms']} ms, "
+                f"rps {previous['rps']} -> {summary['rps']}"
+            )
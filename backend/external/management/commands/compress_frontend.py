@@ -0,0 +1,59 @@
+import gzip
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+try:
+    import brotli
+except ImportError:
+    # Only gzip variants are produced then
+    brotli = None
+
+compressible_suffixes = (
+    ".html",
+    ".js",
+    ".mjs",
+    ".css",
+    ".svg",
+    ".json",
+    ".txt",
+    ".map",
+)
+
+
+class Command(BaseCommand):
+    help = "Writes gzip & brotli variants of the built frontend files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-size",
+            type=int,
+            default=1024,
+            help="Skip files smaller than this many bytes",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.FRONTEND_DIR:
+            self.stdout.write("FRONTEND_DIR is not set")
+            return
+        if brotli is None:
+            self.stdout.write("brotli is not installed, writing gzip variants only")
+        written = 0
+        for source in settings.FRONTEND_DIR.rglob("*"):
+            if (
+                not source.is_file()
+                or source.suffix not in compressible_suffixes
+                or source.stat().st_size < options["min_size"]
+            ):
+                continue
+            content = source.read_bytes()
+            variants = {".gz": lambda: gzip.compress(content, compresslevel=9)}
+            if brotli is not None:
+                variants[".br"] = lambda: brotli.compress(content)
+            for suffix, compress in variants.items():
+                target = source.with_name(source.name + suffix)
+                if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+                    continue
+                target.write_bytes(compress())
+                written += 1
+        self.stdout.write(f"Wrote {written} compressed files")
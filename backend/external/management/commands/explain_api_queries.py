@@ -0,0 +1,190 @@
+"""Checks that the queries behind the v1 endpoints are served by indexes.
+
+Keep `api_queries` in step with `api.v1.routes`. Run it against the production
+engine too: SQLite can't use an index for the bare boolean terms Django renders
+there, so the scans of the queries filtering first on a flag are let through on
+SQLite only.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import F, Q, QuerySet, Subquery
+from users.models import CustomUser, UserMeasurements, AuthToken
+from external.models import About, Message, FAQ, ServiceFeedback, ImageVariants
+from tailoring.models import Service, Order
+
+
+def api_queries() -> list[tuple[str, QuerySet, bool]]:
+    """Querysets as issued by the endpoints, filled with placeholder values.
+
+    Returns:
+        list: [(description, queryset, full scan allowed)]
+    """
+    user_id = order_id = 0
+    value = "placeholder"
+    # Indexes of these queries lead with a flag, which SQLite scans instead
+    flag_filtered = connection.vendor == "sqlite"
+    cursor = Order.objects.filter(pk=order_id, client_id=user_id).values("created_at")
+    return [
+        ("Token user lookup", CustomUser.objects.filter(token=value), False),
+        ("POST /token", CustomUser.objects.filter(username=value), False),
+        (
+            "GET /password/send-reset-token",
+            CustomUser.objects.filter(Q(username=value) | Q(email=value)),
+            False,
+        ),
+        (
+            "GET /password/send-reset-token (token)",
+            AuthToken.objects.filter(user_id=user_id),
+            False,
+        ),
+        ("POST /password/reset", AuthToken.objects.filter(token=value), False),
+        (
+            "GET /measurements",
+            UserMeasurements.objects.filter(user_id=user_id),
+            False,
+        ),
+        (
+            "GET /orders",
+            Order.objects.filter(client_id=user_id)
+            .order_by("-created_at", "-id")
+            .values(
+                "id", "quantity", "charges", "status", service_name=F("service__name")
+            )[:100],
+            False,
+        ),
+        (
+            "GET /orders?after=",
+            Order.objects.filter(client_id=user_id)
+            .filter(
+                Q(created_at__lt=Subquery(cursor))
+                | Q(created_at=Subquery(cursor), id__lt=order_id)
+            )
+            .order_by("-created_at", "-id")[:100],
+            False,
+        ),
+        (
+            "GET /order/{id}",
+            Order.objects.select_related("service").filter(
+                pk=order_id, client_id=user_id
+            ),
+            False,
+        ),
+        ("GET /user/exists", CustomUser.objects.filter(username=value), False),
+        # Single row table
+        ("GET /about", About.objects.order_by("pk")[:1], True),
+        # Bounded by the number of service types
+        ("GET /services-offered", Service.objects.order_by("created_at")[:15], True),
+        (
+            "GET /latest-work",
+            Order.objects.filter(
+                status=Order.OrderStatus.COMPLETED.value, show_in_index=True
+            ).order_by("-created_at")[:15],
+            False,
+        ),
+        (
+            "GET /latest-work/{id}",
+            Order.objects.filter(
+                pk=order_id,
+                show_in_index=True,
+                status=Order.OrderStatus.COMPLETED.value,
+            ),
+            False,
+        ),
+        (
+            "GET /feedbacks",
+            ServiceFeedback.objects.select_related("sender")
+            .filter(show_in_index=True)
+            .order_by("-created_at")[:6],
+            flag_filtered,
+        ),
+        (
+            "GET /faqs",
+            FAQ.objects.filter(is_shown=True).order_by("created_at")[:10],
+            flag_filtered,
+        ),
+        (
+            "Image srcsets",
+            ImageVariants.objects.filter(
+                source__in=[value], status=ImageVariants.VariantsStatus.READY.value
+            ),
+            False,
+        ),
+        (
+            "Unread messages",
+            Message.objects.filter(is_read=False).order_by("created_at"),
+            flag_filtered,
+        ),
+    ]
+
+
+def find_full_scans(plan: str) -> list[str]:
+    """Names of tables read in full according to `plan`"""
+    if connection.vendor == "sqlite":
+        # Index backed scans read as "SCAN table USING [COVERING] INDEX name"
+        return [
+            line.split("SCAN ", 1)[1].split()[0]
+            for line in plan.splitlines()
+            if "SCAN " in line and "USING" not in line and "CONSTANT ROW" not in line
+        ]
+    elif connection.vendor == "mysql":
+        tables = []
+
+        def walk(node):
+            if isinstance(node, dict):
+                if node.get("access_type") == "ALL":
+                    tables.append(node.get("table_name"))
+                for child in node.values():
+                    walk(child)
+            elif isinstance(node, list):
+                for child in node:
+                    walk(child)
+
+        walk(json.loads(plan))
+        return tables
+    elif connection.vendor == "postgresql":
+        return [
+            line.split("Seq Scan on ", 1)[1].split()[0]
+            for line in plan.splitlines()
+            if "Seq Scan on " in line
+        ]
+    raise CommandError(f"EXPLAIN output of {connection.vendor} is not supported")
+
+
+class Command(BaseCommand):
+    help = "Runs EXPLAIN on the v1 endpoint queries and fails on full table scans"
+
+    def handle(self, *args, **options):
+        explain_options = {}
+        if connection.vendor == "mysql":
+            explain_options["format"] = "json"
+        elif connection.vendor == "postgresql":
+            # Small tables are cheaper to scan, only fall back when no index fits
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = off")
+        offenders = []
+        for description, queryset, allowed in api_queries():
+            plan = queryset.explain(**explain_options)
+            full_scans = find_full_scans(plan)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{description}\n{plan}\n")
+            if full_scans and not allowed:
+                offenders.append(f"{description}: {', '.join(full_scans)}")
+                self.stdout.write(
+                    self.style.ERROR(f"{description} scans {', '.join(full_scans)}")
+                )
+            elif full_scans:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{description} scans {', '.join(full_scans)}, allowed"
+                    )
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS(f"{description} OK"))
+        if offenders:
+            raise CommandError(
+                f"{len(offenders)} queries use full table scans:\n"
+                + "\n".join(offenders)
+            )
@@ -0,0 +1,81 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from external.models import ImageVariants
+from external.signals import image_fields
+from tailoring_ms.images import generate_variants
+
+
+class Command(BaseCommand):
+    help = "Generates resized WebP/JPEG variants of uploaded images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.IMAGE_VARIANT_BATCH_SIZE,
+            help="Maximum images processed per batch",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.IMAGE_VARIANT_POLL_INTERVAL,
+            help="Seconds to wait between polls when there is nothing to process",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the pending images then exit instead of polling forever",
+        )
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="Queue every image already referenced in the database first",
+        )
+
+    def handle(self, *args, **options):
+        if options["backfill"]:
+            self.backfill()
+        try:
+            while True:
+                if self.process_batch(options["batch_size"]):
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+    def backfill(self):
+        for model, fields in image_fields.items():
+            for names in (
+                model.objects.order_by().values_list(*fields).iterator(chunk_size=2000)
+            ):
+                ImageVariants.queue(*names)
+        self.stdout.write("Queued existing images")
+
+    def process_batch(self, batch_size: int) -> int:
+        """Generates variants for one batch and returns how many were processed"""
+        with transaction.atomic():
+            batch = list(
+                ImageVariants.objects.select_for_update(skip_locked=True)
+                .filter(status=ImageVariants.VariantsStatus.PENDING.value)
+                .order_by("created_at")[:batch_size]
+            )
+            for image in batch:
+                try:
+                    image.variants = generate_variants(image.source)
+                except Exception as e:
+                    image.status = ImageVariants.VariantsStatus.FAILED.value
+                    image.last_error = f"{e.__class__.__name__}: {e}"
+                else:
+                    image.status = ImageVariants.VariantsStatus.READY.value
+                    image.last_error = None
+            ImageVariants.objects.bulk_update(
+                batch, ["variants", "status", "last_error"]
+            )
+        if batch:
+            self.stdout.write(f"Processed {len(batch)} images")
+        return len(batch)
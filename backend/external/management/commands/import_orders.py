@@ -0,0 +1,124 @@
+"""Bulk import of orders, e.g. when migrating from another system.
+
+The file is validated and written a chunk at a time, each chunk in its own
+transaction, with progress reported after every chunk. Clients are not
+emailed about imported orders. Timestamps given in the file are kept.
+"""
+
+import time
+from pathlib import Path
+
+import tablib
+from django.core.management.base import BaseCommand, CommandError
+from import_export.formats import base_formats
+from tailoring.models import Order
+from tailoring.resources import BulkOrderResource
+from tailoring_ms.utils import explicit_timestamps
+
+file_formats = {
+    "csv": base_formats.CSV,
+    "xlsx": base_formats.XLSX,
+    "json": base_formats.JSON,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports orders in bulk from a CSV, XLSX or JSON file without emailing clients"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "file", type=Path, help="File in the format of the admin's order export"
+        )
+        parser.add_argument(
+            "--format",
+            choices=file_formats,
+            help="File format, guessed from the file extension when omitted",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10_000,
+            help="Rows validated and committed per transaction",
+        )
+        parser.add_argument(
+            "--start-row",
+            type=int,
+            default=1,
+            help="First row to import, to resume an interrupted import",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row then roll back",
+        )
+        parser.add_argument(
+            "--max-errors",
+            type=int,
+            default=20,
+            help="Invalid rows listed in the report",
+        )
+
+    def handle(self, *args, **options):
+        dataset = self.load(options["file"], options["format"])
+        total = len(dataset)
+        chunk_size = options["chunk_size"]
+        resource = BulkOrderResource()
+        counts = dict(new=0, update=0, skip=0, invalid=0)
+        invalid_rows = []
+        first = options["start_row"] - 1
+        start_time = time.perf_counter()
+
+        with explicit_timestamps(Order):
+            for start in range(first, total, chunk_size):
+                chunk = tablib.Dataset(
+                    *dataset[start : start + chunk_size], headers=dataset.headers
+                )
+                result = resource.import_data(
+                    chunk, dry_run=options["dry_run"], use_transactions=True
+                )
+                if result.has_errors():
+                    errors = [str(error.error) for error in result.base_errors] + [
+                        str(error.error)
+                        for _, row_errors in result.row_errors()
+                        for error in row_errors
+                    ]
+                    raise CommandError(
+                        f"Rows {start + 1}-{start + len(chunk)} were rolled back "
+                        f"({errors[0]}). Fix the file then resume with "
+                        f"--start-row {start + 1}"
+                    )
+                for key in counts:
+                    counts[key] += result.totals[key]
+                invalid_rows.extend(
+                    (start + row.number, row.error_dict)
+                    for row in result.invalid_rows[: options["max_errors"]]
+                )
+                done = start + len(chunk)
+                self.stdout.write(
+                    f"{done}/{total} rows: {counts['new']} new, "
+                    f"{counts['update']} updated, {counts['invalid']} invalid "
+                    f"({(done - first) / (time.perf_counter() - start_time):.0f} rows/s)"
+                )
+
+        for number, errors in invalid_rows[: options["max_errors"]]:
+            self.stderr.write(f"Row {number}: {errors}")
+        message = (
+            "Dry run, nothing was saved"
+            if options["dry_run"]
+            else f"Imported {counts['new'] + counts['update']} orders"
+        )
+        self.stdout.write(self.style.SUCCESS(message))
+
+    def load(self, path: Path, format: str | None) -> tablib.Dataset:
+        format = format or path.suffix.lstrip(".").lower()
+        if format not in file_formats:
+            raise CommandError(
+                f"Unsupported format '{format}', choose from {', '.join(file_formats)}"
+            )
+        file_format = file_formats[format]()
+        mode = "rb" if file_format.is_binary() else "r"
+        encoding = None if file_format.is_binary() else "utf-8-sig"
+        with open(path, mode, encoding=encoding) as file:
+            return file_format.create_dataset(file.read())
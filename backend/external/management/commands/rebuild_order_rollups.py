@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from django.utils import timezone
+from tailoring.models import Order, OrderRollup
+
+
+class Command(BaseCommand):
+    help = "Recomputes the daily order rollups from the orders"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            help="First day to rebuild (YYYY-MM-DD), defaults to the oldest order",
+        )
+        parser.add_argument(
+            "--until",
+            type=date.fromisoformat,
+            help="Last day to rebuild (YYYY-MM-DD), defaults to today",
+        )
+        parser.add_argument(
+            "--window",
+            type=int,
+            default=31,
+            help="Days rebuilt per transaction",
+        )
+
+    def handle(self, *args, **options):
+        bounds = Order.objects.aggregate(
+            oldest=Min("created_at"), newest=Max("created_at")
+        )
+        if bounds["oldest"] is None and options["since"] is None:
+            self.stdout.write("There are no orders")
+            return
+        start = options["since"] or timezone.localdate(bounds["oldest"])
+        end = options["until"] or max(
+            timezone.localdate(), timezone.localdate(bounds["newest"] or start)
+        )
+        if start > end:
+            raise CommandError("--since must not be after --until")
+
+        written = 0
+        while start <= end:
+            window_end = min(start + timedelta(days=options["window"] - 1), end)
+            written += OrderRollup.rebuild(start, window_end)
+            self.stdout.write(f"Rebuilt {start} to {window_end}")
+            start = window_end + timedelta(days=1)
+        self.stdout.write(self.style.SUCCESS(f"{written} rollups written"))
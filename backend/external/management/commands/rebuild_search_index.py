@@ -0,0 +1,32 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from tailoring_ms import search
+
+
+class Command(BaseCommand):
+    help = "Recreates the full-text search index from the indexed models' rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            choices=list(search.indexed_fields),
+            metavar="model",
+            help=f"Models to reindex, defaults to all of "
+            f"{', '.join(search.indexed_fields)}",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Rows indexed per query, defaults to EXPORT_CHUNK_SIZE",
+        )
+
+    def handle(self, *args, **options):
+        search.backend.setup()
+        for label in options["models"] or search.indexed_fields:
+            model = apps.get_model(label)
+            # Searches miss the rows not reindexed yet meanwhile
+            search.backend.clear(model)
+            indexed = search.index_queryset(model.objects.all(), options["chunk_size"])
+            self.stdout.write(f"{indexed} {model._meta.verbose_name_plural} indexed")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt"))
@@ -0,0 +1,60 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from external.models import ExportJob
+
+
+class Command(BaseCommand):
+    help = "Writes admin exports queued to run in the background"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.EXPORT_POLL_INTERVAL,
+            help="Seconds to wait between polls when there is nothing to export",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the pending exports then exit instead of polling forever",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                if self.process_job():
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+    def process_job(self) -> bool:
+        """Writes the oldest pending export and returns whether there was one"""
+        with transaction.atomic():
+            job = (
+                ExportJob.objects.select_for_update(skip_locked=True)
+                .filter(status=ExportJob.ExportStatus.PENDING.value)
+                .order_by("created_at")
+                .first()
+            )
+            if job is None:
+                return False
+            job.status = ExportJob.ExportStatus.RUNNING.value
+            job.save(update_fields=["status", "updated_at"])
+        # Outside the transaction so that the export does not hold the row lock
+        try:
+            job.write()
+        except Exception as e:
+            job.status = ExportJob.ExportStatus.FAILED.value
+            job.last_error = f"{e.__class__.__name__}: {e}"
+        else:
+            job.status = ExportJob.ExportStatus.READY.value
+            job.last_error = None
+        job.save(update_fields=["status", "file", "last_error", "updated_at"])
+        self.stdout.write(f"Export #{job.pk} {job.status.lower()}")
+        return True
@@ -0,0 +1,390 @@
+"""Bulk generation of realistic looking clients, orders, feedbacks & messages.
+
+Rows are written with `bulk_create` a chunk at a time, so memory use does not
+grow with the row count. `Order.save` is bypassed along with the emails it
+sends; notification flags are set to match each order's status instead, and
+the order rollups of the seeded days are rebuilt and the seeded rows added to
+the search index at the end.
+
+Every date is derived from `--now` rather than the current time, so the same
+seed generates the same data whenever it is run.
+"""
+
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from users.models import CustomUser, UserMeasurements
+from tailoring.models import Service, Order, OrderRollup
+from external.models import Message, ServiceFeedback
+from tailoring_ms.utils import explicit_timestamps
+from tailoring_ms import search
+
+seed_password = "Synthetic_123"
+
+# Time the data is generated as of, by default
+default_now = "2025-01-01T00:00:00+00:00"
+
+
+def aware_datetime(value: str) -> datetime:
+    moment = datetime.fromisoformat(value)
+    return moment if timezone.is_aware(moment) else timezone.make_aware(moment)
+
+
+first_names = (
+    "Achieng Amani Baraka Chebet Faith Grace Imani Jabari Kamau Kendi Kiprop "
+    "Makena Mercy Mwangi Njeri Otieno Wanjiru Wekesa Zawadi Brian Kevin Joy"
+).split()
+
+last_names = (
+    "Kamau Otieno Mwangi Wanjiku Kiptoo Njoroge Ochieng Mutua Wambui Kariuki "
+    "Akinyi Omondi Chege Nyambura Kirui Barasa Gitau Muthoni Odhiambo Korir"
+).split()
+
+# Service name : base charge per unit in Ksh
+service_charges = {
+    Service.ServiceName.CUSTOM_SUITS.value: 15000,
+    Service.ServiceName.WEDDING_ATTIRE.value: 30000,
+    Service.ServiceName.ALTERATIONS.value: 800,
+    Service.ServiceName.EMBROIDERY.value: 2500,
+    Service.ServiceName.UNIFORMS.value: 1500,
+    Service.ServiceName.OTHER.value: 3000,
+}
+
+service_weights = (20, 8, 35, 10, 17, 10)
+
+material_weights = (40, 10, 15, 20, 10, 5)
+
+urgency_weights = (30, 50, 20)
+
+# Mean, standard deviation in inches
+measurement_distributions = dict(
+    chest=(38, 4),
+    waist=(33, 4),
+    hips=(39, 4),
+    inseam=(30, 2.5),
+    neck=(15, 1.2),
+    sleeve_length=(24, 1.5),
+    shoulder_width=(17.5, 1.5),
+    thigh=(22, 2.5),
+    calf=(15, 1.5),
+)
+
+feedback_rate_weights = (45, 35, 12, 5, 3)
+
+sender_role_weights = (10, 75, 15)
+
+message_bodies = (
+    "Do you make school uniforms in bulk?",
+    "What are your opening hours over the holidays?",
+    "I would like to book a fitting for a wedding suit.",
+    "How long does an alteration usually take?",
+    "Can you embroider a logo on company shirts?",
+)
+
+
+class Command(BaseCommand):
+    help = "Generates large volumes of synthetic users, orders, feedbacks & messages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=1000, help="Client accounts to create"
+        )
+        parser.add_argument(
+            "--orders-per-user",
+            type=float,
+            default=3,
+            help="Average orders placed by each client",
+        )
+        parser.add_argument(
+            "--measurements-ratio",
+            type=float,
+            default=0.6,
+            help="Share of clients with saved measurements",
+        )
+        parser.add_argument(
+            "--feedback-ratio",
+            type=float,
+            default=0.05,
+            help="Share of clients with completed orders who leave feedback",
+        )
+        parser.add_argument(
+            "--messages", type=int, default=None, help="Defaults to users / 20"
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=730,
+            help="How far back in time the data spreads",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=2000, help="Rows per bulk insert"
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Same seed, same generated data"
+        )
+        parser.add_argument(
+            "--now",
+            type=aware_datetime,
+            default=default_now,
+            help="ISO 8601 time the data is generated as of, the latest it spreads to",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="client_",
+            help="Username prefix, has to be unused",
+        )
+
+    def handle(self, *args, **options):
+        if CustomUser.objects.filter(username__startswith=options["prefix"]).exists():
+            raise CommandError(
+                f"Users prefixed '{options['prefix']}' exist already. Use another --prefix"
+            )
+        self.rng = random.Random(options["seed"])
+        self.now = options["now"]
+        self.days = options["days"]
+        self.batch_size = options["batch_size"]
+        # Fixed salt, as long as a random one, so the hashes don't vary either
+        self.password = make_password(
+            seed_password, salt=f"synthetic{options['seed']:0>14}"
+        )
+        self.services = self.ensure_services()
+        self.service_names = {id: name for name, id in self.services.items()}
+
+        messages = options["messages"]
+        if messages is None:
+            messages = options["users"] // 20
+
+        indexed_models = (CustomUser, Order, ServiceFeedback, Message)
+        last_pks = {
+            model: model.objects.aggregate(last_pk=Max("pk"))["last_pk"] or 0
+            for model in indexed_models
+        }
+
+        with explicit_timestamps(Order, UserMeasurements, ServiceFeedback, Message):
+            self.counts = dict.fromkeys(
+                ("users", "measurements", "orders", "feedbacks", "messages"), 0
+            )
+            for start in range(0, options["users"], self.batch_size):
+                size = min(self.batch_size, options["users"] - start)
+                self.create_user_chunk(start, size, options)
+                self.stdout.write(
+                    f"{self.counts['users']}/{options['users']} users, "
+                    f"{self.counts['orders']} orders"
+                )
+            for start in range(0, messages, self.batch_size):
+                self.create_messages(min(self.batch_size, messages - start))
+
+        OrderRollup.rebuild(
+            timezone.localdate(self.now - timedelta(days=self.days)),
+            timezone.localdate(self.now),
+        )
+        for model in indexed_models:
+            search.index_queryset(model.objects.filter(pk__gt=last_pks[model]))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                ", ".join(f"{count} {name}" for name, count in self.counts.items())
+            )
+        )
+
+    def ensure_services(self) -> dict[str, int]:
+        existing = dict(Service.objects.values_list("name", "id"))
+        for name in Service.ServiceName:
+            if name.value not in existing:
+                existing[name.value] = Service.objects.create(
+                    name=name.value, description=name.value
+                ).id
+        return existing
+
+    def past_datetime(self, after=None):
+        """Skewed towards the present, as business grows"""
+        oldest = self.now - timedelta(days=self.days)
+        if after is not None and after > oldest:
+            oldest = after
+        return self.now - (self.now - oldest) * (self.rng.random() ** 1.5)
+
+    @transaction.atomic
+    def create_user_chunk(self, start: int, size: int, options: dict):
+        rng = self.rng
+        users = []
+        for index in range(start, start + size):
+            first_name, last_name = rng.choice(first_names), rng.choice(last_names)
+            username = f"{options['prefix']}{index}"
+            users.append(
+                CustomUser(
+                    username=username,
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=f"{username}@example.com",
+                    password=self.password,
+                    gender=rng.choice(list(CustomUser.UserGender)).value,
+                    date_of_birth=timezone.localdate(self.now)
+                    - timedelta(days=rng.randint(18 * 365, 70 * 365)),
+                    phone_number=f"07{rng.randint(10000000, 99999999)}",
+                    date_joined=self.past_datetime(),
+                )
+            )
+        CustomUser.objects.bulk_create(users)
+        if users[0].pk is None:
+            # Backends that don't return inserted ids
+            ids = dict(
+                CustomUser.objects.filter(
+                    username__in=[user.username for user in users]
+                ).values_list("username", "id")
+            )
+            for user in users:
+                user.pk = ids[user.username]
+        self.counts["users"] += size
+
+        measurements, orders, feedbacks = [], [], []
+        for user in users:
+            if rng.random() < options["measurements_ratio"]:
+                measurements.append(self.make_measurements(user))
+            order_count = 0
+            if options["orders_per_user"] > 0:
+                order_count = round(rng.expovariate(1 / options["orders_per_user"]))
+            user_orders = [self.make_order(user) for _ in range(order_count)]
+            orders.extend(user_orders)
+            completed = [
+                order
+                for order in user_orders
+                if order.status == Order.OrderStatus.COMPLETED.value
+            ]
+            if completed and rng.random() < options["feedback_ratio"]:
+                feedbacks.append(self.make_feedback(user, rng.choice(completed)))
+            if len(orders) >= self.batch_size:
+                self.counts["orders"] += len(
+                    Order.objects.bulk_create(orders, batch_size=self.batch_size)
+                )
+                orders = []
+        self.counts["orders"] += len(
+            Order.objects.bulk_create(orders, batch_size=self.batch_size)
+        )
+        self.counts["measurements"] += len(
+            UserMeasurements.objects.bulk_create(
+                measurements, batch_size=self.batch_size
+            )
+        )
+        self.counts["feedbacks"] += len(
+            ServiceFeedback.objects.bulk_create(feedbacks, batch_size=self.batch_size)
+        )
+
+    def make_measurements(self, user: CustomUser) -> UserMeasurements:
+        created_at = self.past_datetime(after=user.date_joined)
+        return UserMeasurements(
+            user=user,
+            date_created=created_at,
+            date_updated=created_at,
+            **{
+                name: Decimal(f"{max(self.rng.gauss(mean, deviation), 5):.2f}")
+                for name, (mean, deviation) in measurement_distributions.items()
+            },
+        )
+
+    def make_order(self, user: CustomUser) -> Order:
+        rng = self.rng
+        created_at = self.past_datetime(after=user.date_joined)
+        age = self.now - created_at
+        if age > timedelta(days=60):
+            status = rng.choices(
+                (
+                    Order.OrderStatus.COMPLETED.value,
+                    Order.OrderStatus.CANCELLED.value,
+                    Order.OrderStatus.IN_PROGRESS.value,
+                ),
+                (85, 10, 5),
+            )[0]
+        else:
+            status = rng.choices(
+                [status.value for status in Order.OrderStatus], (35, 35, 25, 5)
+            )[0]
+        service_name = rng.choices(list(service_charges), service_weights)[0]
+        if service_name == Service.ServiceName.UNIFORMS.value:
+            quantity = rng.randint(5, 60)
+        else:
+            quantity = rng.choices((1, 2, 3, 5), (70, 18, 8, 4))[0]
+        charges = None
+        charges_paid = 0
+        if status != Order.OrderStatus.PENDING.value or rng.random() < 0.5:
+            charges = Decimal(
+                round(service_charges[service_name] * quantity * rng.uniform(0.8, 1.5))
+            )
+            if status == Order.OrderStatus.COMPLETED.value:
+                charges_paid = charges
+            elif status == Order.OrderStatus.IN_PROGRESS.value:
+                charges_paid = Decimal(
+                    round(charges * rng.choice((Decimal("0.3"), Decimal("0.5"))))
+                )
+        return Order(
+            client=user,
+            service_id=self.services[service_name],
+            details=f"{service_name} for {user.first_name}",
+            material_type=rng.choices(
+                [material.value for material in Order.MaterialType], material_weights
+            )[0],
+            fabric_required=rng.random() < 0.4,
+            quantity=quantity,
+            urgency=rng.choices(
+                [urgency.value for urgency in Order.OrderUrgency], urgency_weights
+            )[0],
+            charges=charges,
+            charges_paid=charges_paid,
+            status=status,
+            show_in_index=status == Order.OrderStatus.COMPLETED.value
+            and rng.random() < 0.1,
+            # As if the status emails went out already
+            user_is_notified_in_progress=status != Order.OrderStatus.PENDING.value,
+            user_is_notified_completed=status == Order.OrderStatus.COMPLETED.value,
+            user_is_notified_cancelled=status == Order.OrderStatus.CANCELLED.value,
+            created_at=created_at,
+            updated_at=min(created_at + timedelta(days=rng.uniform(0, 30)), self.now),
+        )
+
+    def make_feedback(self, user: CustomUser, order: Order) -> ServiceFeedback:
+        rate = self.rng.choices(
+            [rate.value for rate in ServiceFeedback.FeedbackRate],
+            feedback_rate_weights,
+        )[0]
+        created_at = order.updated_at
+        return ServiceFeedback(
+            sender=user,
+            message=f"{rate} work on my {self.service_names[order.service_id].lower()}.",
+            rate=rate,
+            sender_role=self.rng.choices(
+                [role.value for role in ServiceFeedback.SenderRole],
+                sender_role_weights,
+            )[0],
+            show_in_index=rate
+            in (
+                ServiceFeedback.FeedbackRate.EXCELLENT.value,
+                ServiceFeedback.FeedbackRate.GOOD.value,
+            )
+            and self.rng.random() < 0.05,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+    @transaction.atomic
+    def create_messages(self, size: int):
+        rng = self.rng
+        messages = []
+        for _ in range(size):
+            created_at = self.past_datetime()
+            first_name = rng.choice(first_names)
+            messages.append(
+                Message(
+                    sender=f"{first_name} {rng.choice(last_names)}",
+                    email=f"{first_name.lower()}{rng.randint(1, 9999)}@example.com",
+                    body=rng.choice(message_bodies),
+                    is_read=self.now - created_at > timedelta(days=7)
+                    and rng.random() < 0.95,
+                    created_at=created_at,
+                )
+            )
+        self.counts["messages"] += len(Message.objects.bulk_create(messages))
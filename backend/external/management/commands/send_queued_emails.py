@@ -0,0 +1,114 @@
+import time
+from contextlib import suppress
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from external.models import OutgoingEmail
+
+
+class Command(BaseCommand):
+    help = "Delivers queued emails in batches over a single SMTP connection"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAIL_QUEUE_BATCH_SIZE,
+            help="Maximum emails delivered per batch",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.EMAIL_QUEUE_POLL_INTERVAL,
+            help="Seconds to wait between polls when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the due emails then exit instead of polling forever",
+        )
+
+    def handle(self, *args, **options):
+        connection = get_connection(fail_silently=False)
+        try:
+            while True:
+                delivered = self.send_batch(connection, options["batch_size"])
+                if delivered:
+                    continue
+                if options["once"]:
+                    break
+                # Don't hold an idle SMTP session between polls
+                connection.close()
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            connection.close()
+
+    def send_batch(self, connection, batch_size: int) -> int:
+        """Delivers one batch of due emails and returns how many were processed.
+
+        The emails are claimed and committed before any is sent, so that no
+        transaction stays open while the mail server is waited on. Each outcome
+        is recorded as soon as it is known.
+        """
+        batch = self.claim_batch(batch_size)
+        for email in batch:
+            message = EmailMultiAlternatives(
+                subject=email.subject,
+                body=email.message,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[email.recipient],
+                connection=connection,
+            )
+            if email.html_message:
+                message.attach_alternative(email.html_message, "text/html")
+            try:
+                # Reuses the session when it is already open
+                connection.open()
+                message.send()
+            except Exception as e:
+                email.mark_failed(e)
+                # The session may be unusable after a failure
+                with suppress(Exception):
+                    connection.close()
+            else:
+                email.mark_sent()
+            email.save(
+                update_fields=[
+                    "status",
+                    "attempts",
+                    "last_error",
+                    "send_after",
+                    "sent_at",
+                ]
+            )
+        if batch:
+            sent = sum(
+                email.status == OutgoingEmail.EmailStatus.SENT.value for email in batch
+            )
+            self.stdout.write(f"Delivered {sent}/{len(batch)} emails")
+        return len(batch)
+
+    def claim_batch(self, batch_size: int) -> list[OutgoingEmail]:
+        """Marks due emails as being sent, including those claimed by a worker
+        that died before recording their outcome"""
+        with transaction.atomic():
+            batch = list(
+                OutgoingEmail.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status__in=(
+                        OutgoingEmail.EmailStatus.QUEUED.value,
+                        OutgoingEmail.EmailStatus.SENDING.value,
+                    ),
+                    send_after__lte=timezone.now(),
+                )
+                .order_by("send_after")[:batch_size]
+            )
+            for email in batch:
+                email.mark_sending()
+            OutgoingEmail.objects.bulk_update(batch, ["status", "send_after"])
+        return batch
@@ -0,0 +1,134 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:37
+
+import django.utils.timezone
+import external.models
+import tailoring_ms.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='About',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(default='Tailoring MS', help_text='The brand name', max_length=40)),
+                ('short_name', models.CharField(default='TMS', help_text='Brand abbreviated name', max_length=30)),
+                ('slogan', models.TextField(default='Experience the art of custom tailoring with precision and style.', help_text="Brands's slogan")),
+                ('details', models.TextField(default='Welcome to Tailoring MS. We are committed to providing the best tailoring services.', help_text='Brand details')),
+                ('address', models.CharField(default='123 Fashion Street, Meru - Kenya', help_text='Business address', max_length=200)),
+                ('founded_in', models.DateField(default=django.utils.timezone.now, help_text='Date when the business was founded')),
+                ('email', models.EmailField(blank=True, default='admin@tailorinms.com', help_text="Website's admin email", max_length=50, null=True)),
+                ('phone_number', models.CharField(blank=True, default='0200000000', help_text="Business' hotline number", max_length=50, null=True)),
+                ('facebook', models.URLField(blank=True, default='https://www.facebook.com/', help_text="Business' Facebook profile link", max_length=100, null=True)),
+                ('twitter', models.URLField(blank=True, default='https://www.x.com/', help_text="Business' X (formerly Twitter) profile link", max_length=100, null=True)),
+                ('linkedin', models.URLField(blank=True, default='https://www.linkedin.com/', help_text="Business' Facebook profile link", max_length=100, null=True)),
+                ('instagram', models.URLField(blank=True, default='https://www.instagram.com/', help_text="Business' Instagram profile link", max_length=100, null=True)),
+                ('tiktok', models.URLField(blank=True, default='https://www.tiktok.com/', help_text="Business' Tiktok profile link", max_length=100, null=True)),
+                ('youtube', models.URLField(blank=True, default='https://www.youtube.com/', help_text="Business' Youtube profile link", max_length=100, null=True)),
+                ('logo', models.ImageField(default='default/logo.png', help_text='Hospital logo  (preferrably 64*64px png)', upload_to=tailoring_ms.utils.generate_document_filepath)),
+                ('wallpaper', models.ImageField(default='default/threads-5547529_1920.jpg', help_text='Hospital wallpaper image', upload_to=tailoring_ms.utils.generate_document_filepath)),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text="The date and time when the business' details was created", verbose_name='Created At')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text='App label and name of the exported model', max_length=100, verbose_name='Model')),
+                ('format', models.CharField(choices=[('csv', 'CSV'), ('jsonl', 'JSONL')], default='csv', help_text='File format', max_length=10, verbose_name='Format')),
+                ('filters', models.TextField(blank=True, help_text='Changelist query string the export was requested with', verbose_name='Filters')),
+                ('selected', models.JSONField(blank=True, help_text='Primary keys of the selected rows, empty for all matching rows', null=True, verbose_name='Selected')),
+                ('status', models.CharField(choices=[('Pending', 'PENDING'), ('Running', 'RUNNING'), ('Ready', 'READY'), ('Failed', 'FAILED')], default='Pending', help_text='Export status', max_length=10, verbose_name='Status')),
+                ('file', models.FileField(blank=True, help_text='Exported rows', null=True, storage=external.models.get_exports_storage, upload_to='%Y/%m', verbose_name='File')),
+                ('last_error', models.TextField(blank=True, help_text='Error raised while exporting', null=True, verbose_name='Last error')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Export job',
+                'verbose_name_plural': 'Export jobs',
+            },
+        ),
+        migrations.CreateModel(
+            name='FAQ',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question', models.CharField(help_text='The question', max_length=100, verbose_name='Question')),
+                ('answer', models.TextField(help_text='Answer to the question', verbose_name='Answer')),
+                ('is_shown', models.BooleanField(default=True, help_text='Show this FAQ in website', verbose_name='Is shown')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date and time when FAQ was received.', verbose_name='Created at')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ImageVariants',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='Path of the original image relative to media root', max_length=255, unique=True, verbose_name='Source')),
+                ('variants', models.JSONField(blank=True, default=dict, help_text='Paths of the resized images keyed by format then width', verbose_name='Variants')),
+                ('status', models.CharField(choices=[('Pending', 'PENDING'), ('Ready', 'READY'), ('Failed', 'FAILED')], default='Pending', help_text='Generation status', max_length=10, verbose_name='Status')),
+                ('last_error', models.TextField(blank=True, help_text='Error raised while generating the variants', null=True, verbose_name='Last error')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Image variants',
+                'verbose_name_plural': 'Image variants',
+            },
+        ),
+        migrations.CreateModel(
+            name='Message',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sender', models.CharField(help_text="Sender's name", max_length=50, verbose_name='Sender')),
+                ('email', models.EmailField(help_text="Sender's email address", max_length=80, verbose_name='Email')),
+                ('body', models.TextField(help_text='Message body', verbose_name='Message')),
+                ('is_read', models.BooleanField(default=False, help_text='Message read status', verbose_name='Is read')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date and time when message was received.', verbose_name='Created at')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(help_text='Email subject', max_length=200, verbose_name='Subject')),
+                ('recipient', models.EmailField(help_text="Recipient's email address", max_length=254, verbose_name='Recipient')),
+                ('message', models.TextField(blank=True, help_text='Plain text body', verbose_name='Message')),
+                ('html_message', models.TextField(blank=True, help_text='HTML body', null=True, verbose_name='HTML message')),
+                ('status', models.CharField(choices=[('Queued', 'QUEUED'), ('Sent', 'SENT'), ('Failed', 'FAILED')], default='Queued', help_text='Delivery status', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Delivery attempts made', verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, help_text='Error raised by the latest failed attempt', null=True, verbose_name='Last error')),
+                ('send_after', models.DateTimeField(default=django.utils.timezone.now, help_text='Earliest date and time for the next delivery attempt', verbose_name='Send after')),
+                ('sent_at', models.DateTimeField(blank=True, help_text='Date and time when the email was delivered', null=True, verbose_name='Sent at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Outgoing email',
+                'verbose_name_plural': 'Outgoing emails',
+            },
+        ),
+        migrations.CreateModel(
+            name='ServiceFeedback',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('message', models.TextField(help_text='Response body')),
+                ('rate', models.CharField(choices=[('Excellent', 'EXCELLENT'), ('Good', 'GOOD'), ('Average', 'AVERAGE'), ('Poor', 'POOR'), ('Terrible', 'TERRIBLE')], help_text='Feedback rating', max_length=15)),
+                ('sender_role', models.CharField(choices=[('Business Executive', 'EXECUTIVE'), ('Regular Client', 'REGULAR_CLIENT'), ('Wedding Client', 'WEDDING_CLIENT')], default='Regular Client', help_text="Sender's role/category", max_length=40)),
+                ('show_in_index', models.BooleanField(default=True, help_text="Display this feedback in website's testimonials section.")),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Feedback',
+                'verbose_name_plural': 'Feedbacks',
+            },
+        ),
+    ]
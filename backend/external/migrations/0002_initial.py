@@ -0,0 +1,65 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('external', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exportjob',
+            name='requested_by',
+            field=models.ForeignKey(help_text='Staff member who requested the export', on_delete=django.db.models.deletion.CASCADE, related_name='export_jobs', to=settings.AUTH_USER_MODEL, verbose_name='Requested by'),
+        ),
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['is_shown', 'created_at'], name='faq_shown_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imagevariants',
+            index=models.Index(fields=['status', 'created_at'], name='external_im_status_0752d6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['is_read', 'created_at'], name='message_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='outgoingemail',
+            index=models.Index(fields=['status', 'send_after'], name='external_ou_status_59c858_idx'),
+        ),
+        migrations.CreateModel(
+            name='DeadLetterEmail',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Dead-letter email',
+                'verbose_name_plural': 'Dead-letter emails',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('external.outgoingemail',),
+        ),
+        migrations.AddField(
+            model_name='servicefeedback',
+            name='sender',
+            field=models.ForeignKey(help_text='Feedback sender', on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='exportjob',
+            index=models.Index(fields=['status', 'created_at'], name='external_ex_status_e34e68_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicefeedback',
+            index=models.Index(fields=['show_in_index', '-created_at'], name='feedback_index_idx'),
+        ),
+    ]
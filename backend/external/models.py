@@ -1,8 +1,19 @@
+import tempfile
+
+from django.apps import apps
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
 from django.db import models
+from django.db.models import QuerySet
+from django.http import HttpRequest, QueryDict
 from django.utils.translation import gettext_lazy as _
 from enum import Enum
 from tailoring_ms.utils import generate_document_filepath, EnumWithChoices
+from tailoring_ms.images import make_srcset
+from tailoring_ms.exports import export_chunks, get_export_filename
 from django.utils import timezone
+from django.conf import settings
+from datetime import timedelta
 
 # Create your models here.
 
@@ -155,6 +166,11 @@ class ServiceFeedback(models.Model):
     class Meta:
         verbose_name = _("Feedback")
         verbose_name_plural = _("Feedbacks")
+        indexes = [
+            models.Index(
+                fields=["show_in_index", "-created_at"], name="feedback_index_idx"
+            )
+        ]
 
     def __str__(self):
         return f"{self.rate} feedback from {self.sender}"
@@ -179,6 +195,11 @@ class Message(models.Model):
         help_text=_("Date and time when message was received."),
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["is_read", "created_at"], name="message_inbox_idx")
+        ]
+
     def __str__(self):
         return f"from {self.sender} at {self.created_at.strftime("%d-%b-%Y %H:%M:%S")}"
 
@@ -199,5 +220,312 @@ class FAQ(models.Model):
         help_text=_("Date and time when FAQ was received."),
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["is_shown", "created_at"], name="faq_shown_idx")
+        ]
+
     def __str__(self):
         return self.question
+
+
+class OutgoingEmail(models.Model):
+    class EmailStatus(EnumWithChoices):
+        QUEUED = "Queued"
+        SENDING = "Sending"
+        SENT = "Sent"
+        FAILED = "Failed"
+
+    subject = models.CharField(
+        verbose_name=_("Subject"), max_length=200, help_text=_("Email subject")
+    )
+    recipient = models.EmailField(
+        verbose_name=_("Recipient"),
+        max_length=254,
+        help_text=_("Recipient's email address"),
+    )
+    message = models.TextField(
+        verbose_name=_("Message"), help_text=_("Plain text body"), blank=True
+    )
+    html_message = models.TextField(
+        verbose_name=_("HTML message"),
+        help_text=_("HTML body"),
+        null=True,
+        blank=True,
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=10,
+        choices=EmailStatus.choices(),
+        default=EmailStatus.QUEUED.value,
+        help_text=_("Delivery status"),
+    )
+    attempts = models.PositiveIntegerField(
+        verbose_name=_("Attempts"), default=0, help_text=_("Delivery attempts made")
+    )
+    last_error = models.TextField(
+        verbose_name=_("Last error"),
+        help_text=_("Error raised by the latest failed attempt"),
+        null=True,
+        blank=True,
+    )
+    send_after = models.DateTimeField(
+        verbose_name=_("Send after"),
+        default=timezone.now,
+        help_text=_(
+            "Earliest date and time for the next delivery attempt, or for retrying "
+            "a claimed email whose outcome was not recorded"
+        ),
+    )
+    sent_at = models.DateTimeField(
+        verbose_name=_("Sent at"),
+        null=True,
+        blank=True,
+        help_text=_("Date and time when the email was delivered"),
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Updated At"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At"),
+    )
+
+    class Meta:
+        verbose_name = _("Outgoing email")
+        verbose_name_plural = _("Outgoing emails")
+        indexes = [models.Index(fields=["status", "send_after"])]
+
+    def __str__(self):
+        return f"{self.subject} to {self.recipient}"
+
+    @classmethod
+    def queue(
+        cls, subject: str, recipient: str, message: str = "", html_message: str = None
+    ) -> "OutgoingEmail":
+        """Stores email for delivery by the `send_queued_emails` worker"""
+        return cls.objects.create(
+            subject=subject,
+            recipient=recipient,
+            message=message,
+            html_message=html_message,
+        )
+
+    def mark_sending(self):
+        """Claims the email for delivery until `EMAIL_QUEUE_CLAIM_TIMEOUT` passes"""
+        self.status = self.EmailStatus.SENDING.value
+        self.send_after = timezone.now() + timedelta(
+            seconds=settings.EMAIL_QUEUE_CLAIM_TIMEOUT
+        )
+
+    def mark_sent(self):
+        self.status = self.EmailStatus.SENT.value
+        self.sent_at = timezone.now()
+        self.last_error = None
+        self.attempts += 1
+
+    def mark_failed(self, error: Exception):
+        """Schedules a retry with exponential backoff or dead-letters the email"""
+        self.attempts += 1
+        self.last_error = f"{error.__class__.__name__}: {error}"
+        if self.attempts >= settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+            self.status = self.EmailStatus.FAILED.value
+        else:
+            self.status = self.EmailStatus.QUEUED.value
+            self.send_after = timezone.now() + timedelta(
+                seconds=settings.EMAIL_QUEUE_RETRY_DELAY * 2 ** (self.attempts - 1)
+            )
+
+
+class DeadLetterEmail(OutgoingEmail):
+    """Emails that exhausted their delivery attempts"""
+
+    class Meta:
+        proxy = True
+        verbose_name = _("Dead-letter email")
+        verbose_name_plural = _("Dead-letter emails")
+
+
+class ImageVariants(models.Model):
+    """Resized copies of an uploaded image, generated by the
+    `generate_image_variants` worker"""
+
+    class VariantsStatus(EnumWithChoices):
+        PENDING = "Pending"
+        READY = "Ready"
+        FAILED = "Failed"
+
+    source = models.CharField(
+        verbose_name=_("Source"),
+        max_length=255,
+        unique=True,
+        help_text=_("Path of the original image relative to media root"),
+    )
+    variants = models.JSONField(
+        verbose_name=_("Variants"),
+        default=dict,
+        blank=True,
+        help_text=_("Paths of the resized images keyed by format then width"),
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=10,
+        choices=VariantsStatus.choices(),
+        default=VariantsStatus.PENDING.value,
+        help_text=_("Generation status"),
+    )
+    last_error = models.TextField(
+        verbose_name=_("Last error"),
+        help_text=_("Error raised while generating the variants"),
+        null=True,
+        blank=True,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Updated At"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At"),
+    )
+
+    class Meta:
+        verbose_name = _("Image variants")
+        verbose_name_plural = _("Image variants")
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return self.source
+
+    @classmethod
+    def queue(cls, *sources: str):
+        """Schedules variant generation for images not seen before"""
+        cls.objects.bulk_create(
+            [cls(source=source) for source in sources if source],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def get_srcsets(cls, *sources: str) -> dict[str, dict[str, str]]:
+        """Maps each source with ready variants to its `srcset` values"""
+        return {
+            source: make_srcset(variants)
+            for source, variants in cls.objects.filter(
+                source__in=[source for source in sources if source],
+                status=cls.VariantsStatus.READY.value,
+            ).values_list("source", "variants")
+        }
+
+
+def get_exports_storage():
+    return FileSystemStorage(location=settings.EXPORT_ROOT)
+
+
+class ExportJob(models.Model):
+    """Admin changelist export written to a file by the `run_export_jobs` worker"""
+
+    class ExportFormat(EnumWithChoices):
+        CSV = "csv"
+        JSONL = "jsonl"
+
+    class ExportStatus(EnumWithChoices):
+        PENDING = "Pending"
+        RUNNING = "Running"
+        READY = "Ready"
+        FAILED = "Failed"
+
+    model = models.CharField(
+        verbose_name=_("Model"),
+        max_length=100,
+        help_text=_("App label and name of the exported model"),
+    )
+    format = models.CharField(
+        verbose_name=_("Format"),
+        max_length=10,
+        choices=ExportFormat.choices(),
+        default=ExportFormat.CSV.value,
+        help_text=_("File format"),
+    )
+    filters = models.TextField(
+        verbose_name=_("Filters"),
+        blank=True,
+        help_text=_("Changelist query string the export was requested with"),
+    )
+    selected = models.JSONField(
+        verbose_name=_("Selected"),
+        null=True,
+        blank=True,
+        help_text=_("Primary keys of the selected rows, empty for all matching rows"),
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        verbose_name=_("Requested by"),
+        related_name="export_jobs",
+        help_text=_("Staff member who requested the export"),
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=10,
+        choices=ExportStatus.choices(),
+        default=ExportStatus.PENDING.value,
+        help_text=_("Export status"),
+    )
+    file = models.FileField(
+        verbose_name=_("File"),
+        storage=get_exports_storage,
+        upload_to="%Y/%m",
+        null=True,
+        blank=True,
+        help_text=_("Exported rows"),
+    )
+    last_error = models.TextField(
+        verbose_name=_("Last error"),
+        help_text=_("Error raised while exporting"),
+        null=True,
+        blank=True,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Updated At"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At"),
+    )
+
+    class Meta:
+        verbose_name = _("Export job")
+        verbose_name_plural = _("Export jobs")
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"{self.model} {self.format} export #{self.pk}"
+
+    def get_source(self) -> tuple[QuerySet, tuple]:
+        """Rows the export was requested for and the admin's export columns.
+
+        The changelist is rebuilt from the stored query string, so filters,
+        search and permissions match what the requester saw.
+        """
+        from django.contrib import admin
+
+        model_admin = admin.site.get_model_admin(apps.get_model(self.model))
+        request = HttpRequest()
+        request.GET = QueryDict(self.filters)
+        request.user = self.requested_by
+        queryset = model_admin.get_changelist_instance(request).get_queryset(request)
+        if self.selected is not None:
+            queryset = queryset.filter(pk__in=self.selected)
+        return queryset, model_admin.export_columns
+
+    def write(self):
+        """Exports the rows into `file`"""
+        queryset, columns = self.get_source()
+        with tempfile.TemporaryFile() as temp:
+            for chunk in export_chunks(self.format, columns, queryset):
+                temp.write(chunk.encode())
+            self.file.save(
+                get_export_filename(queryset.model, self.format), File(temp), save=False
+            )
@@ -0,0 +1,56 @@
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from external.models import About, ExportJob, ImageVariants, Message, ServiceFeedback
+from tailoring.models import Service, Order
+from users.models import CustomUser
+from tailoring_ms import search
+
+image_fields = {
+    Order: ("reference_image", "picture"),
+    Service: ("picture",),
+    About: ("logo", "wallpaper"),
+    CustomUser: ("profile",),
+}
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_save, sender=Service)
+@receiver(post_save, sender=About)
+@receiver(post_save, sender=CustomUser)
+def queue_image_variants(sender, instance, **kwargs):
+    ImageVariants.queue(
+        *[getattr(instance, field).name for field in image_fields[sender]]
+    )
+
+
+@receiver(post_delete, sender=ExportJob)
+def delete_export_file(sender, instance, **kwargs):
+    if instance.file:
+        instance.file.delete(save=False)
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_save, sender=Message)
+@receiver(post_save, sender=ServiceFeedback)
+@receiver(post_save, sender=CustomUser)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(
+        search.get_fields(sender)
+    ):
+        # Such as the `last_login` updates of every login
+        return
+    search.index_objects(sender, [instance])
+
+
+@receiver(post_delete, sender=Order)
+@receiver(post_delete, sender=Message)
+@receiver(post_delete, sender=ServiceFeedback)
+@receiver(post_delete, sender=CustomUser)
+def remove_from_search_index(sender, instance, **kwargs):
+    search.backend.remove(sender, [instance.pk])
+
+
+@receiver(post_migrate)
+def create_search_index(sender, **kwargs):
+    if sender.name == "external":
+        search.backend.setup()
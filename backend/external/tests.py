@@ -1,3 +1,300 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPException
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.utils import timezone
+from fastapi.testclient import TestClient
+from api import app
+from api.v1.cache import ResponseCache, landing_page_cache
+from api.v1.utils import generate_token
+from asgiref.sync import async_to_sync
+from external.management.commands.send_queued_emails import (
+    Command as SendQueuedEmails,
+)
+from external.models import ImageVariants, Message, OutgoingEmail
+from tailoring.models import Order, Service
+from tailoring_ms import search
+from users.models import CustomUser
 
 # Create your tests here.
+
+
+class GenerateImageVariantsTest(TestCase):
+    def setUp(self):
+        self.source = default_storage.save(
+            "tests/corrupt.jpg", ContentFile(b"\xff\xd8\xff\xe0" + b"\x00" * 64)
+        )
+        self.addCleanup(default_storage.delete, self.source)
+
+    def test_corrupt_image_marked_failed(self):
+        ImageVariants.queue(self.source)
+        call_command("generate_image_variants", "--once", stdout=StringIO())
+        image = ImageVariants.objects.get(source=self.source)
+        self.assertEqual(image.status, ImageVariants.VariantsStatus.FAILED.value)
+        self.assertTrue(image.last_error.startswith("InvalidImageError"))
+        self.assertEqual(image.variants, {})
+
+
+class ExplainApiQueriesTest(TestCase):
+    def test_queries_use_indexes(self):
+        call_command("explain_api_queries", stdout=StringIO())
+
+
+class SeedSyntheticDataTest(TestCase):
+    def seed(self) -> tuple[list, list, list]:
+        call_command(
+            "seed_synthetic_data",
+            "--users=20",
+            "--messages=5",
+            "--seed=3",
+            "--now=2024-06-01T12:00:00+03:00",
+            stdout=StringIO(),
+        )
+        seeded = (
+            list(
+                CustomUser.objects.filter(username__startswith="client_")
+                .order_by("username")
+                .values_list("username", "password", "date_of_birth", "date_joined")
+            ),
+            list(
+                Order.objects.order_by("client__username", "created_at").values_list(
+                    "client__username", "status", "charges", "created_at", "updated_at"
+                )
+            ),
+            list(
+                Message.objects.order_by("created_at").values_list(
+                    "email", "created_at"
+                )
+            ),
+        )
+        CustomUser.objects.filter(username__startswith="client_").delete()
+        Message.objects.all().delete()
+        return seeded
+
+    def test_same_seed_same_data(self):
+        first = self.seed()
+        self.assertTrue(first[1])
+        self.assertEqual(first, self.seed())
+
+
+class ResponseCacheTest(SimpleTestCase):
+    def test_clear_drops_entries_being_built(self):
+        cache = ResponseCache()
+        cache.invalidate("faqs")
+
+        def build():
+            cache.clear()
+            return []
+
+        async_to_sync(cache.get)("faqs", build)
+        self.assertEqual(cache.stats()["keys"], [])
+
+
+class LandingPageCacheTest(TransactionTestCase):
+    def setUp(self):
+        landing_page_cache.clear()
+        self.api = TestClient(app)
+        self.etag = self.api.get("/api/v1/faqs").headers["ETag"]
+
+    def get_status(self, if_none_match: str) -> int:
+        return self.api.get(
+            "/api/v1/faqs", headers={"If-None-Match": if_none_match}
+        ).status_code
+
+    def test_if_none_match_list(self):
+        self.assertEqual(self.get_status(f'"other", W/{self.etag}'), 304)
+        self.assertEqual(self.get_status("*"), 304)
+        self.assertEqual(self.get_status(f'"other", "x{self.etag[1:]}'), 200)
+
+
+class LandingPageTest(TransactionTestCase):
+    def setUp(self):
+        landing_page_cache.clear()
+        self.api = TestClient(app)
+        self.url = "/api/v1/landing?fields=faqs&fields=services-offered"
+        self.etag = self.api.get(self.url).headers["ETag"]
+
+    def get_status(self, if_none_match: str) -> int:
+        return self.api.get(
+            self.url, headers={"If-None-Match": if_none_match}
+        ).status_code
+
+    def test_if_none_match_list(self):
+        self.assertEqual(self.get_status(self.etag), 304)
+        self.assertEqual(self.get_status(f'"other", W/{self.etag}'), 304)
+        self.assertEqual(self.get_status("*"), 304)
+        self.assertEqual(self.get_status(f'"{self.etag}"'), 200)
+
+
+class FailingEmailBackend(EmailBackend):
+    def send_messages(self, messages):
+        raise SMTPException("Mail server unavailable")
+
+
+@override_settings(EMAIL_QUEUE_MAX_ATTEMPTS=3, EMAIL_QUEUE_RETRY_DELAY=60)
+class OutgoingEmailTest(TestCase):
+    def setUp(self):
+        self.email = OutgoingEmail.queue(
+            subject="Order received", recipient="client@example.com", message="Hi"
+        )
+
+    def test_queue(self):
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, OutgoingEmail.EmailStatus.QUEUED.value)
+        self.assertEqual(self.email.attempts, 0)
+        self.assertLessEqual(self.email.send_after, timezone.now())
+
+    def test_failures_back_off_then_dead_letter(self):
+        for attempt, delay in ((1, 60), (2, 120)):
+            before = timezone.now()
+            self.email.mark_failed(SMTPException("Mail server unavailable"))
+            self.assertEqual(self.email.attempts, attempt)
+            self.assertEqual(self.email.status, OutgoingEmail.EmailStatus.QUEUED.value)
+            self.assertGreaterEqual(
+                self.email.send_after, before + timedelta(seconds=delay)
+            )
+        self.email.mark_failed(SMTPException("Mail server unavailable"))
+        self.assertEqual(self.email.status, OutgoingEmail.EmailStatus.FAILED.value)
+        self.assertEqual(
+            self.email.last_error, "SMTPException: Mail server unavailable"
+        )
+
+
+class SendQueuedEmailsTest(TransactionTestCase):
+    def setUp(self):
+        self.email = OutgoingEmail.queue(
+            subject="Order received", recipient="client@example.com", message="Hi"
+        )
+        self.command = SendQueuedEmails(stdout=StringIO())
+
+    def test_sent_outside_transaction(self):
+        claimed = []
+
+        class ClaimCheckingBackend(EmailBackend):
+            def send_messages(backend, messages):
+                claimed.append(
+                    (
+                        connection.in_atomic_block,
+                        OutgoingEmail.objects.get(pk=self.email.pk).status,
+                    )
+                )
+                return super().send_messages(messages)
+
+        self.assertEqual(self.command.send_batch(ClaimCheckingBackend(), 10), 1)
+        self.assertEqual(claimed, [(False, OutgoingEmail.EmailStatus.SENDING.value)])
+        self.assertEqual(len(mail.outbox), 1)
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, OutgoingEmail.EmailStatus.SENT.value)
+        self.assertIsNotNone(self.email.sent_at)
+
+    def test_failing_connection(self):
+        before = timezone.now()
+        self.assertEqual(self.command.send_batch(FailingEmailBackend(), 10), 1)
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, OutgoingEmail.EmailStatus.QUEUED.value)
+        self.assertEqual(self.email.attempts, 1)
+        self.assertTrue(self.email.last_error.startswith("SMTPException"))
+        self.assertGreater(self.email.send_after, before)
+        # Not due again until its retry
+        self.assertEqual(self.command.send_batch(FailingEmailBackend(), 10), 0)
+
+    def test_abandoned_claim_retried(self):
+        OutgoingEmail.objects.filter(pk=self.email.pk).update(
+            status=OutgoingEmail.EmailStatus.SENDING.value,
+            send_after=timezone.now() - timedelta(seconds=1),
+        )
+        self.assertEqual(self.command.send_batch(EmailBackend(), 10), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class SearchTest(TransactionTestCase):
+    def setUp(self):
+        self.api = TestClient(app)
+        self.staff = CustomUser.objects.create_user(
+            username="search-staff",
+            password="secret-pass-123",
+            token=generate_token(),
+            is_staff=True,
+            is_superuser=True,
+        )
+        self.headers = {"Authorization": f"Bearer {self.staff.token}"}
+
+    def search(self, q: str, headers: dict = None) -> list[tuple[str, int]]:
+        response = self.api.get(
+            "/api/v1/search", headers=headers or self.headers, params=dict(q=q)
+        )
+        self.assertEqual(response.status_code, 200)
+        return [(hit["target"], hit["id"]) for hit in response.json()]
+
+    def test_sqlite_backend(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite only")
+        self.assertIsInstance(search.backend, search.SQLiteBackend)
+        order = Order.objects.create(
+            client=self.staff,
+            service=Service.objects.create(
+                name=Service.ServiceName.EMBROIDERY.value, description="Embroidery"
+            ),
+            details="Monogrammed cuffs in gold thread",
+            material_type=Order.MaterialType.SILK.value,
+        )
+        message = Message.objects.create(
+            sender="Zawadi", email="zawadi@example.com", body="Do you sew velvet?"
+        )
+        # Prefixes of every word, whatever their case and order
+        self.assertEqual(self.search("GOLD monogram"), [("orders", order.pk)])
+        self.assertEqual(self.search("velv"), [("messages", message.pk)])
+        self.assertEqual(self.search("gold velvet"), [])
+        # Index query syntax is not passed through
+        self.assertEqual(self.search('velvet" OR "gold'), [])
+
+    def test_staff_only(self):
+        client_user = CustomUser.objects.create_user(
+            username="search-client", password="secret-pass-123", token=generate_token()
+        )
+        response = self.api.get(
+            "/api/v1/search",
+            headers={"Authorization": f"Bearer {client_user.token}"},
+            params=dict(q="velvet"),
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_search_follows_changes(self):
+        self.client.force_login(self.staff)
+        url = reverse("admin:external_message_changelist")
+
+        def admin_search(q: str) -> list[int]:
+            response = self.client.get(url, {"q": q})
+            return [message.pk for message in response.context["cl"].result_list]
+
+        message = Message.objects.create(
+            sender="Baraka", email="baraka@example.com", body="Tweed waistcoat fitting"
+        )
+        self.assertEqual(admin_search("waistcoat"), [message.pk])
+        message.body = "Linen waistcoat fitting"
+        message.save()
+        self.assertEqual(admin_search("tweed"), [])
+        self.assertEqual(admin_search("linen waist"), [message.pk])
+        message.delete()
+        self.assertEqual(admin_search("waistcoat"), [])
+        # Its document went along with it
+        with connection.cursor() as cursor:
+            cursor.execute(
+                *search.backend.match_sql(
+                    search.backend.get_table(Message), ["waistcoat"]
+                )
+            )
+            self.assertEqual(cursor.fetchall(), [])
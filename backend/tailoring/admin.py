@@ -1,6 +1,7 @@
 from django.contrib import admin
 from tailoring.models import Service, Order
 from django.utils.translation import gettext_lazy as _
+from django.db.models import Count, Q
 from unfold.admin import ModelAdmin
 from import_export.admin import ImportExportModelAdmin
 from unfold.contrib.import_export.forms import (
@@ -8,6 +9,9 @@ from unfold.contrib.import_export.forms import (
     ImportForm,
     SelectableFieldsExportForm,
 )
+from tailoring_ms.exports import StreamingExportMixin
+from tailoring_ms.search import SearchIndexMixin
+from tailoring.resources import OrderResource
 
 
 # Register your models here.
@@ -19,18 +23,40 @@ class ServiceAdmin(ModelAdmin, ImportExportModelAdmin):
     import_form_class = ImportForm
     export_form_class = SelectableFieldsExportForm
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                pending_orders_count=Count(
+                    "orders", filter=Q(orders__status=Order.OrderStatus.PENDING.value)
+                ),
+                completed_orders_count=Count(
+                    "orders",
+                    filter=Q(orders__status=Order.OrderStatus.COMPLETED.value),
+                ),
+                in_progress_orders_count=Count(
+                    "orders",
+                    filter=Q(orders__status=Order.OrderStatus.IN_PROGRESS.value),
+                ),
+            )
+        )
+
     def pending_orders(self, obj: Service) -> int:
-        return obj.orders.filter(status=Order.OrderStatus.PENDING.value).count()
+        return obj.pending_orders_count
 
     def completed_orders(self, obj: Service) -> int:
-        return obj.orders.filter(status=Order.OrderStatus.COMPLETED.value).count()
+        return obj.completed_orders_count
 
     def in_progress_orders(self, obj: Service) -> int:
-        return obj.orders.filter(status=Order.OrderStatus.IN_PROGRESS.value).count()
+        return obj.in_progress_orders_count
 
     pending_orders.short_description = _("Pending Orders")
     completed_orders.short_description = _("Completed Orders")
     in_progress_orders.short_description = _("In Progress Orders")
+    pending_orders.admin_order_field = "pending_orders_count"
+    completed_orders.admin_order_field = "completed_orders_count"
+    in_progress_orders.admin_order_field = "in_progress_orders_count"
     list_display = (
         "name",
         "pending_orders",
@@ -62,9 +88,30 @@ class ServiceAdmin(ModelAdmin, ImportExportModelAdmin):
 
 
 @admin.register(Order)
-class OrderAdmin(ModelAdmin, ImportExportModelAdmin):
+class OrderAdmin(
+    SearchIndexMixin, StreamingExportMixin, ModelAdmin, ImportExportModelAdmin
+):
+    resource_classes = [OrderResource]
     import_form_class = ImportForm
     export_form_class = SelectableFieldsExportForm
+    export_columns = (
+        ("id", "id"),
+        ("client", "client__username"),
+        ("client_email", "client__email"),
+        ("service", "service__name"),
+        ("details", "details"),
+        ("material_type", "material_type"),
+        ("fabric_required", "fabric_required"),
+        ("quantity", "quantity"),
+        ("urgency", "urgency"),
+        ("colors", "colors"),
+        ("charges", "charges"),
+        ("charges_paid", "charges_paid"),
+        ("status", "status"),
+        ("show_in_index", "show_in_index"),
+        ("created_at", "created_at"),
+        ("updated_at", "updated_at"),
+    )
 
     list_display = (
         "client",
@@ -77,7 +124,8 @@ class OrderAdmin(ModelAdmin, ImportExportModelAdmin):
         "show_in_index",
     )
     list_editable = ("show_in_index", "status")
-    search_fields = ("client__username",)
+    search_fields = ("details", "colors", "client__username")
+    search_index_relations = ("client",)
     list_filter = (
         "client__username",
         "service__name",
@@ -124,3 +172,35 @@ class OrderAdmin(ModelAdmin, ImportExportModelAdmin):
 
     ordering = ("-created_at",)
     readonly_fields = ("created_at", "updated_at")
+    actions = (
+        "mark_in_progress",
+        "mark_completed",
+        "mark_cancelled",
+        *StreamingExportMixin.export_actions,
+    )
+
+    def change_status(self, request, queryset, status: str):
+        updated, emails = Order.bulk_set_status(queryset, status)
+        self.message_user(
+            request,
+            _("%(orders)d orders marked %(status)s, %(emails)d emails queued.")
+            % dict(orders=updated, status=status, emails=emails),
+        )
+
+    @admin.action(
+        description=_("Mark selected orders as in progress"), permissions=["change"]
+    )
+    def mark_in_progress(self, request, queryset):
+        self.change_status(request, queryset, Order.OrderStatus.IN_PROGRESS.value)
+
+    @admin.action(
+        description=_("Mark selected orders as completed"), permissions=["change"]
+    )
+    def mark_completed(self, request, queryset):
+        self.change_status(request, queryset, Order.OrderStatus.COMPLETED.value)
+
+    @admin.action(
+        description=_("Mark selected orders as cancelled"), permissions=["change"]
+    )
+    def mark_cancelled(self, request, queryset):
+        self.change_status(request, queryset, Order.OrderStatus.CANCELLED.value)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TailoringConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tailoring"
+
+    def ready(self):
+        import tailoring.signals
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:37
+
+import tailoring_ms.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('details', models.TextField(help_text='Order description')),
+                ('material_type', models.CharField(choices=[('Cotton', 'COTTON'), ('Silk', 'SILK'), ('Wool', 'WOOL'), ('Polyester', 'POLYESTER'), ('Linen', 'LINEN'), ('Other', 'OTHER')], help_text='The type of material required for the order.', max_length=10)),
+                ('fabric_required', models.BooleanField(default=False, help_text='Indicates if fabric is required for the order.')),
+                ('quantity', models.PositiveIntegerField(default=1, help_text='The quantity of items in the order.')),
+                ('reference_image', models.ImageField(blank=True, help_text='Reference image for design/inspiration', null=True, upload_to=tailoring_ms.utils.generate_document_filepath, verbose_name='Reference')),
+                ('colors', models.CharField(blank=True, help_text='Desired material color', max_length=200, null=True, verbose_name='Colors')),
+                ('urgency', models.CharField(choices=[('Low', 'LOW'), ('Medium', 'MEDIUM'), ('High', 'HIGH')], default='Medium', help_text='The urgency level of the order.', max_length=6)),
+                ('charges', models.DecimalField(blank=True, decimal_places=2, help_text='The total charges of the order in Ksh.', max_digits=10, null=True)),
+                ('charges_paid', models.DecimalField(blank=True, decimal_places=2, default=0, help_text='Amount of the total charges paid in Ksh.', max_digits=10, null=True)),
+                ('status', models.CharField(choices=[('Pending', 'PENDING'), ('In Progress', 'IN_PROGRESS'), ('Completed', 'COMPLETED'), ('Cancelled', 'CANCELLED')], default='Pending', help_text='The current status of the order.', max_length=12)),
+                ('picture', models.ImageField(blank=True, default='default/27002.jpg', help_text='Photo of the finished clothe.', upload_to=tailoring_ms.utils.generate_document_filepath)),
+                ('show_in_index', models.BooleanField(default=True, help_text="Display this order in 'Latest work' section of the website", verbose_name='Show in index')),
+                ('user_is_notified_in_progress', models.BooleanField(default=False, help_text='Flag to track mailing user about a in_progress order status')),
+                ('user_is_notified_completed', models.BooleanField(default=False, help_text='Flag to track mailing user about a completed order status')),
+                ('user_is_notified_cancelled', models.BooleanField(default=False, help_text='Flag to track mailing user about a cancelled order status')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Date and time when the order was updated')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date and time when the oder was placed')),
+            ],
+            options={
+                'verbose_name': 'Order',
+                'verbose_name_plural': 'Orders',
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='Date when the orders were placed', verbose_name='Day')),
+                ('status', models.CharField(choices=[('Pending', 'PENDING'), ('In Progress', 'IN_PROGRESS'), ('Completed', 'COMPLETED'), ('Cancelled', 'CANCELLED')], help_text='Current status of the orders', max_length=12, verbose_name='Status')),
+                ('urgency', models.CharField(choices=[('Low', 'LOW'), ('Medium', 'MEDIUM'), ('High', 'HIGH')], help_text='Urgency level of the orders', max_length=6, verbose_name='Urgency')),
+                ('orders', models.IntegerField(default=0, help_text='Number of orders', verbose_name='Orders')),
+                ('charges', models.DecimalField(decimal_places=2, default=0, help_text='Total charges of the orders in Ksh', max_digits=14, verbose_name='Charges')),
+                ('charges_paid', models.DecimalField(decimal_places=2, default=0, help_text='Total charges paid for the orders in Ksh', max_digits=14, verbose_name='Charges paid')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+            ],
+            options={
+                'verbose_name': 'Order rollup',
+                'verbose_name_plural': 'Order rollups',
+            },
+        ),
+        migrations.CreateModel(
+            name='Service',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(choices=[('Custom Suits', 'CUSTOM_SUITS'), ('Wedding Attire', 'WEDDING_ATTIRE'), ('Alterations', 'ALTERATIONS'), ('Embroidery', 'EMBROIDERY'), ('Uniforms', 'UNIFORMS'), ('Other', 'OTHER')], help_text='Service name', max_length=100, unique=True, verbose_name='Name')),
+                ('description', models.TextField(help_text='What about this service?', verbose_name='Description')),
+                ('picture', models.ImageField(default='default/tape-measure-3829506_1920.jpg', help_text='Album photo for the service', upload_to=tailoring_ms.utils.generate_document_filepath, verbose_name='Picture')),
+                ('starting_price', models.DecimalField(decimal_places=2, default=1000, help_text='Starting price in Ksh', max_digits=8, verbose_name='Starting price')),
+                ('ending_price', models.DecimalField(decimal_places=2, default=15000, help_text='Ending price in Ksh', max_digits=8, verbose_name='Ending price')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date and time when the service was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Date and time when the service was created')),
+            ],
+            options={
+                'verbose_name': 'Service',
+                'verbose_name_plural': 'Services',
+            },
+        ),
+    ]
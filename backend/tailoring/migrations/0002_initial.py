@@ -0,0 +1,45 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('tailoring', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='client',
+            field=models.ForeignKey(help_text='The client who placed the order.', on_delete=django.db.models.deletion.CASCADE, related_name='orders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='orderrollup',
+            name='service',
+            field=models.ForeignKey(help_text='Service ordered', on_delete=django.db.models.deletion.CASCADE, related_name='rollups', to='tailoring.service', verbose_name='Service'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='service',
+            field=models.ForeignKey(help_text='Order service', on_delete=django.db.models.deletion.CASCADE, related_name='orders', to='tailoring.service', verbose_name='Service'),
+        ),
+        migrations.AddConstraint(
+            model_name='orderrollup',
+            constraint=models.UniqueConstraint(fields=('day', 'service', 'status', 'urgency'), name='order_rollup_key'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['client', '-created_at', '-id'], name='order_client_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'show_in_index', '-created_at'], name='order_latest_work_idx'),
+        ),
+    ]
@@ -1,14 +1,29 @@
-from django.db import models
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import models, transaction
+from django.db.models import F, Sum
+from django.dispatch import Signal
 from users.models import CustomUser
-from tailoring_ms.utils import EnumWithChoices, generate_document_filepath
+from tailoring_ms.utils import (
+    EnumWithChoices,
+    generate_document_filepath,
+    send_email as queue_email,
+    send_emails as queue_emails,
+)
 from django.utils.translation import gettext_lazy as _
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
+from tailoring_ms.timing import timed
+from tailoring_ms.events import order_events
 from django.conf import settings
 from django.utils import timezone
 
 # Create your models here.
 
+orders_status_changed = Signal()
+"""Sent with the `status` orders were moved to by `Order.bulk_set_status`
+and their `previous_statuses`, once the move is committed"""
+
 
 class Service(models.Model):
     class ServiceName(EnumWithChoices):
@@ -84,6 +99,38 @@ class Order(models.Model):
         COMPLETED = "Completed"
         CANCELLED = "Cancelled"
 
+    # Status : (email subject, template name, notified flag)
+    status_notifications = {
+        OrderStatus.IN_PROGRESS.value: (
+            "Order In Progress",
+            "in_progress",
+            "user_is_notified_in_progress",
+        ),
+        OrderStatus.COMPLETED.value: (
+            "Your Order is Completed",
+            "completed",
+            "user_is_notified_completed",
+        ),
+        OrderStatus.CANCELLED.value: (
+            "Your Order is Cancelled",
+            "cancelled",
+            "user_is_notified_cancelled",
+        ),
+    }
+
+    # Fields whose changes are pushed to the client's order event streams
+    event_fields = ("status", "charges", "charges_paid")
+
+    # Fields an order contributes to its `OrderRollup` with
+    rollup_fields = (
+        "created_at",
+        "service_id",
+        "status",
+        "urgency",
+        "charges",
+        "charges_paid",
+    )
+
     client = models.ForeignKey(
         CustomUser,
         on_delete=models.CASCADE,
@@ -207,6 +254,27 @@ class Order(models.Model):
     class Meta:
         verbose_name = _("Order")
         verbose_name_plural = _("Orders")
+        indexes = [
+            models.Index(
+                fields=["client", "-created_at", "-id"], name="order_client_idx"
+            ),
+            models.Index(
+                fields=["status", "show_in_index", "-created_at"],
+                name="order_latest_work_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets signal receivers tell which fields changed on save
+        instance._loaded_values = dict(zip(field_names, values))
+        instance._rollup_values = {
+            name: instance._loaded_values[name]
+            for name in cls.rollup_fields
+            if name in instance._loaded_values
+        }
+        return instance
 
     def __str__(self):
         return f"{self.service.name} by {self.client} on {self.created_at.strftime("%d-%b-%Y")}"
@@ -216,9 +284,140 @@ class Order(models.Model):
             self.reference_image.delete(save=False)
         super().delete(*args, **kwargs)
 
-    def save(self, *args, **kwargs):
-        def send_email(subject, template_name):
-            email_body = render_to_string(
+    @classmethod
+    def bulk_set_status(cls, queryset, status: str) -> tuple[int, int]:
+        """Moves orders to `status` with one UPDATE, queueing the due status
+        emails as a single batch.
+
+        Model signals are not sent for the updated orders; their rollups are
+        moved along in the same transaction, and their events are published and
+        `orders_status_changed` sent once it commits.
+
+        Returns:
+            tuple: Orders updated, emails queued.
+        """
+        subject, template_name, notified_flag = cls.status_notifications.get(
+            status, (None, None, None)
+        )
+        orders = queryset.exclude(status=status)
+        changes = dict(status=status, updated_at=timezone.now())
+        emails = []
+        with transaction.atomic():
+            if notified_flag is not None:
+                for order in orders.filter(**{notified_flag: False}).select_related(
+                    "client", "service"
+                ):
+                    order.status = status
+                    emails.append(
+                        dict(
+                            subject=subject,
+                            message="",
+                            recipient=order.client.email,
+                            html_message=order.render_status_email(template_name),
+                        )
+                    )
+                changes[notified_flag] = True
+            deltas = {}
+            events = []
+            previous_statuses = set()
+            for id, client_id, *values in orders.values_list(
+                "id", "client_id", *cls.rollup_fields
+            ).iterator():
+                values = dict(zip(cls.rollup_fields, values))
+                previous_statuses.add(values["status"])
+                key, amounts = cls.make_rollup_entry(values)
+                OrderRollup.add_delta(deltas, (key, amounts), -1)
+                OrderRollup.add_delta(deltas, ((*key[:2], status, key[3]), amounts))
+                events.append(
+                    (
+                        client_id,
+                        cls.make_event_data(
+                            id, changes["updated_at"], values | dict(status=status)
+                        ),
+                    )
+                )
+            updated = orders.update(**changes)
+            OrderRollup.apply(deltas)
+            queue_emails(emails)
+            cls.publish_events(events)
+            if updated:
+                transaction.on_commit(
+                    lambda: orders_status_changed.send(
+                        sender=cls, status=status, previous_statuses=previous_statuses
+                    )
+                )
+        return updated, len(emails)
+
+    @classmethod
+    def make_rollup_entry(cls, values: dict) -> tuple[tuple, tuple]:
+        """Rollup key and amounts of an order with `rollup_fields` values.
+
+        Returns:
+            tuple: (day, service id, status, urgency), (orders, charges, paid)
+        """
+        return (
+            (
+                timezone.localdate(values["created_at"]),
+                values["service_id"],
+                values["status"],
+                values["urgency"],
+            ),
+            (
+                1,
+                Decimal(str(values["charges"] or 0)),
+                Decimal(str(values["charges_paid"] or 0)),
+            ),
+        )
+
+    def get_rollup_values(self) -> dict:
+        return {name: getattr(self, name) for name in self.rollup_fields}
+
+    def get_rollup_entry(self) -> tuple[tuple, tuple]:
+        return self.make_rollup_entry(self.get_rollup_values())
+
+    def get_saved_rollup_entry(self) -> tuple[tuple, tuple] | None:
+        """Rollup entry of the order as last loaded or saved, None if unknown"""
+        values = getattr(self, "_rollup_values", {})
+        if len(values) < len(self.rollup_fields):
+            return None
+        return self.make_rollup_entry(values)
+
+    @classmethod
+    def make_event_data(cls, id: int, updated_at: datetime, values: dict) -> dict:
+        """Order event of the order `id` holding its `event_fields` values"""
+        return dict(
+            id=id,
+            **{name: values[name] for name in cls.event_fields},
+            updated_at=updated_at,
+        )
+
+    def has_event_changes(self) -> bool:
+        """Whether `event_fields` differ from when the order was last loaded or
+        saved, True if unknown"""
+        saved = getattr(self, "_rollup_values", {})
+        return any(
+            name not in saved or saved[name] != getattr(self, name)
+            for name in self.event_fields
+        )
+
+    def get_event_data(self) -> dict:
+        return self.make_event_data(self.id, self.updated_at, self.get_rollup_values())
+
+    @staticmethod
+    def publish_events(events: list[tuple[int, dict]]):
+        """Pushes (client id, event data) pairs to the order event streams once
+        the current transaction commits"""
+
+        def publish():
+            for client_id, data in events:
+                order_events.publish(client_id, data)
+
+        if events:
+            transaction.on_commit(publish)
+
+    def render_status_email(self, template_name: str) -> str:
+        with timed("template"):
+            return render_to_string(
                 f"tailoring/email/{template_name}_order_status.html",
                 {
                     "order": self,
@@ -228,35 +427,200 @@ class Order(models.Model):
                 },
             )
 
-            # Send the email
-            send_mail(
+    def mark_status_notified(self):
+        """Flags the current status as notified without emailing the client"""
+        notified_flag = self.status_notifications.get(self.status, (None,) * 3)[-1]
+        if notified_flag is not None:
+            setattr(self, notified_flag, True)
+
+    def save(self, *args, **kwargs):
+        subject, template_name, notified_flag = self.status_notifications.get(
+            self.status, (None, None, None)
+        )
+        if notified_flag is not None and getattr(self, notified_flag) == False:
+            # Queue the email
+            queue_email(
                 subject=subject,
                 message="",
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[self.client.email],
-                fail_silently=(settings.DEBUG == False),  # Silent in production
-                html_message=email_body,
+                recipient=self.client.email,
+                html_message=self.render_status_email(template_name),
             )
+            setattr(self, notified_flag, True)
 
-        if (
-            self.status == self.OrderStatus.IN_PROGRESS.value
-            and self.user_is_notified_in_progress == False
-        ):
-            send_email("Order In Progress", "in_progress")
-            self.user_is_notified_in_progress = True
-        elif (
-            self.status == self.OrderStatus.COMPLETED.value
-            and self.user_is_notified_completed == False
-        ):
-            # Render the email content
-            send_email("Your Order is Completed", "completed")
-            self.user_is_notified_completed = True
-        elif (
-            self.status == self.OrderStatus.CANCELLED.value
-            and self.user_is_notified_cancelled == False
-        ):
-            # Render the email content
-            send_email("Your Order is Cancelled", "cancelled")
-            self.user_is_notified_cancelled = True
-
+        changed = self.has_event_changes()
         super().save(*args, **kwargs)
+        if changed:
+            self.publish_events([(self.client_id, self.get_event_data())])
+
+
+class OrderRollup(models.Model):
+    """Daily order count & charges per service, status and urgency.
+
+    Kept current by the order signals and bulk order writes, so that reports
+    read these rows instead of aggregating every order. Rebuilt from the orders
+    with `manage.py rebuild_order_rollups`.
+    """
+
+    day = models.DateField(
+        verbose_name=_("Day"), help_text=_("Date when the orders were placed")
+    )
+    service = models.ForeignKey(
+        Service,
+        on_delete=models.CASCADE,
+        verbose_name=_("Service"),
+        help_text=_("Service ordered"),
+        related_name="rollups",
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=12,
+        choices=Order.OrderStatus.choices(),
+        help_text=_("Current status of the orders"),
+    )
+    urgency = models.CharField(
+        verbose_name=_("Urgency"),
+        max_length=6,
+        choices=Order.OrderUrgency.choices(),
+        help_text=_("Urgency level of the orders"),
+    )
+    orders = models.IntegerField(
+        verbose_name=_("Orders"), default=0, help_text=_("Number of orders")
+    )
+    charges = models.DecimalField(
+        verbose_name=_("Charges"),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text=_("Total charges of the orders in Ksh"),
+    )
+    charges_paid = models.DecimalField(
+        verbose_name=_("Charges paid"),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text=_("Total charges paid for the orders in Ksh"),
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Updated At"),
+    )
+
+    class Meta:
+        verbose_name = _("Order rollup")
+        verbose_name_plural = _("Order rollups")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "service", "status", "urgency"],
+                name="order_rollup_key",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.service_id} {self.status} {self.urgency}"
+
+    @staticmethod
+    def add_delta(deltas: dict, entry: tuple[tuple, tuple], sign: int = 1):
+        """Adds an order rollup entry to `deltas`, or subtracts it when `sign` is -1"""
+        key, amounts = entry
+        totals = deltas.setdefault(key, [0, 0, 0])
+        for index, amount in enumerate(amounts):
+            totals[index] += sign * amount
+
+    @classmethod
+    def apply(cls, deltas: dict):
+        """Adds `deltas` of (orders, charges, charges paid) to their rollups.
+
+        Rollups are only created for deltas adding orders. Others missing theirs
+        are skipped, such as those of a service being deleted.
+        """
+        with transaction.atomic():
+            for (day, service_id, status, urgency), amounts in deltas.items():
+                if not any(amounts):
+                    continue
+                key = dict(
+                    day=day, service_id=service_id, status=status, urgency=urgency
+                )
+                changes = dict(
+                    orders=F("orders") + amounts[0],
+                    charges=F("charges") + amounts[1],
+                    charges_paid=F("charges_paid") + amounts[2],
+                )
+                if not cls.objects.filter(**key).update(**changes) and amounts[0] > 0:
+                    cls.objects.get_or_create(**key)
+                    cls.objects.filter(**key).update(**changes)
+
+    @classmethod
+    def rebuild(cls, start: date, end: date) -> int:
+        """Recomputes the rollups of days `start` to `end` from the orders.
+
+        Returns:
+            int: Rollups written.
+        """
+
+        def day_start(day: date) -> datetime:
+            return timezone.make_aware(datetime.combine(day, time.min))
+
+        deltas = {}
+        with transaction.atomic():
+            orders = Order.objects.filter(
+                created_at__gte=day_start(start),
+                created_at__lt=day_start(end + timedelta(days=1)),
+            ).values_list(*Order.rollup_fields)
+            for values in orders.iterator(chunk_size=2000):
+                cls.add_delta(
+                    deltas,
+                    Order.make_rollup_entry(dict(zip(Order.rollup_fields, values))),
+                )
+            cls.objects.filter(day__range=(start, end)).delete()
+            cls.objects.bulk_create(
+                [
+                    cls(
+                        day=day,
+                        service_id=service_id,
+                        status=status,
+                        urgency=urgency,
+                        orders=orders,
+                        charges=charges,
+                        charges_paid=charges_paid,
+                    )
+                    for (day, service_id, status, urgency), (
+                        orders,
+                        charges,
+                        charges_paid,
+                    ) in deltas.items()
+                ],
+                batch_size=500,
+            )
+        return len(deltas)
+
+    @classmethod
+    def summarize(
+        cls, start: date, end: date, group_by: list[str] = ()
+    ) -> tuple[dict, list[dict]]:
+        """Totals of days `start` to `end`, overall and per `group_by` values.
+
+        Args:
+            group_by: Any of day, service, status and urgency.
+
+        Returns:
+            tuple: Totals, [totals with their group values]
+        """
+        fields = [
+            "service__name" if group == "service" else group for group in group_by
+        ]
+        rollups = cls.objects.filter(day__range=(start, end)).exclude(orders=0)
+        amounts = dict(
+            orders=Sum("orders"),
+            charges=Sum("charges"),
+            charges_paid=Sum("charges_paid"),
+        )
+        totals = {
+            name: value or 0 for name, value in rollups.aggregate(**amounts).items()
+        }
+        rows = []
+        if fields:
+            for row in rollups.values(*fields).annotate(**amounts).order_by(*fields):
+                if "service__name" in row:
+                    row["service"] = row.pop("service__name")
+                rows.append(row)
+        return totals, rows
@@ -0,0 +1,167 @@
+"""Import/export resources of the tailoring models.
+
+Orders are imported with `bulk_create`/`bulk_update` in batches of
+`IMPORT_BATCH_SIZE`. `Order.save` is bypassed, so imported orders don't email
+clients; their current status is flagged as notified instead, and the order
+rollups, search index and order event streams are updated once per import.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Max, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from import_export import fields, resources, widgets
+from import_export.instance_loaders import CachedInstanceLoader
+from external.models import ImageVariants
+from users.models import CustomUser
+from tailoring.models import Service, Order, OrderRollup
+from tailoring_ms import search
+
+
+class CachedForeignKeyWidget(widgets.ForeignKeyWidget):
+    """Looks up each related object once per import"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = {}
+
+    def prefetch(self, values):
+        """Loads the objects referenced by `values` with one query"""
+        keys = {str(value) for value in values if value not in (None, "")}
+        for obj in self.get_queryset(None, None).filter(
+            **{f"{self.field}__in": keys - set(self.cache)}
+        ):
+            self.cache[str(getattr(obj, self.field))] = obj
+
+    def get_instance_by_lookup_fields(self, value, row, **kwargs):
+        key = str(value)
+        if key not in self.cache:
+            try:
+                self.cache[key] = super().get_instance_by_lookup_fields(
+                    value, row, **kwargs
+                )
+            except self.model.DoesNotExist:
+                # Reported as an invalid row rather than failing the import
+                raise ValueError(
+                    f"{self.model._meta.verbose_name} {self.field}={value} not found"
+                )
+        return self.cache[key]
+
+
+class TimestampWidget(widgets.DateTimeWidget):
+    """Also reads the ISO 8601 timestamps written by the streaming exports"""
+
+    def clean(self, value, row=None, **kwargs):
+        if isinstance(value, str) and (timestamp := parse_datetime(value.strip())):
+            if settings.USE_TZ and timezone.is_naive(timestamp):
+                return timezone.make_aware(timestamp)
+            return timestamp
+        return super().clean(value, row, **kwargs)
+
+
+class OrderResource(resources.ModelResource):
+    # Keyed as in the admin's streaming exports, so those can be imported back
+    client = fields.Field(
+        attribute="client",
+        column_name="client",
+        widget=CachedForeignKeyWidget(CustomUser, field="username"),
+    )
+    service = fields.Field(
+        attribute="service",
+        column_name="service",
+        widget=CachedForeignKeyWidget(Service, field="name"),
+    )
+    created_at = fields.Field(
+        attribute="created_at", column_name="created_at", widget=TimestampWidget()
+    )
+    updated_at = fields.Field(
+        attribute="updated_at", column_name="updated_at", widget=TimestampWidget()
+    )
+
+    class Meta:
+        model = Order
+        use_bulk = True
+        batch_size = settings.IMPORT_BATCH_SIZE
+        instance_loader_class = CachedInstanceLoader
+        clean_model_instances = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.image_sources = []
+        self.rollup_deltas = {}
+        self.updated_pks = []
+        self.changed_orders = []
+
+    def before_import(self, dataset, **kwargs):
+        # Bulk inserts don't return primary keys on every database
+        self.last_pk = Order.objects.aggregate(last_pk=Max("pk"))["last_pk"] or 0
+        for name in ("client", "service"):
+            if name in dataset.headers:
+                self.fields[name].widget.prefetch(dataset[name])
+
+    def validate_instance(
+        self, instance, import_validation_errors=None, validate_unique=True
+    ):
+        errors = dict(import_validation_errors or {})
+        try:
+            # Relations were already looked up by their widgets
+            instance.full_clean(
+                exclude=[*errors, "client", "service"],
+                validate_unique=validate_unique,
+            )
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+
+    def before_save_instance(self, instance, row, **kwargs):
+        now = timezone.now()
+        if not instance.created_at or (
+            instance._state.adding and Order._meta.get_field("created_at").auto_now_add
+        ):
+            # What the insert will store, unless timestamps are explicit
+            instance.created_at = now
+        if "updated_at" not in row or not instance.updated_at:
+            instance.updated_at = now
+        instance.mark_status_notified()
+        self.image_sources.extend(
+            (instance.reference_image.name, instance.picture.name)
+        )
+        if not instance._state.adding:
+            self.updated_pks.append(instance.pk)
+            if instance.has_event_changes():
+                self.changed_orders.append(instance)
+            previous = instance.get_saved_rollup_entry()
+            if previous is not None:
+                OrderRollup.add_delta(self.rollup_deltas, previous, -1)
+        OrderRollup.add_delta(self.rollup_deltas, instance.get_rollup_entry())
+        instance._rollup_values = instance.get_rollup_values()
+
+    def after_import(self, dataset, result, **kwargs):
+        # Bulk writes skip the post_save signals doing these
+        if not kwargs.get("dry_run"):
+            ImageVariants.queue(*self.image_sources)
+            OrderRollup.apply(self.rollup_deltas)
+            search.index_queryset(
+                Order.objects.filter(
+                    Q(pk__gt=self.last_pk) | Q(pk__in=self.updated_pks)
+                )
+            )
+            Order.publish_events(
+                [
+                    (order.client_id, order.get_event_data())
+                    for order in self.changed_orders
+                ]
+            )
+        self.image_sources.clear()
+        self.rollup_deltas.clear()
+        self.updated_pks.clear()
+        self.changed_orders.clear()
+
+
+class BulkOrderResource(OrderResource):
+    """Imports without computing the per-row diff shown in the admin"""
+
+    class Meta(OrderResource.Meta):
+        skip_diff = True
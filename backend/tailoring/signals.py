@@ -0,0 +1,42 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from tailoring.models import Service, Order, OrderRollup
+
+
+@receiver(pre_save, sender=Order)
+def load_saved_rollup_values(sender, instance: Order, **kwargs):
+    if instance.pk is None or instance.get_saved_rollup_entry() is not None:
+        return
+    # Orders built by hand or loaded with deferred fields; without the stored
+    # values the rollups they counted for can't be decremented
+    instance._rollup_values = (
+        Order.objects.filter(pk=instance.pk).values(*Order.rollup_fields).first() or {}
+    )
+
+
+@receiver(post_save, sender=Order)
+def update_order_rollups(sender, instance: Order, created: bool, **kwargs):
+    entry = instance.get_rollup_entry()
+    previous = None if created else instance.get_saved_rollup_entry()
+    if previous != entry:
+        deltas = {}
+        if previous is not None:
+            OrderRollup.add_delta(deltas, previous, -1)
+        OrderRollup.add_delta(deltas, entry)
+        OrderRollup.apply(deltas)
+    instance._rollup_values = instance.get_rollup_values()
+
+
+@receiver(post_delete, sender=Order)
+def remove_order_rollups(sender, instance: Order, origin=None, **kwargs):
+    if isinstance(origin, Service) or (
+        isinstance(origin, QuerySet) and origin.model is Service
+    ):
+        # The service's rollups are deleted along with it
+        return
+    deltas = {}
+    OrderRollup.add_delta(
+        deltas, instance.get_saved_rollup_entry() or instance.get_rollup_entry(), -1
+    )
+    OrderRollup.apply(deltas)
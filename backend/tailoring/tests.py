@@ -1,3 +1,479 @@
-from django.test import TestCase
+import asyncio
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
+
+import httpx
+from PIL import Image
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.utils.timezone import localdate
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from api import app, LimitRequestSize
+from api.v1.cache import landing_page_cache
+from api.v1.routes import stream_order_events
+from api.v1.utils import generate_token
+from tailoring.admin import OrderAdmin
+from tailoring.models import Service, Order, OrderRollup
+from tailoring_ms.exports import export_chunks
 
 # Create your tests here.
+
+
+class OrderRollupTest(TransactionTestCase):
+    def setUp(self):
+        self.client_user = get_user_model().objects.create_user(
+            username="rollup-client", password="secret-pass-123"
+        )
+        self.service = Service.objects.create(
+            name=Service.ServiceName.ALTERATIONS.value, description="Alterations"
+        )
+
+    def create_order(self, **kwargs) -> Order:
+        return Order.objects.create(
+            client=self.client_user,
+            service=self.service,
+            details="Hem trousers",
+            material_type=Order.MaterialType.COTTON.value,
+            **kwargs,
+        )
+
+    def test_order_counted_and_uncounted(self):
+        order = self.create_order(charges=1000)
+        rollup = OrderRollup.objects.get(service=self.service)
+        self.assertEqual((rollup.orders, rollup.charges), (1, 1000))
+        order.delete()
+        rollup.refresh_from_db()
+        self.assertEqual((rollup.orders, rollup.charges), (0, 0))
+
+    def test_delete_service_with_orders(self):
+        self.create_order(charges=1000)
+        self.create_order(charges=500)
+        self.service.delete()
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(OrderRollup.objects.exists())
+
+    def test_bulk_completed_invalidates_latest_work(self):
+        order = self.create_order(charges=1000)
+        with mock.patch.object(landing_page_cache, "invalidate") as invalidate:
+            Order.bulk_set_status(
+                Order.objects.filter(pk=order.pk), Order.OrderStatus.COMPLETED.value
+            )
+        invalidate.assert_called_with("latest-work")
+        rollup = OrderRollup.objects.get(status=Order.OrderStatus.COMPLETED.value)
+        self.assertEqual(rollup.orders, 1)
+
+    def test_deferred_order_moved_to_another_day(self):
+        order = self.create_order(charges=1000)
+        day = localdate(order.created_at)
+        order = Order.objects.only("id").get(pk=order.pk)
+        order.created_at -= timedelta(days=3)
+        order.save()
+        self.assertFalse(OrderRollup.objects.filter(day=day, orders__gt=0).exists())
+        rollup = OrderRollup.objects.get(day=day - timedelta(days=3))
+        self.assertEqual((rollup.orders, rollup.charges), (1, 1000))
+
+    def test_negative_delta_creates_no_rollup(self):
+        order = self.create_order(charges=1000)
+        OrderRollup.objects.all().delete()
+        order.delete()
+        self.assertFalse(OrderRollup.objects.exists())
+
+
+class OrderImageUploadTest(TransactionTestCase):
+    def setUp(self):
+        self.api = TestClient(app)
+        user = get_user_model().objects.create_user(
+            username="upload-client", password="secret-pass-123", token=generate_token()
+        )
+        self.headers = {"Authorization": f"Bearer {user.token}"}
+        Service.objects.create(
+            name=Service.ServiceName.ALTERATIONS.value, description="Alterations"
+        )
+
+    def place_order(self, image: bytes, filename: str):
+        return self.api.post(
+            "/api/v1/order",
+            headers=self.headers,
+            data=dict(
+                service_name=Service.ServiceName.ALTERATIONS.value,
+                details="Hem trousers",
+                material_type=Order.MaterialType.COTTON.value,
+                fabric_required="false",
+            ),
+            files={"reference_image": (filename, image)},
+        )
+
+    def test_corrupt_image_refused(self):
+        response = self.place_order(b"\xff\xd8\xff\xe0" + b"\x00" * 64, "photo.jpg")
+        self.assertEqual(response.status_code, 415)
+        self.assertFalse(Order.objects.exists())
+
+    def test_truncated_image_refused(self):
+        buffer = BytesIO()
+        Image.new("RGB", (64, 64), "red").save(buffer, format="PNG")
+        response = self.place_order(buffer.getvalue()[:-40], "photo.png")
+        self.assertEqual(response.status_code, 415)
+
+    def test_decompression_bomb_refused(self):
+        buffer = BytesIO()
+        Image.new("RGB", (64, 64), "red").save(buffer, format="PNG")
+        with mock.patch.object(Image, "MAX_IMAGE_PIXELS", 100):
+            response = self.place_order(buffer.getvalue(), "photo.png")
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(Order.objects.exists())
+
+    @override_settings(UPLOAD_IMAGE_MAX_DIMENSION=0)
+    def test_corrupt_image_refused_without_downscaling(self):
+        response = self.place_order(b"\xff\xd8\xff\xe0" + b"\x00" * 64, "photo.jpg")
+        self.assertEqual(response.status_code, 415)
+        self.assertFalse(Order.objects.exists())
+
+    def test_oversized_chunked_body_refused(self):
+        request = httpx.Request(
+            "POST",
+            "http://testserver/api/v1/order",
+            data=dict(
+                service_name=Service.ServiceName.ALTERATIONS.value,
+                details="Hem trousers",
+                material_type=Order.MaterialType.COTTON.value,
+                fabric_required="false",
+            ),
+            files={"reference_image": ("photo.png", make_png() + b"\x00" * (6 << 20))},
+        )
+        body = request.read()
+
+        def chunks():
+            # A generator body is sent without Content-Length
+            for start in range(0, len(body), 64 * 1024):
+                yield body[start : start + 64 * 1024]
+
+        response = self.api.post(
+            "/api/v1/order",
+            headers=self.headers | {"Content-Type": request.headers["Content-Type"]},
+            content=chunks(),
+        )
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(Order.objects.exists())
+
+
+class LimitRequestSizeTest(SimpleTestCase):
+    def test_chunked_body_cut_off_at_limit(self):
+        received = []
+
+        async def receive():
+            received.append(1024)
+            return {"type": "http.request", "body": b"x" * 1024, "more_body": True}
+
+        async def read_body(scope, receive, send):
+            while (await receive())["more_body"]:
+                pass
+
+        middleware = LimitRequestSize(read_body, max_size=4096)
+        scope = {"type": "http", "path": "/api/v1/order", "headers": []}
+        with self.assertRaises(HTTPException) as context:
+            async_to_sync(middleware)(scope, receive, None)
+        self.assertEqual(context.exception.status_code, 413)
+        self.assertEqual(sum(received), 5 * 1024)
+
+
+def make_png() -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (64, 64), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class OrderReferenceImageUpdateTest(TransactionTestCase):
+    def setUp(self):
+        self.api = TestClient(app)
+        user = get_user_model().objects.create_user(
+            username="image-client", password="secret-pass-123", token=generate_token()
+        )
+        self.headers = {"Authorization": f"Bearer {user.token}"}
+        self.order = Order.objects.create(
+            client=user,
+            service=Service.objects.create(
+                name=Service.ServiceName.ALTERATIONS.value, description="Alterations"
+            ),
+            details="Hem trousers",
+            material_type=Order.MaterialType.COTTON.value,
+        )
+        self.order.reference_image.save("old.png", ContentFile(make_png()))
+        self.addCleanup(self.delete_images)
+
+    def delete_images(self):
+        directory = "order"
+        if default_storage.exists(directory):
+            for name in default_storage.listdir(directory)[1]:
+                if name.startswith(("old_", "new_")):
+                    default_storage.delete(f"{directory}/{name}")
+
+    def get_new_images(self) -> list[str]:
+        return [
+            name
+            for name in default_storage.listdir("order")[1]
+            if name.startswith("new_")
+        ]
+
+    def update_image(self, headers: dict = {}):
+        return self.api.patch(
+            f"/api/v1/order/{self.order.pk}",
+            headers=self.headers | headers,
+            files={"reference_image": ("new.png", make_png())},
+        )
+
+    def test_previous_image_deleted(self):
+        old_image = self.order.reference_image.name
+        self.assertEqual(self.update_image().status_code, 200)
+        self.order.refresh_from_db()
+        self.assertTrue(self.order.reference_image.name.startswith("order/new_"))
+        self.assertTrue(default_storage.exists(self.order.reference_image.name))
+        self.assertFalse(default_storage.exists(old_image))
+
+    def test_refused_update_keeps_image(self):
+        old_image = self.order.reference_image.name
+        response = self.update_image({"If-Match": '"stale"'})
+        self.assertEqual(response.status_code, 412)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.reference_image.name, old_image)
+        self.assertTrue(default_storage.exists(old_image))
+        self.assertEqual(self.get_new_images(), [])
+
+    def test_failed_update_keeps_image(self):
+        old_image = self.order.reference_image.name
+        with mock.patch.object(Order, "save", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.update_image()
+        self.assertTrue(default_storage.exists(old_image))
+        self.assertEqual(self.get_new_images(), [])
+
+
+class OrderConditionalRequestTest(TransactionTestCase):
+    def setUp(self):
+        self.api = TestClient(app)
+        user = get_user_model().objects.create_user(
+            username="conditional-client",
+            password="secret-pass-123",
+            token=generate_token(),
+        )
+        self.headers = {"Authorization": f"Bearer {user.token}"}
+        self.order = Order.objects.create(
+            client=user,
+            service=Service.objects.create(
+                name=Service.ServiceName.ALTERATIONS.value, description="Alterations"
+            ),
+            details="Hem trousers",
+            material_type=Order.MaterialType.COTTON.value,
+        )
+        self.url = f"/api/v1/order/{self.order.pk}"
+
+    def get(self, headers: dict = {}):
+        return self.api.get(self.url, headers=self.headers | headers)
+
+    def update(self, headers: dict, details: str):
+        return self.api.patch(
+            self.url, headers=self.headers | headers, data=dict(details=details)
+        )
+
+    def test_not_modified(self):
+        response = self.get()
+        etag, last_modified = (
+            response.headers["ETag"],
+            response.headers["Last-Modified"],
+        )
+        for headers in (
+            {"If-None-Match": etag},
+            {"If-None-Match": f"W/{etag}"},
+            {"If-None-Match": "*"},
+            {"If-Modified-Since": last_modified},
+        ):
+            with self.subTest(headers=headers):
+                self.assertEqual(self.get(headers).status_code, 304)
+        self.assertEqual(self.get({"If-None-Match": '"other"'}).status_code, 200)
+
+    def test_stale_update_refused(self):
+        etag = self.get().headers["ETag"]
+        response = self.update({"If-Match": etag}, "Shorten sleeves")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(self.get({"If-None-Match": etag}).status_code, 200)
+        # Weak tags never match
+        response = self.update({"If-Match": f"W/{response.headers['ETag']}"}, "x")
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.update({"If-Match": etag}, "x").status_code, 412)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.details, "Shorten sleeves")
+
+
+class OrderPaginationTest(TransactionTestCase):
+    def setUp(self):
+        self.api = TestClient(app)
+        user_model = get_user_model()
+        user = user_model.objects.create_user(
+            username="paging-client", password="secret-pass-123", token=generate_token()
+        )
+        self.headers = {"Authorization": f"Bearer {user.token}"}
+        service = Service.objects.create(
+            name=Service.ServiceName.UNIFORMS.value, description="Uniforms"
+        )
+        other_user = user_model.objects.create_user(
+            username="other-client", password="secret-pass-123"
+        )
+        orders = Order.objects.bulk_create(
+            Order(
+                client=other_user if index % 10 == 0 else user,
+                service=service,
+                details=f"Order {index}",
+                material_type=Order.MaterialType.COTTON.value,
+            )
+            for index in range(120)
+        )
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for index, order in enumerate(orders):
+            # Orders placed in threes at the same time, in no id order
+            Order.objects.filter(pk=order.pk).update(
+                created_at=start + timedelta(minutes=(index * 7 % 120) // 3)
+            )
+        self.expected = list(
+            Order.objects.filter(client=user)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+
+    def get_page(self, **params):
+        return self.api.get("/api/v1/orders", headers=self.headers, params=params)
+
+    def test_pages_continue_across_ties(self):
+        for limit in (2, 3, 7):
+            ids, after = [], None
+            while True:
+                params = dict(limit=limit) | (
+                    {} if after is None else dict(after=after)
+                )
+                page = [order["id"] for order in self.get_page(**params).json()]
+                if not page:
+                    break
+                ids.extend(page)
+                after = page[-1]
+            self.assertEqual(ids, self.expected)
+
+    def test_default_limit(self):
+        self.assertEqual(len(self.expected), 108)
+        self.assertEqual(
+            [order["id"] for order in self.get_page().json()], self.expected[:100]
+        )
+
+    def test_limit_bounds(self):
+        self.assertEqual(len(self.get_page(limit=500).json()), 108)
+        self.assertEqual(self.get_page(limit=501).status_code, 422)
+        self.assertEqual(self.get_page(limit=0).status_code, 422)
+
+
+class OrderEventsTest(TransactionTestCase):
+    def setUp(self):
+        self.api = TestClient(app)
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="events-client", password="secret-pass-123", token=generate_token()
+        )
+        other_user = user_model.objects.create_user(
+            username="other-events-client", password="secret-pass-123"
+        )
+        service = Service.objects.create(
+            name=Service.ServiceName.CUSTOM_SUITS.value, description="Suits"
+        )
+        self.order, self.other_order = (
+            Order.objects.create(
+                client=client,
+                service=service,
+                details="Three piece suit",
+                material_type=Order.MaterialType.WOOL.value,
+            )
+            for client in (self.user, other_user)
+        )
+
+    def change_orders(self):
+        self.other_order.status = Order.OrderStatus.CANCELLED.value
+        self.other_order.save()
+        # Not an event field
+        self.order.details = "Two piece suit"
+        self.order.save()
+        self.order.charges = 12000
+        self.order.save()
+        self.order.status = Order.OrderStatus.IN_PROGRESS.value
+        self.order.save()
+
+    async def stream_events(self, count: int) -> list[dict]:
+        """Data of the first `count` events streamed while the orders change"""
+        response = await stream_order_events(user=self.user)
+        self.assertEqual(response.media_type, "text/event-stream")
+        chunks = response.body_iterator
+        try:
+            # Subscribed once the retry delay is sent
+            self.assertEqual(await anext(chunks), "retry: 3000\n\n")
+            # Saved from another thread, as by a sync endpoint or the admin
+            await asyncio.to_thread(self.change_orders)
+            events = []
+            while len(events) < count:
+                chunk = await asyncio.wait_for(anext(chunks), 5)
+                if chunk.startswith("id: "):
+                    events.append(json.loads(chunk.split("data: ", 1)[1]))
+            return events
+        finally:
+            await chunks.aclose()
+
+    def test_own_order_changes_streamed(self):
+        events = async_to_sync(self.stream_events)(2)
+        self.assertEqual(
+            [(event["id"], event["status"], event["charges"]) for event in events],
+            [
+                (self.order.pk, Order.OrderStatus.PENDING.value, 12000),
+                (self.order.pk, Order.OrderStatus.IN_PROGRESS.value, 12000),
+            ],
+        )
+
+    def test_requires_token(self):
+        response = self.api.get("/api/v1/orders/events")
+        self.assertEqual(response.status_code, 401)
+
+
+class OrderImportExportTest(TransactionTestCase):
+    def test_export_imported_back(self):
+        client_user = get_user_model().objects.create_user(
+            username="export-client", password="secret-pass-123"
+        )
+        service = Service.objects.create(
+            name=Service.ServiceName.EMBROIDERY.value, description="Embroidery"
+        )
+        order = Order.objects.create(
+            client=client_user,
+            service=service,
+            details="Monogram shirts",
+            material_type=Order.MaterialType.LINEN.value,
+            quantity=3,
+            charges=1500,
+        )
+        exported = "".join(
+            export_chunks("csv", OrderAdmin.export_columns, Order.objects.all())
+        )
+        Order.objects.all().delete()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "orders.csv")
+            path.write_text(exported, encoding="utf-8")
+            call_command("import_orders", str(path), stdout=StringIO())
+        imported = Order.objects.get()
+        self.assertEqual(imported.pk, order.pk)
+        self.assertEqual(imported.client, client_user)
+        self.assertEqual(imported.service, service)
+        self.assertEqual(imported.details, order.details)
+        self.assertEqual((imported.quantity, imported.charges), (3, 1500))
+        self.assertEqual(imported.created_at, order.created_at)
@@ -0,0 +1,114 @@
+"""In-process fan-out of events to the API's event streams.
+
+Events published from any thread are handed to the asyncio queues of the
+streams subscribed to their channel. The latest events are kept so that
+reconnecting streams are sent the ones they missed.
+
+Only streams served by the publishing process receive its events. Changes
+made by another worker process reach clients on their next fetch.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    channel: int
+    data: dict = field(hash=False)
+
+
+class Subscription:
+    """Events of one channel queued for a stream"""
+
+    def __init__(self, channel: int, queue_size: int):
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(queue_size)
+        self.overflowed = False
+
+    def deliver(self, event: Event):
+        # Once one is dropped, later events would reach the client out of order
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self) -> Event | None:
+        """Next event. None after the queued ones when some were dropped, the
+        client then has to reconnect to be sent the rest."""
+        if self.overflowed and self.queue.empty():
+            return None
+        return await self.queue.get()
+
+
+class EventBroker:
+    def __init__(self, history: int, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._history: deque[Event] = deque(maxlen=history)
+        self._subscriptions: dict[int, set[Subscription]] = {}
+        # Microseconds since the epoch at startup, so that ids keep increasing
+        # across restarts
+        self._last_id = time.time_ns() // 1000
+        # Events up to this id can't be replayed
+        self._forgotten_id = self._last_id
+
+    def publish(self, channel: int, data: dict) -> Event:
+        with self._lock:
+            self._last_id += 1
+            event = Event(self._last_id, channel, data)
+            if len(self._history) == self._history.maxlen:
+                self._forgotten_id = self._history[0].id
+            self._history.append(event)
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # Event loop closed without unsubscribing
+                self.unsubscribe(subscription)
+        return event
+
+    def subscribe(
+        self, channel: int, last_event_id: int = None
+    ) -> tuple[Subscription, list[Event] | None]:
+        """Subscribes the running event loop to `channel`.
+
+        Returns:
+            tuple: Subscription, events of the channel after `last_event_id`
+                or None when some of those can no longer be replayed.
+        """
+        subscription = Subscription(channel, self.queue_size)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+            if last_event_id is None:
+                missed = []
+            elif last_event_id < self._forgotten_id:
+                missed = None
+            else:
+                missed = [
+                    event
+                    for event in self._history
+                    if event.id > last_event_id and event.channel == channel
+                ]
+        return subscription, missed
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.channel, None)
+
+
+order_events = EventBroker(settings.ORDER_EVENTS_HISTORY)
+"""Status & charges changes of orders, on the channel of their client"""
@@ -0,0 +1,23 @@
+"""Password hashing entry points run by the API's hashing processes
+"""
+
+import os
+
+
+def setup_worker():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tailoring_ms.settings")
+    import django
+
+    django.setup()
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    from django.contrib.auth.hashers import check_password
+
+    return check_password(password, encoded)
+
+
+def hash_password(password: str) -> str:
+    from django.contrib.auth.hashers import make_password
+
+    return make_password(password)
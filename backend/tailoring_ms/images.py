@@ -0,0 +1,155 @@
+"""Image processing helpers built on Pillow
+"""
+
+from io import BytesIO
+from os import path
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+variants_dir = "variants"
+
+image_formats = {
+    # format : (Pillow format name, file extension)
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+    "png": ("PNG", "png"),
+    "gif": ("GIF", "gif"),
+}
+
+image_signatures = (
+    # (offset, magic bytes, format)
+    (0, b"\xff\xd8\xff", "jpeg"),
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"GIF87a", "gif"),
+    (0, b"GIF89a", "gif"),
+    (8, b"WEBP", "webp"),
+)
+
+
+def sniff_image_format(head: bytes) -> str | None:
+    """Detects image format from the first bytes of a file"""
+    for offset, magic, format in image_signatures:
+        if head[offset : offset + len(magic)] == magic:
+            if format == "webp" and not head.startswith(b"RIFF"):
+                continue
+            return format
+
+
+def get_variant_name(source: str, width: int, format: str) -> str:
+    """Storage path of the `width` pixels wide `format` variant of `source`"""
+    stem = path.splitext(source)[0]
+    return f"{variants_dir}/{stem}_{width}w.{image_formats[format][1]}"
+
+
+class InvalidImageError(ValueError):
+    """File can't be decoded as an image, such as when corrupt or truncated"""
+
+
+class ImageTooLargeError(ValueError):
+    """Image has more pixels than Pillow's decompression bomb limit"""
+
+
+def load_image(file) -> Image.Image:
+    """Opens image and applies its EXIF orientation
+
+    Raises:
+        InvalidImageError: When the file is not a readable image.
+        ImageTooLargeError: When the image has too many pixels to be decoded.
+    """
+    try:
+        image = Image.open(file)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    except Image.DecompressionBombError as e:
+        raise ImageTooLargeError(str(e)) from e
+    except (UnidentifiedImageError, OSError, SyntaxError) as e:
+        raise InvalidImageError(str(e)) from e
+    return image
+
+
+def encode_image(image: Image.Image, format: str) -> bytes:
+    pillow_format = image_formats[format][0]
+    if pillow_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = BytesIO()
+    image.save(
+        buffer,
+        format=pillow_format,
+        quality=settings.IMAGE_VARIANT_QUALITY,
+        optimize=True,
+    )
+    return buffer.getvalue()
+
+
+def resize_to_width(image: Image.Image, width: int) -> Image.Image:
+    if image.width <= width:
+        return image
+    height = round(image.height * width / image.width)
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def generate_variants(source: str) -> dict[str, dict[str, str]]:
+    """Writes resized variants of `source` to storage.
+
+    Only widths smaller than the original are produced; an image narrower
+    than every configured width gets a single variant at its own width.
+
+    Returns:
+        dict: {format : {width : variant path}}
+
+    Raises:
+        InvalidImageError: When `source` is not a readable image.
+        ImageTooLargeError: When `source` has too many pixels to be decoded.
+    """
+    with default_storage.open(source) as file:
+        image = load_image(file)
+    widths = [
+        width for width in sorted(settings.IMAGE_VARIANT_WIDTHS) if width < image.width
+    ] or [image.width]
+    variants = {}
+    for width in widths:
+        resized = resize_to_width(image, width)
+        for format in settings.IMAGE_VARIANT_FORMATS:
+            name = get_variant_name(source, width, format)
+            if default_storage.exists(name):
+                default_storage.delete(name)
+            variants.setdefault(format, {})[str(width)] = default_storage.save(
+                name, ContentFile(encode_image(resized, format))
+            )
+    return variants
+
+
+def make_srcset(variants: dict[str, dict[str, str]]) -> dict[str, str]:
+    """Turns stored variants into `srcset` attribute values keyed by format"""
+    return {
+        format: ", ".join(
+            f"{path.join(settings.MEDIA_URL, name)} {width}w"
+            for width, name in sorted(widths.items(), key=lambda item: int(item[0]))
+        )
+        for format, widths in variants.items()
+    }
+
+
+def downscale_image(file, format: str, max_dimension: int) -> ContentFile | None:
+    """Shrinks image so neither side exceeds `max_dimension`.
+
+    The image is decoded even when `max_dimension` is 0, which disables
+    resizing, so corrupt files are still caught.
+
+    Returns:
+        ContentFile | None: Re-encoded image or None when no resizing is needed.
+
+    Raises:
+        InvalidImageError: When the file is not a readable image.
+        ImageTooLargeError: When the image has too many pixels to be decoded.
+    """
+    image = load_image(file)
+    file.seek(0)
+    if format == "gif" or not max_dimension or max(image.size) <= max_dimension:
+        # Leaves animations alone
+        return None
+    image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    return ContentFile(encode_image(image, format))
@@ -0,0 +1,255 @@
+"""Full-text search index of orders, messages, feedbacks and users.
+
+Each indexed model has a table holding one document per object, keyed by the
+object's primary key: an FTS5 virtual table on SQLite or a table with a FULLTEXT
+index on MySQL, chosen by `DATABASE_ENGINE`. Other databases fall back to
+`icontains` lookups. Signals keep the documents in sync with the objects and
+`rebuild_search_index` fills them for existing rows.
+
+Queries match objects containing every word searched, each as a prefix.
+"""
+
+import re
+from typing import Iterable
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import Model, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from tailoring_ms.exports import iterate_chunks
+
+indexed_fields: dict[str, tuple[str, ...]] = {
+    # model label : fields making up its document
+    "tailoring.order": ("details", "colors"),
+    "external.message": ("sender", "email", "body"),
+    "external.servicefeedback": ("message",),
+    "users.customuser": ("username", "first_name", "last_name", "email"),
+}
+
+# Longer queries are cut rather than compiled into huge match expressions
+max_terms = 10
+
+
+def get_terms(query: str) -> list[str]:
+    """Words of `query`, stripped of any operator of the index query syntax"""
+    return re.findall(r"\w+", query.lower())[:max_terms]
+
+
+def is_indexed(model: type[Model]) -> bool:
+    return model._meta.label_lower in indexed_fields
+
+
+def get_fields(model: type[Model]) -> tuple[str, ...]:
+    return indexed_fields[model._meta.label_lower]
+
+
+def get_document(values: Iterable) -> str:
+    return "\n".join(str(value) for value in values if value)
+
+
+class SearchBackend:
+    """Documents in a table per model, matched through `match_sql`"""
+
+    def get_table(self, model: type[Model]) -> str:
+        return connection.ops.quote_name(f"search_{model._meta.db_table}")
+
+    def create_table_sql(self, table: str) -> str:
+        raise NotImplementedError
+
+    def match_sql(
+        self, table: str, terms: list[str], limit: int = None
+    ) -> tuple[str, list]:
+        """Query selecting the primary keys of matching objects, best first
+        when limited"""
+        raise NotImplementedError
+
+    def setup(self):
+        with connection.cursor() as cursor:
+            for label in indexed_fields:
+                cursor.execute(
+                    self.create_table_sql(self.get_table(apps.get_model(label)))
+                )
+
+    def index(self, model: type[Model], documents: list[tuple[int, str]]):
+        """Adds or replaces (primary key, text) documents"""
+        if documents:
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    f"REPLACE INTO {self.get_table(model)} "
+                    f"({self.key_column}, content) VALUES (%s, %s)",
+                    documents,
+                )
+
+    def remove(self, model: type[Model], pks: list[int]):
+        if pks:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {self.get_table(model)} "
+                    f"WHERE {self.key_column} IN ({', '.join(['%s'] * len(pks))})",
+                    pks,
+                )
+
+    def clear(self, model: type[Model]):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.get_table(model)}")
+
+    def matching(self, model: type[Model], terms: list[str]) -> Q:
+        return Q(pk__in=RawSQL(*self.match_sql(self.get_table(model), terms)))
+
+    def ranked(self, queryset: QuerySet, terms: list[str], limit: int) -> list[Model]:
+        sql, params = self.match_sql(self.get_table(queryset.model), terms, limit)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            pks = [row[0] for row in cursor.fetchall()]
+        objects = queryset.in_bulk(pks)
+        return [objects[pk] for pk in pks if pk in objects]
+
+
+class SQLiteBackend(SearchBackend):
+    key_column = "rowid"
+
+    def create_table_sql(self, table: str) -> str:
+        # Prefix indexes make the prefix matching of short words cheap
+        return (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(content, "
+            "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+
+    def match_sql(self, table, terms, limit=None):
+        sql = f"SELECT rowid FROM {table} WHERE {table} MATCH %s"
+        params = [" ".join(f'"{term}"*' for term in terms)]
+        if limit:
+            sql += " ORDER BY rank LIMIT %s"
+            params.append(limit)
+        return sql, params
+
+
+class MySQLBackend(SearchBackend):
+    """Words shorter than `innodb_ft_min_token_size` (3 by default) and
+    InnoDB stopwords are not indexed, so queries made only of those find
+    nothing."""
+
+    key_column = "object_id"
+
+    def create_table_sql(self, table: str) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "object_id BIGINT NOT NULL PRIMARY KEY, content LONGTEXT NOT NULL, "
+            "FULLTEXT KEY content_fulltext (content)"
+            ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        )
+
+    def match_sql(self, table, terms, limit=None):
+        against = "MATCH (content) AGAINST (%s IN BOOLEAN MODE)"
+        expression = " ".join(f"+{term}*" for term in terms)
+        sql = f"SELECT object_id FROM {table} WHERE {against}"
+        params = [expression]
+        if limit:
+            sql += f" ORDER BY {against} DESC LIMIT %s"
+            params.extend((expression, limit))
+        return sql, params
+
+
+class FallbackBackend(SearchBackend):
+    """Keeps no documents and looks words up in the objects' fields"""
+
+    def setup(self):
+        pass
+
+    def index(self, model, documents):
+        pass
+
+    def remove(self, model, pks):
+        pass
+
+    def clear(self, model):
+        pass
+
+    def matching(self, model, terms):
+        q = Q()
+        for term in terms:
+            q &= Q.create(
+                [(f"{field}__icontains", term) for field in get_fields(model)],
+                connector=Q.OR,
+            )
+        return q
+
+    def ranked(self, queryset, terms, limit):
+        return list(queryset.filter(self.matching(queryset.model, terms))[:limit])
+
+
+backends = {
+    "sqlite": SQLiteBackend,
+    "mysql": MySQLBackend,
+}
+
+backend: SearchBackend = backends.get(connection.vendor, FallbackBackend)()
+
+
+def index_objects(model: type[Model], objects: Iterable[Model]):
+    fields = get_fields(model)
+    backend.index(
+        model,
+        [
+            (obj.pk, get_document(getattr(obj, field) for field in fields))
+            for obj in objects
+        ],
+    )
+
+
+def index_queryset(queryset: QuerySet, chunk_size: int = None) -> int:
+    """Indexes the objects a chunk at a time. Returns how many were indexed."""
+    indexed = 0
+    for rows in iterate_chunks(
+        queryset, ("pk", *get_fields(queryset.model)), chunk_size
+    ):
+        backend.index(queryset.model, [(row[0], get_document(row[1:])) for row in rows])
+        indexed += len(rows)
+    return indexed
+
+
+def search(queryset: QuerySet, query: str, relations: Iterable[str] = ()) -> QuerySet:
+    """Objects matching `query`, or related through one of the `relations`
+    foreign keys to an indexed object matching it. The queryset's model needs
+    no index of its own when relations are given."""
+    terms = get_terms(query)
+    if not terms:
+        return queryset.none()
+    q = (
+        backend.matching(queryset.model, terms)
+        if is_indexed(queryset.model)
+        else Q(pk__in=[])
+    )
+    for relation in relations:
+        related_model = queryset.model._meta.get_field(relation).related_model
+        q |= Q(
+            **{
+                f"{relation}__in": related_model.objects.filter(
+                    backend.matching(related_model, terms)
+                ).values("pk")
+            }
+        )
+    return queryset.filter(q)
+
+
+def search_ranked(queryset: QuerySet, query: str, limit: int) -> list[Model]:
+    """Up to `limit` objects matching `query`, best matches first"""
+    terms = get_terms(query)
+    if not terms:
+        return []
+    return backend.ranked(queryset, terms, limit)
+
+
+class SearchIndexMixin:
+    """Admin searching through the full-text index instead of `LIKE` scans.
+
+    `search_fields` must still be set for the search box to show. Foreign keys
+    listed in `search_index_relations` match when their object does.
+    """
+
+    search_index_relations: tuple[str, ...] = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return search(queryset, search_term, self.search_index_relations), False
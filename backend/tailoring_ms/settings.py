@@ -106,6 +106,10 @@ except ImportError:
     # Still okay maybe other engines are set.
     pass
 
+DATABASE_POOL_SIZE = int(
+    os.getenv("DATABASE_POOL_SIZE", 0)
+)  # Max connections held by the API process. 0 keeps one per worker thread
+
 DATABASES = {
     "default": {
         "ENGINE": os.getenv("DATABASE_ENGINE", "django.db.backends.sqlite3"),
@@ -114,9 +118,20 @@ DATABASES = {
         "PASSWORD": os.getenv("DATABASE_PASSWORD", "development"),
         "HOST": os.getenv("DATABASE_HOST", "localhost"),
         "PORT": os.getenv("DATABASE_PORT", "3306"),
+        "CONN_MAX_AGE": int(
+            os.getenv("DATABASE_CONN_MAX_AGE", 600)
+        ),  # Seconds a connection is reused. 0 closes it after every ORM call
+        "CONN_HEALTH_CHECKS": os.getenv("DATABASE_CONN_HEALTH_CHECKS", "1") == "1",
     }
 }
 
+if DATABASE_POOL_SIZE and "postgresql" in DATABASES["default"]["ENGINE"]:
+    # Native psycopg pool, replaces persistent connections
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {"min_size": 1, "max_size": DATABASE_POOL_SIZE}
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -152,6 +167,22 @@ EMAIL_HOST_PASSWORD = os.getenv(
 )  # Your email password or app-specific password
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")  # Optional: default sender email
 
+# Outgoing emails are queued and delivered by `manage.py send_queued_emails`
+
+EMAIL_QUEUE_BATCH_SIZE = int(os.getenv("EMAIL_QUEUE_BATCH_SIZE", 50))
+
+EMAIL_QUEUE_MAX_ATTEMPTS = int(os.getenv("EMAIL_QUEUE_MAX_ATTEMPTS", 5))
+
+EMAIL_QUEUE_RETRY_DELAY = float(
+    os.getenv("EMAIL_QUEUE_RETRY_DELAY", 60)
+)  # Seconds, doubles after every failed attempt
+
+EMAIL_QUEUE_POLL_INTERVAL = float(os.getenv("EMAIL_QUEUE_POLL_INTERVAL", 5))
+
+EMAIL_QUEUE_CLAIM_TIMEOUT = float(
+    os.getenv("EMAIL_QUEUE_CLAIM_TIMEOUT", 600)
+)  # Seconds before emails claimed by a worker that died are retried
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -189,6 +220,47 @@ MEDIA_URL = "/media/"
 
 MEDIA_ROOT = files_root / "media"
 
+# Image uploads through the API
+
+UPLOAD_MAX_SIZE = int(os.getenv("UPLOAD_MAX_SIZE", 5 * 1024 * 1024))  # Bytes
+
+UPLOAD_IMAGE_MAX_DIMENSION = int(
+    os.getenv("UPLOAD_IMAGE_MAX_DIMENSION", 2048)
+)  # Pixels, larger images are downscaled on upload. 0 disables downscaling
+
+# Resized copies of uploaded images, generated by `manage.py generate_image_variants`
+
+IMAGE_VARIANT_WIDTHS = [
+    int(width) for width in os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,1280").split(",")
+]
+
+IMAGE_VARIANT_FORMATS = [
+    format.strip()
+    for format in os.getenv("IMAGE_VARIANT_FORMATS", "webp,jpeg").split(",")
+]  # webp and/or jpeg
+
+IMAGE_VARIANT_QUALITY = int(os.getenv("IMAGE_VARIANT_QUALITY", 80))
+
+IMAGE_VARIANT_BATCH_SIZE = int(os.getenv("IMAGE_VARIANT_BATCH_SIZE", 20))
+
+IMAGE_VARIANT_POLL_INTERVAL = float(os.getenv("IMAGE_VARIANT_POLL_INTERVAL", 10))
+
+# Admin exports written by `manage.py run_export_jobs`
+
+EXPORT_ROOT = BASE_DIR / os.getenv(
+    "EXPORT_ROOT", "files/exports"
+)  # Downloaded through the admin only, keep it out of MEDIA_ROOT
+
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 2000))  # Rows read per query
+
+EXPORT_POLL_INTERVAL = float(os.getenv("EXPORT_POLL_INTERVAL", 10))
+
+# Order imports through the admin & `manage.py import_orders`
+
+IMPORT_BATCH_SIZE = int(
+    os.getenv("IMPORT_BATCH_SIZE", 1000)
+)  # Rows per bulk insert or update
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -207,6 +279,58 @@ SITE_NAME = os.getenv("SITE_NAME", "Tailoring MS")
 
 SITE_ADDRESS = os.getenv("SITE_ADDRESS", "http://localhost:8000")
 
+# API
+
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 1024))  # 0 disables caching
+
+TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", 300))  # Seconds
+
+API_THREADPOOL_SIZE = int(
+    os.getenv("API_THREADPOOL_SIZE", 40)
+)  # Worker threads running sync endpoints & ORM calls
+
+LANDING_CACHE_TTL = float(os.getenv("LANDING_CACHE_TTL", 300))  # Seconds
+
+LANDING_CACHE_MAX_AGE = int(
+    os.getenv("LANDING_CACHE_MAX_AGE", 60)
+)  # Seconds browsers & CDNs may reuse landing-page responses
+
+PASSWORD_HASHING_WORKERS = int(
+    os.getenv("PASSWORD_HASHING_WORKERS", 2)
+)  # Processes hashing passwords for login & reset, bounds their concurrency
+
+RATE_LIMIT_BACKEND = os.getenv(
+    "RATE_LIMIT_BACKEND", "api.ratelimit.LocalBackend"
+)  # Or api.ratelimit.CacheBackend to share limits across workers
+
+RATE_LIMIT_CACHE = os.getenv("RATE_LIMIT_CACHE", "default")  # CacheBackend's cache
+
+# Requests per second/minute/hour/day allowed to each client. 0 disables
+
+RATE_LIMIT_LOGIN = os.getenv("RATE_LIMIT_LOGIN", "10/minute")
+
+RATE_LIMIT_PASSWORD_RESET = os.getenv("RATE_LIMIT_PASSWORD_RESET", "5/hour")
+
+RATE_LIMIT_USER_EXISTS = os.getenv("RATE_LIMIT_USER_EXISTS", "30/minute")
+
+RATE_LIMIT_MESSAGE = os.getenv("RATE_LIMIT_MESSAGE", "10/hour")
+
+ORDER_EVENTS_HISTORY = int(
+    os.getenv("ORDER_EVENTS_HISTORY", 1000)
+)  # Latest order events replayed to reconnecting streams
+
+ORDER_EVENTS_KEEPALIVE = float(
+    os.getenv("ORDER_EVENTS_KEEPALIVE", 15)
+)  # Seconds between comments sent to idle order event streams
+
+SERVER_TIMING = (
+    os.getenv("SERVER_TIMING", "1") == "1"
+)  # Send per-request DB, serialization, template & mail timings
+
+SLOW_REQUEST_THRESHOLD = float(
+    os.getenv("SLOW_REQUEST_THRESHOLD", 0)
+)  # Seconds, requests taking longer are logged. 0 disables
+
 UNFOLD = {
     "SITE_TITLE": SITE_NAME,
     "SITE_HEADER": f"{SITE_NAME}",
@@ -247,7 +371,7 @@ UNFOLD = {
     "SHOW_LANGUAGES": True,
     # "ENVIRONMENT": "sample_app.environment_callback", # environment name in header
     # "ENVIRONMENT_TITLE_PREFIX": "sample_app.environment_title_prefix_callback", # environment name prefix in title tag
-    # "DASHBOARD_CALLBACK": "sample_app.dashboard_callback",
+    "DASHBOARD_CALLBACK": "tailoring.views.dashboard_callback",
     # "THEME": "dark", # Force theme: "dark" or "light". Will disable theme switcher
     "LOGIN": {
         "image": lambda request: "/media/default/threads-5547529_1920.jpg",
@@ -393,6 +517,20 @@ UNFOLD = {
                         "link": reverse_lazy("admin:external_faq_changelist"),
                         "permission": lambda request: request.user.is_staff,
                     },
+                    {
+                        "title": _("Outgoing emails"),
+                        "icon": "outgoing_mail",
+                        "link": reverse_lazy("admin:external_outgoingemail_changelist"),
+                        "permission": lambda request: request.user.is_staff,
+                    },
+                    {
+                        "title": _("Dead-letter emails"),
+                        "icon": "unsubscribe",
+                        "link": reverse_lazy(
+                            "admin:external_deadletteremail_changelist"
+                        ),
+                        "permission": lambda request: request.user.is_staff,
+                    },
                 ],
             },
         ],
@@ -0,0 +1,65 @@
+"""Per-request phase timing, reported through the `Server-Timing` header.
+
+Phases may nest; `mail` for instance includes the `db` time of queueing it.
+Outside an API request, timing calls do nothing.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
+
+class RequestTimings:
+    def __init__(self):
+        # phase : [seconds, calls]
+        self.phases: dict[str, list] = {}
+        self.marks: dict[str, float] = {}
+        self._lock = Lock()
+
+    def add(self, phase: str, duration: float):
+        # Worker threads report into the same request
+        with self._lock:
+            entry = self.phases.setdefault(phase, [0.0, 0])
+            entry[0] += duration
+            entry[1] += 1
+
+    def mark(self, name: str):
+        self.marks[name] = time.perf_counter()
+
+    def count(self, phase: str) -> int:
+        return self.phases.get(phase, (0, 0))[1]
+
+    def header(self, total: float) -> str:
+        """`Server-Timing` value with durations in milliseconds"""
+        with self._lock:
+            entries = [
+                f'{phase};dur={duration * 1000:.1f};desc="{calls} calls"'
+                for phase, (duration, calls) in self.phases.items()
+            ]
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+
+current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def record_timing(phase: str, duration: float):
+    timings = current_timings.get()
+    if timings is not None:
+        timings.add(phase, duration)
+
+
+@contextmanager
+def timed(phase: str):
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start_time)
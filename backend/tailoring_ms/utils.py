@@ -1,11 +1,12 @@
+from contextlib import contextmanager
 from enum import Enum
 
 from os import path
 
-from django.core.mail import send_mail
-from django.conf import settings
+from django.db import models
 from django.utils import timezone
 from datetime import datetime, timedelta
+from tailoring_ms.timing import timed
 
 
 def generate_document_filepath(instance, filename: str) -> str:
@@ -14,14 +15,30 @@ def generate_document_filepath(instance, filename: str) -> str:
 
 
 def send_email(subject: str, message: str, recipient: str, html_message: str = None):
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[recipient],
-        fail_silently=(settings.DEBUG == False),  # Silent in production
-        html_message=html_message,
-    )
+    """Queues email for delivery by the `send_queued_emails` worker"""
+    from external.models import OutgoingEmail
+
+    with timed("mail"):
+        return OutgoingEmail.queue(
+            subject=subject,
+            message=message,
+            recipient=recipient,
+            html_message=html_message,
+        )
+
+
+def send_emails(emails: list[dict]) -> list:
+    """Queues many emails with a single insert.
+
+    Args:
+        emails: [dict(subject, message, recipient, html_message)]
+    """
+    from external.models import OutgoingEmail
+
+    with timed("mail"):
+        return OutgoingEmail.objects.bulk_create(
+            [OutgoingEmail(**email) for email in emails]
+        )
 
 
 def get_expiry_datetime(minutes: float = 30) -> datetime:
@@ -33,3 +50,26 @@ class EnumWithChoices(Enum):
     @classmethod
     def choices(cls):
         return [(key.value, key.name) for key in cls]
+
+
+@contextmanager
+def explicit_timestamps(*models_: type[models.Model]):
+    """Keeps the timestamps set on instances instead of auto_now(_add) values.
+
+    Fields are changed process wide, so use it in management commands only.
+    """
+    fields = [
+        field
+        for model in models_
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.DateTimeField)
+        and (field.auto_now or field.auto_now_add)
+    ]
+    flags = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in flags:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
@@ -10,6 +10,7 @@ from django.contrib.admin.utils import unquote
 from django.contrib.auth import update_session_auth_hash
 from django.core.exceptions import PermissionDenied
 from django.db import router, transaction
+from django.db.models import Count, Q
 from django.http import Http404, HttpResponseRedirect
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
@@ -30,20 +31,36 @@ from django.contrib.auth.models import Group
 
 from unfold.forms import AdminPasswordChangeForm, UserChangeForm, UserCreationForm
 from unfold.admin import ModelAdmin
+from tailoring_ms.exports import StreamingExportMixin
+from tailoring_ms.search import SearchIndexMixin
 
 
 @admin.register(CustomUser)
-class CustomUserAdmin(ModelAdmin):
+class CustomUserAdmin(SearchIndexMixin, StreamingExportMixin, ModelAdmin):
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                total_orders_count=Count("orders"),
+                in_progress_orders_count=Count(
+                    "orders", filter=Q(orders__status="In Progress")
+                ),
+            )
+        )
 
     def total_orders(self, obj: CustomUser) -> int:
-        return obj.orders.count()
+        return obj.total_orders_count
 
     total_orders.short_description = _("Total orders")
+    total_orders.admin_order_field = "total_orders_count"
 
     def in_progress_orders(self, obj: CustomUser) -> int:
-        return obj.orders.filter(status="In Progress").count()
+        return obj.in_progress_orders_count
 
     in_progress_orders.short_description = _("In progress orders")
+    in_progress_orders.admin_order_field = "in_progress_orders_count"
     form = UserChangeForm
     add_form = UserCreationForm
     change_password_form = AdminPasswordChangeForm
@@ -114,6 +131,24 @@ class CustomUserAdmin(ModelAdmin):
         ),
     )
     readonly_fields = ("last_login", "date_joined")
+    actions = StreamingExportMixin.export_actions
+    export_columns = (
+        ("id", "id"),
+        ("username", "username"),
+        ("first_name", "first_name"),
+        ("last_name", "last_name"),
+        ("email", "email"),
+        ("phone_number", "phone_number"),
+        ("gender", "gender"),
+        ("date_of_birth", "date_of_birth"),
+        ("location", "location"),
+        ("is_active", "is_active"),
+        ("is_staff", "is_staff"),
+        ("total_orders", "total_orders_count"),
+        ("in_progress_orders", "in_progress_orders_count"),
+        ("last_login", "last_login"),
+        ("date_joined", "date_joined"),
+    )
 
     def get_fieldsets(self, request, obj=None):
         if not obj:
@@ -295,10 +330,11 @@ class GroupAdmin(BaseGroupAdmin, ModelAdmin):
 
 
 @admin.register(UserMeasurements)
-class UserMeasurementsAdmin(ModelAdmin):
+class UserMeasurementsAdmin(SearchIndexMixin, ModelAdmin):
     list_display = ["user", "chest", "waist", "hips", "inseam", "neck"]
     list_filter = ["user__username", "date_created", "date_updated"]
     search_fields = ["user__username", "user__email"]
+    search_index_relations = ("user",)
     ordering = ["-date_created"]
     fieldsets = (
         (None, {"fields": ("user",)}),
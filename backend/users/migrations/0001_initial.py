@@ -0,0 +1,90 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:37
+
+import datetime
+import django.contrib.auth.models
+import django.contrib.auth.validators
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+import tailoring_ms.utils
+import users.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, unique=True, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
+                ('first_name', models.CharField(blank=True, max_length=150, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
+                ('email', models.EmailField(blank=True, max_length=254, verbose_name='email address')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('date_of_birth', models.DateField(default=datetime.date(200, 1, 1), help_text='Date user was born', verbose_name='Date of birth')),
+                ('gender', models.CharField(choices=[('M', 'MALE'), ('F', 'FEMALE'), ('O', 'OTHER')], default='O', help_text='Select one', max_length=10, verbose_name='gender')),
+                ('phone_number', models.CharField(blank=True, help_text='Contact phone number', max_length=15, null=True, validators=[django.core.validators.RegexValidator(message="Phone number must be entered in the format: '+254...' or '07...'. Up to 15 digits allowed.", regex='^\\+?1?\\d{9,15}$')])),
+                ('location', models.CharField(blank=True, help_text='Current location address', max_length=50, null=True)),
+                ('profile', models.ImageField(blank=True, default='default/user.png', null=True, upload_to=users.models.generate_profile_filepath, validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png'])], verbose_name='Profile Picture')),
+                ('token', models.CharField(blank=True, help_text='Token for validation', max_length=40, null=True, unique=True, verbose_name='token')),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'user',
+                'verbose_name_plural': 'users',
+            },
+            managers=[
+                ('objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AuthToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(db_index=True, help_text='auth token value', max_length=80)),
+                ('expiry_datetime', models.DateTimeField(default=tailoring_ms.utils.get_expiry_datetime, help_text='Expiry datetime')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='auth_token', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserMeasurements',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('chest', models.DecimalField(decimal_places=2, help_text='Chest measurement in inches', max_digits=5)),
+                ('waist', models.DecimalField(decimal_places=2, help_text='Waist measurement in inches', max_digits=5)),
+                ('hips', models.DecimalField(decimal_places=2, default=None, help_text='Hips measurement in inches', max_digits=5)),
+                ('inseam', models.DecimalField(decimal_places=2, help_text='Inseam measurement in inches', max_digits=5)),
+                ('neck', models.DecimalField(decimal_places=2, help_text='Neck measurement in inches', max_digits=5)),
+                ('sleeve_length', models.DecimalField(decimal_places=2, help_text='Sleeve length in inches', max_digits=5)),
+                ('shoulder_width', models.DecimalField(decimal_places=2, help_text='Shoulder width in inches', max_digits=5)),
+                ('thigh', models.DecimalField(decimal_places=2, help_text='Thigh measurement in inches', max_digits=5)),
+                ('calf', models.DecimalField(decimal_places=2, help_text='Calf measurement in inches', max_digits=5)),
+                ('date_created', models.DateTimeField(auto_now_add=True, verbose_name='date created')),
+                ('date_updated', models.DateTimeField(auto_now=True, verbose_name='date updated')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='measurements', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'Measurement',
+                'verbose_name_plural': 'Measurements',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['email'], name='user_email_idx'),
+        ),
+    ]
@@ -84,6 +84,7 @@ class CustomUser(AbstractUser):
     class Meta:
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        indexes = [models.Index(fields=["email"], name="user_email_idx")]
 
     def age(self):
         today = datetime.today().date()
@@ -105,7 +106,9 @@ class AuthToken(models.Model):
     user = models.OneToOneField(
         CustomUser, on_delete=models.CASCADE, related_name="auth_token"
     )
-    token = models.CharField(help_text=_("auth token value"), max_length=80, null=False)
+    token = models.CharField(
+        help_text=_("auth token value"), max_length=80, null=False, db_index=True
+    )
     expiry_datetime = models.DateTimeField(
         help_text=_("Expiry datetime"), null=False, default=get_expiry_datetime
     )
@@ -1,3 +1,278 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.test import SimpleTestCase, TransactionTestCase
+from starlette.requests import Request
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from api import app
+from api.conditional import Validators, check_if_match, is_not_modified
+from api.ratelimit import RateLimit, LocalBackend, CacheBackend, gcra, parse_rate
+from api.timing import TimedRoute
+from api.v1.utils import generate_token
+from asgiref.sync import async_to_sync
+from users.models import CustomUser
+from tailoring_ms.settings import RATE_LIMIT_USER_EXISTS
 
 # Create your tests here.
+
+
+def make_request(host: str, headers: dict = {}) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in headers.items()
+            ],
+            "client": (host, 50000),
+        }
+    )
+
+
+class RateLimitTest(SimpleTestCase):
+    def test_rotating_tokens_share_client_bucket(self):
+        limit = RateLimit("test-rotating-tokens", "3/minute")
+        for index in range(3):
+            async_to_sync(limit)(
+                make_request("10.0.0.1", {"Authorization": f"Bearer fake-{index}"})
+            )
+        with self.assertRaises(HTTPException) as raised:
+            async_to_sync(limit)(
+                make_request("10.0.0.1", {"Authorization": "Bearer fake-3"})
+            )
+        self.assertEqual(raised.exception.status_code, 429)
+
+    def test_clients_have_own_buckets(self):
+        limit = RateLimit("test-client-buckets", "1/minute")
+        async_to_sync(limit)(make_request("10.0.0.2"))
+        async_to_sync(limit)(make_request("10.0.0.3"))
+
+
+class GCRATest(SimpleTestCase):
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("10/minute"), (10, 60))
+        self.assertEqual(parse_rate(" 5 / hour "), (5, 3600))
+        self.assertEqual(parse_rate(""), (0, 0))
+        with self.assertRaises(ValueError):
+            parse_rate("5/fortnight")
+
+    def test_burst_then_refill(self):
+        tat = now = 1000.0
+        for _ in range(3):
+            tat, retry_after = gcra(tat, now, 3, 60)
+            self.assertEqual(retry_after, 0)
+        tat, retry_after = gcra(tat, now, 3, 60)
+        self.assertEqual(retry_after, 20)
+        # Refused requests take no token
+        self.assertEqual(gcra(tat, now + 19, 3, 60)[1], 1)
+        tat, retry_after = gcra(tat, now + 20, 3, 60)
+        self.assertEqual(retry_after, 0)
+        self.assertEqual(gcra(tat, now + 20, 3, 60)[1], 20)
+        # Idle buckets refill up to the burst, no further
+        now += 600
+        for _ in range(3):
+            tat, retry_after = gcra(tat, now, 3, 60)
+            self.assertEqual(retry_after, 0)
+        self.assertEqual(gcra(tat, now, 3, 60)[1], 20)
+
+    def test_backends(self):
+        for backend, clock in (
+            (LocalBackend(), "time.monotonic"),
+            (CacheBackend(), "time.time"),
+        ):
+            with self.subTest(backend=backend.__class__.__name__):
+                key = f"test-backend-{backend.__class__.__name__}"
+                with mock.patch(clock, return_value=5000.0):
+                    self.assertEqual(
+                        [backend.hit(key, 2, 10) for _ in range(3)], [0, 0, 5]
+                    )
+                with mock.patch(clock, return_value=5005.0):
+                    self.assertEqual(backend.hit(key, 2, 10), 0)
+                    self.assertEqual(backend.hit(key, 2, 10), 5)
+
+
+class RateLimitedEndpointTest(TransactionTestCase):
+    def test_fake_tokens_hit_limit(self):
+        client = TestClient(app)
+        limit = int(RATE_LIMIT_USER_EXISTS.partition("/")[0])
+        responses = [
+            client.get(
+                "/api/v1/user/exists",
+                params={"username": "nobody"},
+                headers={"Authorization": f"Bearer fake-{index}"},
+            )
+            for index in range(limit + 1)
+        ]
+        self.assertEqual(responses[-1].status_code, 429)
+        # A token is back after period / limit seconds
+        self.assertEqual(responses[-1].headers["Retry-After"], str(60 // limit))
+
+
+class StaleCachedUserTest(TransactionTestCase):
+    def setUp(self):
+        self.api = TestClient(app)
+        self.user = CustomUser.objects.create_user(
+            username="cached-user", password="old-pass-123", token=generate_token()
+        )
+        self.headers = {"Authorization": f"Bearer {self.user.token}"}
+        # Caches the user
+        self.assertEqual(
+            self.api.get("/api/v1/profile", headers=self.headers).status_code, 200
+        )
+        # Changed as by another process, leaving this one's cached copy stale
+        self.new_password = CustomUser.objects.get(pk=self.user.pk).password + "x"
+        CustomUser.objects.filter(pk=self.user.pk).update(
+            password=self.new_password, is_staff=True
+        )
+
+    def assertChangesKept(self):
+        user = CustomUser.objects.get(pk=self.user.pk)
+        self.assertEqual(user.password, self.new_password)
+        self.assertTrue(user.is_staff)
+
+    def test_update_profile_keeps_changes(self):
+        response = self.api.patch(
+            "/api/v1/profile", headers=self.headers, json={"first_name": "Jane"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(CustomUser.objects.get(pk=self.user.pk).first_name, "Jane")
+        self.assertChangesKept()
+
+    def test_new_token_keeps_changes(self):
+        response = self.api.patch("/api/v1/token", headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            CustomUser.objects.get(pk=self.user.pk).token,
+            response.json()["access_token"],
+        )
+        self.assertChangesKept()
+
+
+class IncludedRouteTest(SimpleTestCase):
+    def test_endpoint_wrapped_once(self):
+        router = APIRouter(route_class=TimedRoute)
+        router.get("/ping")(lambda: "pong")
+        included_app = FastAPI()
+        included_app.include_router(router, prefix="/api")
+        with (
+            mock.patch("api.db.close_old_connections") as close_old_connections,
+            mock.patch("api.timing.mark_endpoint_returned") as mark_endpoint_returned,
+        ):
+            response = TestClient(included_app).get("/api/ping")
+        self.assertEqual(response.json(), "pong")
+        self.assertEqual(close_old_connections.call_count, 2)
+        self.assertEqual(mark_endpoint_returned.call_count, 1)
+
+
+class ConditionalTest(SimpleTestCase):
+    etag = '"abc"'
+
+    def test_if_none_match(self):
+        for if_none_match, not_modified in (
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"other", W/"abc"', True),
+            ("*", True),
+            ('"other"', False),
+            ('"abcd"', False),
+        ):
+            with self.subTest(if_none_match=if_none_match):
+                request = make_request("10.0.0.4", {"If-None-Match": if_none_match})
+                self.assertEqual(
+                    is_not_modified(request, Validators(self.etag)), not_modified
+                )
+
+    def test_if_match(self):
+        for if_match in ('"abc"', '"other", "abc"', "*"):
+            with self.subTest(if_match=if_match):
+                request = make_request("10.0.0.4", {"If-Match": if_match})
+                check_if_match(request, Validators(self.etag))
+        # Weak tags never match
+        for if_match in ('W/"abc"', '"other"'):
+            with self.subTest(if_match=if_match):
+                request = make_request("10.0.0.4", {"If-Match": if_match})
+                with self.assertRaises(HTTPException) as raised:
+                    check_if_match(request, Validators(self.etag))
+                self.assertEqual(raised.exception.status_code, 412)
+
+
+class ConditionalProfileTest(TransactionTestCase):
+    measurements = dict(
+        chest=38.0,
+        waist=32.0,
+        hips=36.0,
+        inseam=30.0,
+        neck=15.0,
+        sleeve_length=25.0,
+        shoulder_width=18.0,
+        thigh=22.0,
+        calf=14.0,
+    )
+
+    def setUp(self):
+        self.api = TestClient(app)
+        user = CustomUser.objects.create_user(
+            username="conditional-user",
+            password="secret-pass-123",
+            token=generate_token(),
+        )
+        self.headers = {"Authorization": f"Bearer {user.token}"}
+
+    def request(self, method: str, path: str, headers: dict = {}, **kwargs):
+        return self.api.request(
+            method, f"/api/v1/{path}", headers=self.headers | headers, **kwargs
+        )
+
+    def test_profile(self):
+        etag = self.request("GET", "profile").headers["ETag"]
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            response = self.request("GET", "profile", {"If-None-Match": if_none_match})
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.headers["ETag"], etag)
+        response = self.request(
+            "PATCH", "profile", {"If-Match": etag}, json={"first_name": "Amani"}
+        )
+        self.assertEqual(response.status_code, 200)
+        new_etag = response.headers["ETag"]
+        self.assertNotEqual(new_etag, etag)
+        self.assertEqual(
+            self.request("GET", "profile", {"If-None-Match": etag}).status_code, 200
+        )
+        # Based on the copy before the update
+        response = self.request(
+            "PATCH", "profile", {"If-Match": etag}, json={"first_name": "Imani"}
+        )
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(response.headers["ETag"], new_etag)
+        self.assertEqual(self.request("GET", "profile").json()["first_name"], "Amani")
+
+    def test_measurements(self):
+        response = self.request("GET", "measurements")
+        etag, last_modified = (
+            response.headers["ETag"],
+            response.headers["Last-Modified"],
+        )
+        self.assertEqual(
+            self.request("GET", "measurements", {"If-None-Match": etag}).status_code,
+            304,
+        )
+        self.assertEqual(
+            self.request(
+                "GET", "measurements", {"If-Modified-Since": last_modified}
+            ).status_code,
+            304,
+        )
+        response = self.request(
+            "PATCH", "measurements", {"If-Match": etag}, json=self.measurements
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.request(
+            "PATCH",
+            "measurements",
+            {"If-Match": etag},
+            json=self.measurements | dict(chest=40.0),
+        )
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.request("GET", "measurements").json()["chest"], 38.0)